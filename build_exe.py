@@ -44,6 +44,8 @@ def build_executable():
         "--hidden-import=psutil",
         "--hidden-import=pyusb",
         "--hidden-import=serial",
+        "--hidden-import=numpy",
+        "--hidden-import=PIL",
         "--hidden-import=escpos",
         "--hidden-import=escpos.capabilities",
         str(main_path)
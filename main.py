@@ -1,5 +1,6 @@
 import sys
 import os
+import argparse
 import logging
 from zoneinfo import ZoneInfo
 import time
@@ -11,10 +12,12 @@ import json
 from datetime import datetime, timedelta
 
 from dotenv import load_dotenv
-from PySide6.QtWidgets import QApplication, QMessageBox
-from src.gui.main_window import MainWindow
+# PySide6/GUI 모듈은 GUI 모드에서만 import (헤드리스 모드는 Qt 없이 실행)
 from src.updater import check_and_update
 from src.error_logger import initialize_error_logger, get_error_logger, shutdown_error_logger
+from src.printer.network_printer import shutdown_network_pool
+from src.printer.receipt_archive import shutdown_receipt_archive
+from src.printer.status_monitor import shutdown_status_monitor
 
 def setup_logging():
     # 로깅 설정
@@ -97,7 +100,7 @@ def check_for_updates_async():
         if not should_check_for_updates():
             return
             
-        github_repo = https://api.github.com/repos/qbong1010/posprinter_supabase/releases/latest
+        github_repo = os.getenv('GITHUB_REPO', 'qbong1010/posprinter_supabase')
 
         logging.info("업데이트 확인을 시작합니다...")
         
@@ -126,6 +129,9 @@ def check_for_updates_async():
 def cleanup_on_exit():
     """프로그램 종료 시 정리 작업"""
     logging.info("프로그램 종료 중 - 정리 작업 수행 중...")
+    shutdown_status_monitor()
+    shutdown_network_pool()
+    shutdown_receipt_archive()
     shutdown_error_logger()
     logging.info("정리 작업 완료")
 
@@ -135,7 +141,55 @@ def signal_handler(signum, frame):
     cleanup_on_exit()
     sys.exit(0)
 
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="주문 출력 서버")
+    parser.add_argument(
+        "--headless",
+        action="store_true",
+        help="화면 없이 주문 동기화/자동 출력만 실행 (PySide6 불필요)",
+    )
+    return parser.parse_args(argv)
+
+def start_update_check_thread():
+    """백그라운드에서 업데이트 확인 (24시간마다 또는 최초 실행 시)"""
+    try:
+        update_thread = threading.Thread(target=check_for_updates_async, daemon=True)
+        update_thread.start()
+    except Exception as e:
+        logging.warning(f"업데이트 확인 스레드 시작 실패: {e}")
+
+def run_headless(supabase_config, db_config):
+    """Qt 없이 주문 동기화/자동 출력 서비스를 실행합니다. (Ctrl+C 또는 종료 시그널로 종료)"""
+    from src.order_service import OrderService
+
+    service = OrderService(supabase_config, db_config)
+    start_update_check_thread()
+    logging.info("헤드리스 모드로 시작되었습니다.")
+    service.serve_forever(threading.Event())
+
+def run_gui(supabase_config, db_config):
+    """주문 관리 화면을 띄우고 Qt 이벤트 루프를 실행합니다."""
+    from PySide6.QtWidgets import QApplication
+    from src.gui.main_window import MainWindow
+    from src.gui.stall_watchdog import GuiStallWatchdog
+
+    app = QApplication(sys.argv)
+    window = MainWindow(supabase_config, db_config)  # 설정을 전달
+    window.show()
+    # 화면 멈춤 시 원인 호출 경로를 로그로 남김 (창이 표시된 뒤부터)
+    watchdog = GuiStallWatchdog()
+    watchdog.start()
+    start_update_check_thread()
+    logging.info("프로그램이 성공적으로 시작되었습니다.")
+    
+    # 애플리케이션 실행
+    try:
+        return app.exec()
+    finally:
+        watchdog.stop()
+
 def main():
+    args = parse_args()
     setup_logging()
     load_dotenv()
     
@@ -192,23 +246,12 @@ def main():
     except Exception as e:
         logging.error(f"에러 로깅 시스템 초기화 실패: {e}")
     
-    app = QApplication(sys.argv)
-    
     try:
-        window = MainWindow(supabase_config, db_config)  # 설정을 전달
-        window.show()
-        
-        # 백그라운드에서 업데이트 확인 (24시간마다 또는 최초 실행 시)
-        try:
-            update_thread = threading.Thread(target=check_for_updates_async, daemon=True)
-            update_thread.start()
-        except Exception as e:
-            logging.warning(f"업데이트 확인 스레드 시작 실패: {e}")
-        
-        logging.info("프로그램이 성공적으로 시작되었습니다.")
-        
-        # 애플리케이션 실행
-        exit_code = app.exec()
+        if args.headless:
+            run_headless(supabase_config, db_config)
+            exit_code = 0
+        else:
+            exit_code = run_gui(supabase_config, db_config)
         
         # 정상 종료 시에도 정리 작업 수행
         cleanup_on_exit()
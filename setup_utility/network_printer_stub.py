@@ -0,0 +1,59 @@
+# -*- coding: utf-8 -*-
+"""
+네트워크 프린터(TCP 9100) 대용 테스트 서버
+
+실제 LAN 프린터 없이 네트워크 출력 경로를 확인할 때 사용합니다.
+받은 데이터는 output 폴더에 연결별 .bin 파일로 저장하고,
+DLE EOT 상태 조회에는 '정상' 상태 바이트로 응답합니다.
+
+사용법:
+    python setup_utility/network_printer_stub.py [포트] [포트] ...
+    (포트를 여러 개 지정하면 여러 대의 프린터를 흉내냅니다. 기본값: 9100)
+"""
+import asyncio
+import sys
+from datetime import datetime
+from pathlib import Path
+
+OUTPUT_DIR = Path(__file__).parent / "output"
+STATUS_OK = b'\x12'  # DLE EOT 1/2/4 공통 '정상' 응답
+
+
+async def handle_client(reader, writer, port):
+    peer = writer.get_extra_info("peername")
+    OUTPUT_DIR.mkdir(exist_ok=True)
+    path = OUTPUT_DIR / f"network_{port}_{datetime.now().strftime('%Y%m%d_%H%M%S_%f')}.bin"
+    print(f"[{port}] 연결: {peer}")
+
+    received = 0
+    with open(path, "wb") as f:
+        while True:
+            data = await reader.read(4096)
+            if not data:
+                break
+            # 상태 조회 명령에 응답 (DLE EOT n)
+            for _ in range(data.count(b'\x10\x04')):
+                writer.write(STATUS_OK)
+            await writer.drain()
+            f.write(data)
+            received += len(data)
+
+    writer.close()
+    print(f"[{port}] 연결 종료: {peer}, {received} bytes -> {path.name}")
+
+
+async def main(ports):
+    servers = []
+    for port in ports:
+        server = await asyncio.start_server(lambda r, w, p=port: handle_client(r, w, p), "127.0.0.1", port)
+        servers.append(server)
+        print(f"네트워크 프린터 대용 서버 시작: 127.0.0.1:{port}")
+    await asyncio.gather(*(server.serve_forever() for server in servers))
+
+
+if __name__ == "__main__":
+    ports = [int(arg) for arg in sys.argv[1:]] or [9100]
+    try:
+        asyncio.run(main(ports))
+    except KeyboardInterrupt:
+        print("종료")
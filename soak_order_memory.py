@@ -0,0 +1,153 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+주문 목록 메모리 소크 테스트
+
+임시 SQLite 캐시에 12시간 영업일(점심/저녁 피크 포함)의 주문 유입을 시뮬레이션하면서
+주문 관리 탭과 같은 방식으로 5초마다 목록을 다시 읽고(OrderTableModel.set_orders),
+선택/미리보기처럼 주문 상세를 조회(join_order_detail, 메뉴/옵션 LRU)합니다.
+시뮬레이션 1시간마다 tracemalloc으로 Python 힙 사용량을 기록하고,
+워밍업(상세 LRU가 가득 찰 때까지) 이후 증가량이 허용치를 넘으면 실패로 종료합니다.
+(PySide6 필요, 디스플레이 불필요)
+
+사용법: python soak_order_memory.py [--hours 12] [--max-growth-kb 128]
+"""
+
+import argparse
+import random
+import sqlite3
+import sys
+import tempfile
+import tracemalloc
+from datetime import datetime, timedelta
+from pathlib import Path
+
+# 프로젝트 루트를 Python 경로에 추가
+sys.path.insert(0, str(Path(__file__).parent))
+
+from PySide6.QtCore import QCoreApplication
+
+from src.database.cache import ORDER_ITEMS_CACHE_SIZE, SupabaseCache
+from src.gui.order_table_model import OrderTableModel, order_display_row
+
+TICK_SECONDS = 5            # 주문 관리 탭 갱신 주기
+COMPANIES = 30
+MENUS = 40
+OPTIONS = 15
+
+
+def orders_per_minute(minute_of_day: int) -> float:
+    """시간대별 평균 주문 유입 (11:30~13:00, 17:30~19:00 피크)"""
+    hour = minute_of_day / 60
+    if 11.5 <= hour < 13 or 17.5 <= hour < 19:
+        return 6.0
+    return 0.8
+
+
+def seed_static_tables(conn: sqlite3.Connection) -> None:
+    conn.executemany("INSERT INTO company (company_id, company_name) VALUES (?, ?)",
+                     [(i, f"회사{i}") for i in range(1, COMPANIES + 1)])
+    conn.execute("INSERT INTO menu_category (menu_category_id, category_name) VALUES (1, '식사')")
+    conn.executemany(
+        "INSERT INTO menu_item (menu_item_id, menu_name, menu_price, menu_category_id) VALUES (?, ?, ?, 1)",
+        [(i, f"메뉴{i}", 5000 + i * 100) for i in range(1, MENUS + 1)])
+    conn.executemany("INSERT INTO option_item (option_item_id, option_item_name, option_price) VALUES (?, ?, 500)",
+                     [(i, f"옵션{i}") for i in range(1, OPTIONS + 1)])
+    conn.commit()
+
+
+def insert_order(conn: sqlite3.Connection, order_id: int, created_at: datetime, rng: random.Random) -> None:
+    conn.execute(
+        'INSERT INTO "order" (order_id, company_id, is_dine_in, total_price, created_at, is_printed, print_status) '
+        "VALUES (?, ?, ?, ?, ?, 0, '신규')",
+        (order_id, rng.randint(1, COMPANIES), rng.randint(0, 1), rng.randint(5, 40) * 1000, created_at.isoformat()),
+    )
+    for _ in range(rng.randint(1, 4)):
+        cursor = conn.execute(
+            "INSERT INTO order_item (order_id, menu_item_id, quantity, item_price) VALUES (?, ?, ?, ?)",
+            (order_id, rng.randint(1, MENUS), rng.randint(1, 3), 6000),
+        )
+        if rng.random() < 0.5:
+            conn.execute("INSERT INTO order_item_option (order_item_id, option_item_id) VALUES (?, ?)",
+                         (cursor.lastrowid, rng.randint(1, OPTIONS)))
+
+
+def reload_rows(cache: SupabaseCache, model: OrderTableModel) -> None:
+    """OrderWidget.reload_orders와 같은 방식으로 목록을 다시 읽습니다."""
+    orders = cache.get_recent_orders()
+    items = cache.get_item_summaries([order["order_id"] for order in orders])
+    model.set_orders([order_display_row(dict(order, items=items[order["order_id"]])) for order in orders])
+
+
+def run(hours: int, max_growth_kb: int, seed: int) -> bool:
+    app = QCoreApplication.instance() or QCoreApplication(sys.argv)  # noqa: F841
+    rng = random.Random(seed)
+    with tempfile.TemporaryDirectory() as tmp:
+        cache = SupabaseCache(db_path=Path(tmp) / "soak.db")
+        cache.setup_sqlite()
+        conn = sqlite3.connect(cache.db_path)
+        seed_static_tables(conn)
+        model = OrderTableModel()
+
+        # 지난 영업일 08:00부터 (주문이 모두 동기화 완료 상태가 되도록 과거 날짜 사용)
+        day_start = datetime.now().replace(hour=8, minute=0, second=0, microsecond=0) - timedelta(days=1)
+        ticks_per_hour = 3600 // TICK_SECONDS
+        next_order_id = 1
+        pending_fraction = 0.0
+        samples = []        # (시간, 힙 사용량)
+        warm_hour = None    # 상세 LRU가 처음 가득 찬 시간
+
+        tracemalloc.start()
+        for tick in range(hours * ticks_per_hour):
+            now = day_start + timedelta(seconds=tick * TICK_SECONDS)
+            minute_of_day = now.hour * 60 + now.minute
+
+            # 주문 유입
+            pending_fraction += orders_per_minute(minute_of_day) * TICK_SECONDS / 60
+            while pending_fraction >= 1:
+                pending_fraction -= 1
+                insert_order(conn, next_order_id, now, rng)
+                next_order_id += 1
+            # 자동 출력 (밀린 주문 출력 완료 처리)
+            conn.execute("UPDATE \"order\" SET is_printed = 1, print_status = '출력완료' WHERE is_printed = 0")
+            conn.commit()
+
+            reload_rows(cache, model)
+
+            # 선택/미리보기: 목록의 주문과 오래된 주문의 상세 조회
+            if next_order_id > 1:
+                for _ in range(3):
+                    cache.join_order_detail(rng.randint(1, next_order_id - 1))
+
+            if (tick + 1) % ticks_per_hour == 0:
+                current, _ = tracemalloc.get_traced_memory()
+                hour = (tick + 1) // ticks_per_hour
+                samples.append((hour, current))
+                if warm_hour is None and len(cache._items_lru) >= ORDER_ITEMS_CACHE_SIZE:
+                    warm_hour = hour
+                print(f"{hour:2d}시간: 주문 {next_order_id - 1:5d}건, "
+                      f"목록 {model.rowCount():3d}행, 상세 LRU {len(cache._items_lru):3d}건, "
+                      f"Python 힙 {current / 1024:8.1f} KB")
+        tracemalloc.stop()
+        conn.close()
+
+    baseline_hour, baseline = next(sample for sample in samples if sample[0] == (warm_hour or 1))
+    growth_kb = (max(current for _, current in samples) - baseline) / 1024
+    lru_ok = len(cache._items_lru) <= ORDER_ITEMS_CACHE_SIZE
+    ok = growth_kb <= max_growth_kb and lru_ok
+    print(f"\n{baseline_hour}시간 이후 최대 증가량: {growth_kb:.1f} KB (허용 {max_growth_kb} KB), "
+          f"LRU 상한 {'준수' if lru_ok else '초과'} -> {'통과' if ok else '실패'}")
+    return ok
+
+
+def main():
+    parser = argparse.ArgumentParser(description="주문 목록 메모리 소크 테스트")
+    parser.add_argument("--hours", type=int, default=12, help="시뮬레이션할 영업 시간 (기본 12)")
+    parser.add_argument("--max-growth-kb", type=int, default=128, help="워밍업 이후 허용 증가량 (KB)")
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+    sys.exit(0 if run(args.hours, args.max_growth_kb, args.seed) else 1)
+
+
+if __name__ == "__main__":
+    main()
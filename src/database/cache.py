@@ -1,11 +1,16 @@
 import os
 import sqlite3
+import threading
+import time
+from collections import OrderedDict
 from contextlib import suppress
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from datetime import date, datetime, timedelta
+from typing import Any, Dict, List, NamedTuple, Optional, Sequence, Tuple
 import requests
 import logging
 from src.error_logger import get_error_logger
+from src.metrics import SYNC_ROUND_TRIP, get_metrics, record_supabase_request
 
 SCHEMA_PATH = Path(__file__).parent / "sqlite_schema.sql"
 DB_PATH = Path(os.getenv("CACHE_DB_PATH", "cache.db"))
@@ -25,6 +30,63 @@ VALID_TABLES = {
     "order_item_option",
 }
 
+# 주문 관련 테이블 (주기적으로 동기화)
+ORDER_TABLES = ("order", "order_item", "order_item_option")
+# 로컬에서만 관리하는 컬럼 (테이블: (기본 키, 로컬 컬럼)). 동기화 시 서버 값으로 덮어쓰지 않음
+LOCAL_COLUMNS = {
+    "order": ("order_id", ("print_status", "print_attempts", "last_print_attempt")),
+}
+# 동기화마다 다시 색인할 최근 주문 수 (주문보다 늦게 들어온 메뉴/옵션 반영)
+SEARCH_REINDEX_RECENT = 100
+# 메뉴/옵션 목록을 메모리에 보관할 주문 수 (주문 상세 LRU)
+ORDER_ITEMS_CACHE_SIZE = 256
+# 이보다 최근 주문은 메뉴/옵션이 주문보다 늦게 동기화될 수 있어 LRU에 보관하지 않음
+ORDER_ITEMS_SETTLE_TIME = timedelta(minutes=2)
+
+
+class OrderFilter(NamedTuple):
+    """주문 검색/필터 조건"""
+    query: str = ""                     # 주문번호, 회사명, 메뉴, 옵션 검색어
+    date_from: Optional[date] = None    # 시작일 (포함)
+    date_to: Optional[date] = None      # 종료일 (포함)
+    print_status: Optional[str] = None  # 출력 상태
+
+    @property
+    def is_empty(self) -> bool:
+        return not (self.query.strip() or self.date_from or self.date_to or self.print_status)
+
+
+# trigram 색인은 3글자 단위로 색인하므로 더 짧은 검색어는 그 글자를 포함한 3글자 조각들로 바꾸어 검색합니다.
+TRIGRAM_MIN_CHARS = 3
+MAX_SHORT_TERM_TRIGRAMS = 256  # 조각이 이보다 많으면 (예: 한 글자 검색) 색인 테이블을 LIKE로 검색
+SEARCH_COLUMNS = ("order_id", "company_name", "menu_names", "option_names")
+
+
+def _fts_phrase(text: str) -> str:
+    return '"{}"'.format(text.replace('"', '""'))
+
+
+def _like_pattern(text: str) -> str:
+    return "%{}%".format(text.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_"))
+
+
+def _digit_trigrams(term: str) -> List[str]:
+    """두 자리 숫자 검색어(주문번호 일부)를 포함하는 3글자 조각 (주문번호는 계속 늘어나므로 어휘 대신 직접 생성)"""
+    return [trigram for filler in " 0123456789" for trigram in (filler + term, term + filler)]
+
+
+def _is_settled(created_at: Optional[str]) -> bool:
+    """주문이 들어온 지 ORDER_ITEMS_SETTLE_TIME 이상 지났는지 (판단할 수 없으면 False)"""
+    if not created_at:
+        return False
+    try:
+        created = datetime.fromisoformat(str(created_at).replace('Z', '+00:00'))
+    except ValueError:
+        return False
+    now = datetime.now(created.tzinfo) if created.tzinfo else datetime.now()
+    return now - created >= ORDER_ITEMS_SETTLE_TIME
+
+
 class SupabaseCache:
     """SQLite에 Supabase 테이블을 캐싱합니다."""
 
@@ -36,6 +98,10 @@ class SupabaseCache:
             "apikey": self.api_key or "",
             "Authorization": f"Bearer {self.api_key}" if self.api_key else "",
         }
+        self._search_vocab: Optional[List[str]] = None  # 검색 색인 어휘 (짧은 검색어 확장용)
+        # 주문 ID -> 메뉴/옵션 목록 (주문 상세 조회용 LRU, 주문 항목은 들어온 뒤 바뀌지 않음)
+        self._items_lru: "OrderedDict[int, List[Dict[str, Any]]]" = OrderedDict()
+        self._items_lock = threading.Lock()
 
     # ------------------------------------------------------------------
     def setup_sqlite(self) -> None:
@@ -86,6 +152,10 @@ class SupabaseCache:
                 logger.info("last_print_attempt 컬럼이 추가되었습니다.")
             except sqlite3.Error:
                 pass  # 이미 존재하는 경우
+
+            # 이전 버전의 동기화(전체 삭제 후 재적재)로 비어 버린 출력 상태를 기본값으로 채움
+            conn.execute('UPDATE "order" SET print_status = \'신규\' WHERE print_status IS NULL')
+            conn.commit()
             
         except Exception as e:
             logger.error(f"데이터베이스 초기화 오류: {e}")
@@ -117,6 +187,7 @@ class SupabaseCache:
             )
             resp.raise_for_status()
         except requests.Timeout:
+            record_supabase_request(False)
             logger.error("Timeout while fetching table '%s'", table_name)
             # Supabase에도 에러 로깅
             error_logger = get_error_logger()
@@ -127,87 +198,265 @@ class SupabaseCache:
                     method="GET"
                 )
             return
+        except requests.RequestException:
+            record_supabase_request(False)
+            raise
+        record_supabase_request(True)
         rows = resp.json()
         if not rows:
             return
         conn = sqlite3.connect(self.db_path)
         cursor = conn.cursor()
-        cursor.execute(f'DELETE FROM "{table_name}"')
-        cols = list(rows[0].keys())
-        placeholders = ",".join(["?"] * len(cols))
-        quoted_cols = ",".join([f'"{c}"' for c in cols])
-        insert_sql = f'INSERT INTO "{table_name}" ({quoted_cols}) VALUES ({placeholders})'
-        for row in rows:
-            values = [row.get(col) for col in cols]
-            cursor.execute(insert_sql, values)
+        if table_name in LOCAL_COLUMNS:
+            self._upsert_rows(cursor, table_name, rows)
+        else:
+            cursor.execute(f'DELETE FROM "{table_name}"')
+            cols = list(rows[0].keys())
+            placeholders = ",".join(["?"] * len(cols))
+            quoted_cols = ",".join([f'"{c}"' for c in cols])
+            insert_sql = f'INSERT INTO "{table_name}" ({quoted_cols}) VALUES ({placeholders})'
+            for row in rows:
+                values = [row.get(col) for col in cols]
+                cursor.execute(insert_sql, values)
         conn.commit()
         conn.close()
+        if table_name not in ORDER_TABLES:
+            # 메뉴/옵션/분류 이름이 바뀌었을 수 있음
+            self.clear_order_items_cache()
+
+    def _upsert_rows(self, cursor: sqlite3.Cursor, table_name: str, rows: List[Dict[str, Any]]) -> None:
+        """
+        서버 행을 기본 키 기준으로 갱신/추가하고 서버에 없는 행은 삭제합니다.
+
+        로컬 전용 컬럼(출력 상태 등)은 건드리지 않으므로 기존 행은 값을 유지하고,
+        새 행은 스키마 기본값('신규' 등)으로 채워집니다.
+        """
+        key, local_cols = LOCAL_COLUMNS[table_name]
+        cols = [c for c in rows[0].keys() if c not in local_cols]
+        placeholders = ",".join(["?"] * len(cols))
+        quoted_cols = ",".join([f'"{c}"' for c in cols])
+        updates = ",".join([f'"{c}" = excluded."{c}"' for c in cols if c != key])
+        conflict = f"DO UPDATE SET {updates}" if updates else "DO NOTHING"
+        cursor.executemany(
+            f'INSERT INTO "{table_name}" ({quoted_cols}) VALUES ({placeholders}) ON CONFLICT("{key}") {conflict}',
+            [[row.get(col) for col in cols] for row in rows],
+        )
+
+        cursor.execute("CREATE TEMP TABLE IF NOT EXISTS synced_keys (key PRIMARY KEY)")
+        cursor.execute("DELETE FROM temp.synced_keys")
+        cursor.executemany("INSERT OR IGNORE INTO temp.synced_keys (key) VALUES (?)", [(row.get(key),) for row in rows])
+        cursor.execute(f'DELETE FROM "{table_name}" WHERE "{key}" NOT IN (SELECT key FROM temp.synced_keys)')
+
+    def sync_order_tables(self) -> None:
+        """주문 관련 테이블을 동기화하고 검색 색인을 갱신합니다."""
+        started = time.perf_counter()
+        for table in ORDER_TABLES:
+            self.fetch_and_store_table(table)
+        if self.base_url:
+            get_metrics().observe(SYNC_ROUND_TRIP, time.perf_counter() - started)
+        self.update_search_index()
+
+    def count_unprinted_orders(self) -> int:
+        """아직 출력되지 않은 주문 수 (출력 대기열 길이)"""
+        conn = sqlite3.connect(self.db_path)
+        try:
+            return conn.execute('SELECT COUNT(*) FROM "order" WHERE is_printed = 0').fetchone()[0]
+        finally:
+            conn.close()
+
+    def update_search_index(self, full: bool = False) -> None:
+        """
+        주문 검색(FTS5) 색인을 갱신합니다.
+
+        사라진 주문은 색인에서 지우고, 색인에 없는 주문과 최근 주문(메뉴가 늦게 동기화될 수 있음)만
+        다시 색인합니다. 값은 앞뒤에 공백을 붙여 저장하여 두 글자 이하 이름도 3글자 조각으로 색인되게 합니다. full이면 전체를 다시 만듭니다. (회사/메뉴 이름 변경 시)
+        """
+        conn = sqlite3.connect(self.db_path)
+        try:
+            if full:
+                conn.execute("DELETE FROM order_search")
+                self._search_vocab = None
+            else:
+                indexed = conn.execute("SELECT COUNT(*) FROM order_search").fetchone()[0]
+                if not indexed:
+                    self._search_vocab = None  # 처음 색인하는 경우
+                if indexed > conn.execute('SELECT COUNT(*) FROM "order"').fetchone()[0]:
+                    conn.execute('DELETE FROM order_search WHERE rowid NOT IN (SELECT order_id FROM "order")')
+                conn.execute(
+                    'DELETE FROM order_search WHERE rowid > (SELECT MAX(order_id) FROM "order") - ?',
+                    (SEARCH_REINDEX_RECENT,)
+                )
+            cursor = conn.execute("""
+                INSERT INTO order_search (rowid, order_id, company_name, menu_names, option_names)
+                SELECT o.order_id, ' ' || o.order_id || ' ', ' ' || IFNULL(c.company_name, '') || ' ',
+                       ' ' || IFNULL((SELECT group_concat(mi.menu_name, ' ')
+                        FROM order_item oi JOIN menu_item mi ON mi.menu_item_id = oi.menu_item_id
+                        WHERE oi.order_id = o.order_id), '') || ' ',
+                       ' ' || IFNULL((SELECT group_concat(opt.option_item_name, ' ')
+                        FROM order_item oi
+                        JOIN order_item_option oio ON oio.order_item_id = oi.order_item_id
+                        JOIN option_item opt ON opt.option_item_id = oio.option_item_id
+                        WHERE oi.order_id = o.order_id), '') || ' '
+                FROM "order" o
+                LEFT JOIN company c ON c.company_id = o.company_id
+                WHERE o.order_id > (SELECT IFNULL(MAX(rowid), 0) FROM order_search)
+                   OR (? AND o.order_id NOT IN (SELECT rowid FROM order_search))
+            """, (full,))
+            if cursor.rowcount:
+                # 새로 색인한 주문에서 처음 나온 이름 조각이 있을 수 있으므로 짧은 검색어 어휘를 다시 읽게 함
+                self._search_vocab = None
+            conn.commit()
+        except sqlite3.Error as e:
+            # FTS5를 지원하지 않는 SQLite 등
+            logger.error(f"주문 검색 색인 갱신 실패: {e}")
+        finally:
+            conn.close()
+
+    def _short_term_trigrams(self, conn: sqlite3.Connection, term: str) -> Optional[List[str]]:
+        """짧은 검색어를 포함하는 색인 어휘(3글자 조각) 목록 (너무 많으면 None)"""
+        if term.isdigit():
+            return _digit_trigrams(term) if len(term) == 2 else None
+        # 어휘는 색인에 주문이 추가될 때만 달라지므로 읽어 둔 것을 재사용 (색인 갱신 시 무효화)
+        if self._search_vocab is None:
+            self._search_vocab = [row[0] for row in conn.execute("SELECT term FROM order_search_vocab")]
+        needle = term.lower()
+        trigrams = [trigram for trigram in self._search_vocab if needle in trigram]
+        return trigrams if len(trigrams) <= MAX_SHORT_TERM_TRIGRAMS else None
+
+    def _filter_sql(self, conn: sqlite3.Connection,
+                    filters: Optional[OrderFilter]) -> Tuple[List[str], List[Any]]:
+        """필터 조건을 (WHERE 조건 목록, 파라미터)로 변환합니다. (주문 테이블 별칭 o)"""
+        if filters is None:
+            return [], []
+        conditions: List[str] = []
+        params: List[Any] = []
+
+        # 검색어: 단어별 부분 문자열 검색, 모든 단어 일치
+        # 예: "라떼" -> ("페라떼" OR "라떼 " OR ...) (색인 값은 앞뒤 공백을 붙여 저장하므로 항상 조각이 있음)
+        clauses: List[str] = []
+        search: List[str] = []
+        for term in filters.query.split():
+            trigrams = [term] if len(term) >= TRIGRAM_MIN_CHARS else self._short_term_trigrams(conn, term)
+            if trigrams is None:
+                search.append("(" + " OR ".join(f"{column} LIKE ? ESCAPE '\\'" for column in SEARCH_COLUMNS) + ")")
+                params.extend([_like_pattern(term)] * len(SEARCH_COLUMNS))
+            else:
+                # 일치하는 조각이 없으면 찾을 수 없는 구문 그대로 검색 (결과 없음)
+                clauses.append("(" + " OR ".join(_fts_phrase(trigram) for trigram in trigrams or [term]) + ")")
+        if clauses:
+            search.insert(0, "order_search MATCH ?")
+            params.insert(0, " AND ".join(clauses))
+        if search:
+            # 조인 대신 IN 부분 조회: 날짜/상태 색인으로 좁힌 주문에 대해서만 일치 여부 확인
+            conditions.append(f"o.order_id IN (SELECT rowid FROM order_search WHERE {' AND '.join(search)})")
+
+        if filters.date_from:
+            conditions.append("o.created_at >= ?")
+            params.append(filters.date_from.isoformat())
+        if filters.date_to:
+            conditions.append("o.created_at < ?")
+            params.append((filters.date_to + timedelta(days=1)).isoformat())
+        if filters.print_status:
+            conditions.append("o.print_status = ?")
+            params.append(filters.print_status)
+        return conditions, params
 
     # ------------------------------------------------------------------
     def join_order_detail(self, order_id: int) -> Dict[str, Any]:
-        """주문과 관련 테이블을 조인하여 상세 정보를 반환합니다."""
+        """주문과 관련 테이블을 조인하여 상세 정보를 반환합니다.
+
+        주문 행(출력 상태 등)은 매번 읽고, 바뀌지 않는 메뉴/옵션 목록은 LRU에서 꺼냅니다.
+        """
         conn = sqlite3.connect(self.db_path)
         conn.row_factory = sqlite3.Row
-        cursor = conn.cursor()
-        query = """
-        SELECT o.order_id, o.is_dine_in, o.total_price, o.created_at, o.signature_data,
-               o.print_status, o.print_attempts, o.last_print_attempt, o.is_printed,
-               c.company_name, c.required_signature,
-               oi.order_item_id, oi.quantity, oi.item_price,
-               mi.menu_name,
+        try:
+            row = conn.execute("""
+            SELECT o.order_id, o.is_dine_in, o.total_price, o.created_at, o.signature_data,
+                   o.print_status, o.print_attempts, o.last_print_attempt, o.is_printed,
+                   c.company_name, c.required_signature
+            FROM "order" o
+            JOIN company c ON c.company_id = o.company_id
+            WHERE o.order_id = ?
+            """, (order_id,)).fetchone()
+            if row is None:
+                return {}
+            items = self._order_items(conn, order_id, row["created_at"])
+        finally:
+            conn.close()
+        return {
+            "order_id": row["order_id"],
+            "company_name": row["company_name"],
+            "required_signature": bool(row["required_signature"]),
+            "is_dine_in": bool(row["is_dine_in"]),
+            "total_price": row["total_price"],
+            "created_at": row["created_at"],
+            "signature_data": row["signature_data"],
+            "is_printed": bool(row["is_printed"]),
+            "print_status": row["print_status"],
+            "print_attempts": row["print_attempts"] or 0,
+            "last_print_attempt": row["last_print_attempt"],
+            # 호출자가 고쳐도 LRU 원본은 그대로 두도록 복사
+            "items": [dict(item, options=list(item["options"])) for item in items],
+        }
+
+    def _order_items(self, conn: sqlite3.Connection, order_id: int, created_at: Optional[str]) -> List[Dict[str, Any]]:
+        """주문의 메뉴/옵션 목록 (최근 ORDER_ITEMS_CACHE_SIZE개 주문은 LRU에 보관)"""
+        with self._items_lock:
+            items = self._items_lru.get(order_id)
+            if items is not None:
+                self._items_lru.move_to_end(order_id)
+                return items
+
+        item_map: Dict[int, Dict[str, Any]] = {}
+        for row in conn.execute("""
+        SELECT oi.order_item_id, oi.quantity, oi.item_price,
+               mi.menu_name, mc.category_name,
                opt.option_item_name, opt.option_price
-        FROM "order" o
-        JOIN company c ON c.company_id = o.company_id
-        LEFT JOIN order_item oi ON oi.order_id = o.order_id
+        FROM order_item oi
         LEFT JOIN menu_item mi ON mi.menu_item_id = oi.menu_item_id
+        LEFT JOIN menu_category mc ON mc.menu_category_id = mi.menu_category_id
         LEFT JOIN order_item_option oio ON oio.order_item_id = oi.order_item_id
         LEFT JOIN option_item opt ON opt.option_item_id = oio.option_item_id
-        WHERE o.order_id = ?
+        WHERE oi.order_id = ?
         ORDER BY oi.order_item_id
-        """
-        rows = cursor.execute(query, (order_id,)).fetchall()
-        conn.close()
-        if not rows:
-            return {}
-        order: Dict[str, Any] = {
-            "order_id": rows[0]["order_id"],
-            "company_name": rows[0]["company_name"],
-            "required_signature": bool(rows[0]["required_signature"]),
-            "is_dine_in": bool(rows[0]["is_dine_in"]),
-            "total_price": rows[0]["total_price"],
-            "created_at": rows[0]["created_at"],
-            "signature_data": rows[0]["signature_data"],
-            "is_printed": bool(rows[0]["is_printed"]),
-            "print_status": rows[0]["print_status"],
-            "print_attempts": rows[0]["print_attempts"] or 0,
-            "last_print_attempt": rows[0]["last_print_attempt"],
-            "items": [],
-        }
-        item_map: Dict[int, Dict[str, Any]] = {}
-        for row in rows:
+        """, (order_id,)):
             item_id = row["order_item_id"]
             if item_id not in item_map:
                 item_map[item_id] = {
                     "name": row["menu_name"],
                     "quantity": row["quantity"],
                     "price": row["item_price"],
+                    "category": row["category_name"],
                     "options": [],
                 }
             if row["option_item_name"]:
                 item_map[item_id]["options"].append(
                     {"name": row["option_item_name"], "price": row["option_price"]}
                 )
-        order["items"] = list(item_map.values())
-        return order
+        items = list(item_map.values())
+
+        # 막 들어온 주문은 메뉴/옵션이 아직 동기화 중일 수 있으므로 보관하지 않음
+        if items and _is_settled(created_at):
+            with self._items_lock:
+                self._items_lru[order_id] = items
+                while len(self._items_lru) > ORDER_ITEMS_CACHE_SIZE:
+                    self._items_lru.popitem(last=False)
+        return items
+
+    def clear_order_items_cache(self) -> None:
+        """메뉴/옵션 LRU를 비웁니다. (메뉴/옵션 이름이 바뀌었을 수 있을 때)"""
+        with self._items_lock:
+            self._items_lru.clear()
 
     # ------------------------------------------------------------------
     def get_recent_orders(self, limit: int = 50) -> List[Dict[str, Any]]:
+        """최근 주문 요약 (주문 목록 표시용, 서명 이미지 등 상세 제외)"""
         conn = sqlite3.connect(self.db_path)
         conn.row_factory = sqlite3.Row
         cursor = conn.cursor()
         query = """
-        SELECT o.order_id, o.company_id, o.is_dine_in, o.total_price, o.created_at, o.signature_data,
-               c.company_name, c.required_signature
+        SELECT o.order_id, o.company_id, o.is_dine_in, o.total_price, o.created_at,
+               o.print_status, o.is_printed, c.company_name, c.required_signature
         FROM "order" o
         JOIN company c ON c.company_id = o.company_id
         ORDER BY o.created_at DESC
@@ -217,6 +466,89 @@ class SupabaseCache:
         conn.close()
         return [dict(row) for row in rows]
 
+    # ------------------------------------------------------------------
+    # 주문 내역 (키셋 페이지 조회)
+    def count_orders(self, filters: Optional[OrderFilter] = None) -> int:
+        """캐시된 주문 수를 반환합니다. (필터 조건이 있으면 일치하는 주문 수)"""
+        conn = sqlite3.connect(self.db_path)
+        try:
+            conditions, params = self._filter_sql(conn, filters)
+            where = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+            return conn.execute(f'SELECT COUNT(*) FROM "order" o {where}', params).fetchone()[0]
+        finally:
+            conn.close()
+
+    def get_orders_page(self, after: Optional[Tuple[str, int]] = None, limit: int = 50,
+                        filters: Optional[OrderFilter] = None) -> List[Dict[str, Any]]:
+        """
+        최근 주문부터 한 페이지를 반환합니다. (created_at, order_id 내림차순)
+
+        Args:
+            after: 이전 페이지 마지막 주문의 (created_at, order_id) 커서 (없으면 첫 페이지)
+            limit: 페이지 크기
+            filters: 검색/필터 조건
+        """
+        conn = sqlite3.connect(self.db_path)
+        conn.row_factory = sqlite3.Row
+        try:
+            conditions, params = self._filter_sql(conn, filters)
+            if after is not None:
+                conditions.append("(o.created_at, o.order_id) < (?, ?)")
+                params.extend(after)
+            where = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+            query = f"""
+            SELECT o.order_id, o.is_dine_in, o.total_price, o.created_at, o.is_printed, o.print_status,
+                   c.company_name
+            FROM "order" o
+            JOIN company c ON c.company_id = o.company_id
+            {where}
+            ORDER BY o.created_at DESC, o.order_id DESC
+            LIMIT ?
+            """
+            return [dict(row) for row in conn.execute(query, (*params, limit)).fetchall()]
+        finally:
+            conn.close()
+
+    def get_order_cursor(self, after: Optional[Tuple[str, int]], skip: int,
+                         filters: Optional[OrderFilter] = None) -> Optional[Tuple[str, int]]:
+        """커서 다음 skip번째 주문의 (created_at, order_id) 커서를 반환합니다. (색인만 읽어 페이지 이동)"""
+        conn = sqlite3.connect(self.db_path)
+        try:
+            conditions, params = self._filter_sql(conn, filters)
+            if after is not None:
+                conditions.append("(o.created_at, o.order_id) < (?, ?)")
+                params.extend(after)
+            where = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+            query = f"""
+            SELECT o.created_at, o.order_id FROM "order" o {where}
+            ORDER BY o.created_at DESC, o.order_id DESC LIMIT 1 OFFSET ?
+            """
+            row = conn.execute(query, (*params, skip - 1)).fetchone()
+            return tuple(row) if row else None
+        finally:
+            conn.close()
+
+    def get_item_summaries(self, order_ids: Sequence[int]) -> Dict[int, List[Dict[str, Any]]]:
+        """여러 주문의 메뉴 이름/수량 목록을 한 번에 조회합니다. (주문 내역 화면 표시용)"""
+        summaries: Dict[int, List[Dict[str, Any]]] = {order_id: [] for order_id in order_ids}
+        if not order_ids:
+            return summaries
+        conn = sqlite3.connect(self.db_path)
+        placeholders = ",".join("?" * len(order_ids))
+        query = f"""
+        SELECT oi.order_id, mi.menu_name, oi.quantity
+        FROM order_item oi
+        LEFT JOIN menu_item mi ON mi.menu_item_id = oi.menu_item_id
+        WHERE oi.order_id IN ({placeholders})
+        ORDER BY oi.order_item_id
+        """
+        try:
+            for order_id, name, quantity in conn.execute(query, list(order_ids)):
+                summaries.setdefault(order_id, []).append({"name": name, "quantity": quantity})
+            return summaries
+        finally:
+            conn.close()
+
     def get_table_data(self, table_name: str) -> List[Dict[str, Any]]:
         """테이블의 모든 데이터를 가져옵니다."""
         if table_name not in VALID_TABLES:
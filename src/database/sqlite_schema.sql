@@ -89,4 +89,27 @@ CREATE TABLE IF NOT EXISTS order_item_option (
 CREATE TABLE IF NOT EXISTS cache_meta (
   key TEXT PRIMARY KEY,
   value TEXT
-); 
\ No newline at end of file
+); 
+
+-- 주문 내역 키셋 페이지 조회 (created_at, order_id 커서)
+CREATE INDEX IF NOT EXISTS idx_order_created_at ON "order" (created_at, order_id);
+
+CREATE INDEX IF NOT EXISTS idx_order_item_order_id ON order_item (order_id);
+
+-- 주문 상세 조회 시 메뉴별 옵션 조인
+CREATE INDEX IF NOT EXISTS idx_order_item_option_item ON order_item_option (order_item_id);
+
+CREATE INDEX IF NOT EXISTS idx_order_print_status ON "order" (print_status, created_at);
+
+-- 주문 검색 색인 (rowid = order_id, 동기화 후 SupabaseCache.update_search_index로 갱신)
+-- trigram: 띄어쓰기 없는 한글 메뉴 이름도 부분 문자열로 검색 ("라떼" -> "바닐라라떼")
+CREATE VIRTUAL TABLE IF NOT EXISTS order_search USING fts5(
+  order_id,
+  company_name,
+  menu_names,
+  option_names,
+  tokenize='trigram'
+);
+
+-- 검색 색인 어휘 (두 글자 이하 검색어를 3글자 조각으로 바꿀 때 사용)
+CREATE VIRTUAL TABLE IF NOT EXISTS order_search_vocab USING fts5vocab(order_search, 'row');
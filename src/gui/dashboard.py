@@ -0,0 +1,186 @@
+# -*- coding: utf-8 -*-
+"""운영 현황 탭.
+
+프로세스 내 지표 저장소(src.metrics)와 프린터 상태 모니터, 주방 전송 스케줄러를 읽어
+분당 출력 주문 수, 동기화 왕복 시간, 주문 접수 -> 출력 지연 백분위수,
+프린터별 대기열, 오류율, Supabase 연결 상태를 보여 줍니다.
+탭이 보이는 동안에만 1초마다 갱신합니다.
+"""
+import time
+from typing import Dict, Optional
+
+from PySide6.QtCore import QTimer
+from PySide6.QtWidgets import (
+    QAbstractItemView,
+    QGridLayout,
+    QGroupBox,
+    QHeaderView,
+    QLabel,
+    QTableWidget,
+    QTableWidgetItem,
+    QVBoxLayout,
+    QWidget,
+)
+
+from src.metrics import (
+    GUI_LOOP_LATENCY,
+    GUI_STALLS,
+    ORDERS_PRINTED,
+    PRINT_FAILURES,
+    PRINT_LATENCY,
+    SUPABASE_CONNECTED,
+    SUPABASE_ERRORS,
+    SUPABASE_REQUESTS,
+    SYNC_ROUND_TRIP,
+    UNPRINTED_ORDERS,
+    get_metrics,
+)
+from src.order_service import printer_label
+from src.printer.manager import PrinterManager
+from src.printer.status_monitor import get_status_monitor
+
+REFRESH_INTERVAL_MS = 1000
+SHORT_WINDOW = 60.0        # 최근 1분
+LONG_WINDOW = 15 * 60.0    # 최근 15분 (백분위수, 오류율)
+PRINTER_COLUMNS = ("프린터", "상태", "대기", "남은 전송 시간")
+
+_WARN_STYLE = "color: #C62828; font-weight: bold;"
+_OK_STYLE = "color: #2E7D32; font-weight: bold;"
+
+
+def _format_seconds(seconds: float) -> str:
+    if seconds < 1:
+        return f"{seconds * 1000:.0f}ms"
+    if seconds < 120:
+        return f"{seconds:.1f}초"
+    return f"{seconds / 60:.1f}분"
+
+
+def _format_percentiles(values: Optional[Dict[float, float]]) -> str:
+    if values is None:
+        return "-"
+    return " / ".join(f"p{pct:g} {_format_seconds(value)}" for pct, value in values.items())
+
+
+def _error_rate(errors: float, total: float) -> str:
+    return f"{errors / total * 100:.1f}% ({errors:g}/{total:g})" if total else "-"
+
+
+class DashboardWidget(QWidget):
+    """운영 현황 탭"""
+
+    def __init__(self, printer_manager: PrinterManager) -> None:
+        super().__init__()
+        self.printer_manager = printer_manager
+        layout = QVBoxLayout(self)
+
+        # 지표 카드
+        self._values: Dict[str, QLabel] = {}
+        grid = QGridLayout()
+        cards = (
+            ("throughput", "분당 출력 주문 (1분 / 15분)"),
+            ("latency", "접수 -> 출력 지연 (15분)"),
+            ("sync", "동기화 왕복 시간 (15분)"),
+            ("backlog", "출력 대기 주문"),
+            ("print_errors", "출력 실패율 (15분)"),
+            ("supabase_errors", "Supabase 오류율 (15분)"),
+            ("supabase", "Supabase 연결"),
+            ("gui", "화면 응답 (15분)"),
+        )
+        for index, (key, title) in enumerate(cards):
+            box = QGroupBox(title)
+            box_layout = QVBoxLayout(box)
+            value = QLabel("-")
+            value.setStyleSheet("font-size: 16px;")
+            box_layout.addWidget(value)
+            self._values[key] = value
+            grid.addWidget(box, index // 3, index % 3)
+        layout.addLayout(grid)
+
+        # 프린터별 상태 / 대기열
+        self.printer_table = QTableWidget(0, len(PRINTER_COLUMNS))
+        self.printer_table.setHorizontalHeaderLabels(PRINTER_COLUMNS)
+        self.printer_table.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
+        self.printer_table.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        self.printer_table.verticalHeader().setVisible(False)
+        layout.addWidget(self.printer_table)
+
+        self.timer = QTimer(self)
+        self.timer.setInterval(REFRESH_INTERVAL_MS)
+        self.timer.timeout.connect(self.refresh)
+
+    def showEvent(self, event) -> None:
+        self.refresh()
+        self.timer.start()
+        super().showEvent(event)
+
+    def hideEvent(self, event) -> None:
+        self.timer.stop()
+        super().hideEvent(event)
+
+    # ------------------------------------------------------------------
+    def refresh(self) -> None:
+        metrics = get_metrics()
+        self._values["throughput"].setText(
+            f"{metrics.rate_per_minute(ORDERS_PRINTED, SHORT_WINDOW):.1f} / "
+            f"{metrics.rate_per_minute(ORDERS_PRINTED, LONG_WINDOW):.1f}"
+        )
+        self._values["latency"].setText(_format_percentiles(metrics.percentiles(PRINT_LATENCY, LONG_WINDOW)))
+        self._values["sync"].setText(
+            _format_percentiles(metrics.percentiles(SYNC_ROUND_TRIP, LONG_WINDOW, (50, 95)))
+        )
+
+        backlog = metrics.gauge(UNPRINTED_ORDERS)
+        self._values["backlog"].setText(f"{backlog[1]:g}건" if backlog else "-")
+
+        printed = metrics.total(ORDERS_PRINTED, LONG_WINDOW)
+        failed = metrics.total(PRINT_FAILURES, LONG_WINDOW)
+        self._set_value("print_errors", _error_rate(failed, printed + failed), failed > 0)
+        errors = metrics.total(SUPABASE_ERRORS, LONG_WINDOW)
+        self._set_value("supabase_errors",
+                        _error_rate(errors, metrics.total(SUPABASE_REQUESTS, LONG_WINDOW)), errors > 0)
+
+        connected = metrics.gauge(SUPABASE_CONNECTED)
+        if connected is None:
+            self._set_value("supabase", "확인 전", False)
+        else:
+            ago = _format_seconds(time.time() - connected[0])
+            self._set_value("supabase", f"{'정상' if connected[1] else '연결 실패'} ({ago} 전)", not connected[1],
+                            ok=bool(connected[1]))
+
+        loop = metrics.percentiles(GUI_LOOP_LATENCY, LONG_WINDOW, (99,))
+        stalls = metrics.values(GUI_STALLS, LONG_WINDOW)
+        gui_text = f"지연 p99 {_format_seconds(loop[99])}" if loop else "-"
+        if stalls:
+            gui_text += f", 멈춤 {len(stalls)}회 (최장 {_format_seconds(max(stalls))})"
+        self._set_value("gui", gui_text, bool(stalls))
+
+        self._refresh_printers(backlog[1] if backlog else 0)
+
+    def _set_value(self, key: str, text: str, warn: bool, ok: bool = False) -> None:
+        label = self._values[key]
+        label.setText(text)
+        label.setStyleSheet("font-size: 16px; " + (_WARN_STYLE if warn else _OK_STYLE if ok else ""))
+
+    def _refresh_printers(self, backlog: float) -> None:
+        statuses = get_status_monitor().statuses()
+        depths = self.printer_manager.kitchen_queue_depths()
+        names = list(statuses) + [name for name in depths if name not in statuses]
+
+        self.printer_table.setRowCount(len(names))
+        for row, name in enumerate(names):
+            status = statuses.get(name)
+            if name in depths:
+                pending, drain = depths[name]
+                queue_text, drain_text = f"{pending}건", _format_seconds(drain) if drain else "-"
+            elif name == "customer":
+                queue_text, drain_text = f"{backlog:g}건", "-"  # 손님용은 미출력 주문 수
+            else:
+                queue_text, drain_text = "-", "-"
+            cells = (printer_label(name), status.describe() if status else "확인 전", queue_text, drain_text)
+            for column, text in enumerate(cells):
+                item = self.printer_table.item(row, column)
+                if item is None:
+                    self.printer_table.setItem(row, column, QTableWidgetItem(text))
+                elif item.text() != text:
+                    item.setText(text)
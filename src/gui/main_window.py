@@ -1,14 +1,26 @@
-from PySide6.QtWidgets import QMainWindow, QWidget, QVBoxLayout, QTabWidget, QTextEdit, QPushButton, QHBoxLayout, QMessageBox
+from PySide6.QtWidgets import QMainWindow, QWidget, QVBoxLayout, QTabWidget, QPushButton, QHBoxLayout, QMessageBox
 from PySide6.QtCore import Qt, QThread, Signal
-from PySide6.QtGui import QFont
 from src.gui.order_widget import OrderWidget
-from src.gui.printer_widget import PrinterWidget
-from src.supabase_client import SupabaseClient
-from src.gui.receipt_preview import read_receipt_file
 from src.updater import check_and_update, get_current_version
 import os
 import logging
 
+class LazyTab(QWidget):
+    """처음 표시될 때 실제 위젯을 만드는 탭 자리 표시자"""
+
+    def __init__(self, factory):
+        super().__init__()
+        self._factory = factory
+        self.widget = None
+        layout = QVBoxLayout(self)
+        layout.setContentsMargins(0, 0, 0, 0)
+
+    def showEvent(self, event):
+        if self.widget is None:
+            self.widget = self._factory()
+            self.layout().addWidget(self.widget)
+        super().showEvent(event)
+
 class UpdateCheckThread(QThread):
     """업데이트 확인을 위한 스레드"""
     update_available = Signal(dict)  # 업데이트 정보
@@ -33,33 +45,6 @@ class UpdateCheckThread(QThread):
         except Exception as e:
             self.error.emit(str(e))
 
-class ReceiptPreviewWidget(QWidget):
-    def __init__(self):
-        super().__init__()
-        layout = QVBoxLayout(self)
-        
-        # 미리보기 텍스트 영역
-        self.preview_text = QTextEdit()
-        self.preview_text.setReadOnly(True)
-        self.preview_text.setFont(QFont("Courier New", 10))  # 고정폭 폰트 사용
-        
-        # 새로고침 버튼
-        refresh_btn = QPushButton("새로고침")
-        refresh_btn.clicked.connect(self.refresh_preview)
-        
-        layout.addWidget(refresh_btn)
-        layout.addWidget(self.preview_text)
-        
-        # 초기 미리보기 로드
-        self.refresh_preview()
-        
-    def refresh_preview(self):
-        preview_text = read_receipt_file()
-        if preview_text:
-            self.preview_text.setText(preview_text)
-        else:
-            self.preview_text.setText("영수증 미리보기를 불러올 수 없습니다.")
-
 class MainWindow(QMainWindow):
     def __init__(self, supabase_config, db_config):
         super().__init__()
@@ -98,23 +83,25 @@ class MainWindow(QMainWindow):
         # 탭 위젯 생성
         tab_widget = QTabWidget()
         
-        # 주문 관리 탭
+        # 주문 관리 탭 (캐시된 주문을 바로 표시, 서버 동기화는 창이 표시된 뒤 시작)
         self.order_widget = OrderWidget(supabase_config, db_config)
         tab_widget.addTab(self.order_widget, "주문 관리")
         
-        # 프린터 설정 탭
-        self.printer_widget = PrinterWidget()
-        tab_widget.addTab(self.printer_widget, "프린터 설정")
+        # 나머지 탭은 처음 열 때 생성 (프린터 목록 조회, 파일 읽기 등을 시작 시점에서 제외)
+        self.order_history_tab = LazyTab(self._create_order_history)
+        tab_widget.addTab(self.order_history_tab, "주문 내역")
+        self.printer_tab = LazyTab(self._create_printer_widget)
+        tab_widget.addTab(self.printer_tab, "프린터 설정")
+        self.receipt_preview_tab = LazyTab(self._create_receipt_preview)
+        tab_widget.addTab(self.receipt_preview_tab, "영수증 미리보기")
+        self.dashboard_tab = LazyTab(self._create_dashboard)
+        tab_widget.addTab(self.dashboard_tab, "운영 현황")
         
-        # 영수증 미리보기 탭
-        self.receipt_preview = ReceiptPreviewWidget()
-        tab_widget.addTab(self.receipt_preview, "영수증 미리보기")
+        # 주문 목록에서 선택한 주문을 바로 미리보기 (미리보기 탭이 만들어진 뒤부터)
+        self.order_widget.order_table.selectionModel().currentRowChanged.connect(self._on_order_selected)
         
         layout.addWidget(tab_widget)
 
-        # SupabaseClient 연결
-        self.supabase_client = SupabaseClient()
-        
         # 업데이트 확인 스레드
         self.update_thread = None
         
@@ -167,6 +154,38 @@ class MainWindow(QMainWindow):
             }
         """)
     
+    def _on_order_selected(self, current, previous):
+        preview = self.receipt_preview_tab.widget
+        if preview is not None:
+            preview.show_order(self.order_widget.order_model.order_id_at(current.row()))
+    
+    def _create_order_history(self):
+        # 주문 내역 탭 (전체 캐시 주문, 가상 스크롤)
+        from src.gui.order_history import OrderHistoryWidget
+        history = OrderHistoryWidget(self.order_widget.cache)
+        # 동기화/출력으로 주문이 바뀌면 다음에 탭을 열 때 다시 읽도록 표시
+        self.order_widget.ui_updates.batch_ready.connect(history.mark_dirty)
+        return history
+    
+    def _create_printer_widget(self):
+        # 프린터 설정 탭
+        from src.gui.printer_widget import PrinterWidget
+        return PrinterWidget()
+    
+    def _create_receipt_preview(self):
+        # 영수증 미리보기 탭 (현재 선택된 주문부터 표시)
+        from src.gui.receipt_preview import ReceiptPreviewWidget
+        preview = ReceiptPreviewWidget(self.order_widget.printer_manager, self.order_widget.cache)
+        current = self.order_widget.order_table.currentIndex()
+        if current.isValid():
+            preview.show_order(self.order_widget.order_model.order_id_at(current.row()))
+        return preview
+    
+    def _create_dashboard(self):
+        # 운영 현황 탭 (처리량, 지연, 대기열, 오류율)
+        from src.gui.dashboard import DashboardWidget
+        return DashboardWidget(self.order_widget.printer_manager)
+    
     def check_for_updates(self):
         """업데이트 확인 버튼 클릭 시 호출"""
         try:
@@ -0,0 +1,299 @@
+# -*- coding: utf-8 -*-
+"""주문 내역 탭 (전체 캐시 주문을 가상 스크롤로 조회).
+
+행 수는 COUNT(*)로 정하고, 화면에 보이는 행이 속한 페이지만 키셋 조회
+(created_at, order_id 커서)로 읽습니다. 읽은 페이지는 최근 사용 순으로 몇 개만 유지하므로
+한 달치 주문을 스크롤해도 메모리 사용량이 일정합니다.
+메뉴 목록은 화면에 그려지는 행에 대해서만 묶음 단위로 조회합니다.
+검색어(회사명/메뉴/옵션/주문번호, FTS5 색인), 날짜 범위, 출력 상태로 걸러 볼 수 있습니다.
+"""
+import logging
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple
+
+from PySide6.QtCore import QAbstractTableModel, QDate, QModelIndex, Qt
+from PySide6.QtWidgets import (
+    QAbstractItemView,
+    QCheckBox,
+    QComboBox,
+    QDateEdit,
+    QHBoxLayout,
+    QHeaderView,
+    QLabel,
+    QLineEdit,
+    QPushButton,
+    QTableView,
+    QVBoxLayout,
+    QWidget,
+)
+
+from src.database.cache import OrderFilter, SupabaseCache
+from src.gui.order_table_model import ORDER_COLUMNS, order_display_row
+
+logger = logging.getLogger(__name__)
+
+PAGE_SIZE = 100        # 키셋 조회 한 번에 읽는 주문 수
+MAX_CACHED_PAGES = 6   # 메모리에 유지할 페이지 수
+ITEM_BLOCK = 25        # 메뉴 목록을 한 번에 조회하는 행 수 (대략 한 화면)
+MENU_COLUMN = ORDER_COLUMNS.index("메뉴")
+PRINT_STATUS_FILTERS = ("전체", "신규", "출력중", "출력완료", "출력실패")
+
+
+class _Page:
+    """주문 내역 한 페이지 (주문 요약 + 조회된 메뉴 목록)"""
+    __slots__ = ("orders", "items")
+
+    def __init__(self, orders: List[Dict[str, Any]]) -> None:
+        self.orders = orders
+        self.items: Dict[int, List[Dict[str, Any]]] = {}
+
+
+class OrderHistoryModel(QAbstractTableModel):
+    """키셋 페이지 단위로 주문을 읽는 가상 스크롤 모델"""
+
+    def __init__(self, cache: SupabaseCache, parent=None) -> None:
+        super().__init__(parent)
+        self.cache = cache
+        self.filters: Optional[OrderFilter] = None
+        self._total = 0
+        self._pages: "OrderedDict[int, _Page]" = OrderedDict()
+        # 페이지 k의 시작 커서 (페이지 k-1 마지막 주문의 created_at, order_id)
+        self._cursors: Dict[int, Optional[Tuple[str, int]]] = {0: None}
+        self._dirty = True  # 처음 표시할 때 읽음
+
+    def mark_dirty(self) -> None:
+        """동기화/출력으로 주문이 바뀌었음을 표시합니다. (다음에 탭을 열 때 다시 읽음)"""
+        self._dirty = True
+
+    def is_stale(self) -> bool:
+        """다시 읽어야 하는지 여부 (변경 표시가 있거나 주문 수가 달라진 경우)"""
+        if self._dirty:
+            return True
+        try:
+            return self.cache.count_orders(self.filters) != self._total
+        except Exception as e:
+            logger.error(f"주문 내역 개수 조회 실패: {e}")
+            return False
+
+    def reload(self, filters: Optional[OrderFilter] = None) -> None:
+        """(필터를 바꾸고) 주문 수를 다시 세고 읽어 둔 페이지를 비웁니다."""
+        self.beginResetModel()
+        if filters is not None:
+            self.filters = None if filters.is_empty else filters
+        try:
+            self._total = self.cache.count_orders(self.filters)
+        except Exception as e:
+            logger.error(f"주문 내역 개수 조회 실패: {e}")
+            self._total = 0
+        self._pages.clear()
+        self._cursors = {0: None}
+        self._dirty = False
+        self.endResetModel()
+
+    # ------------------------------------------------------------------
+    # QAbstractTableModel 인터페이스
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else self._total
+
+    def columnCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(ORDER_COLUMNS)
+
+    def data(self, index: QModelIndex, role: int = Qt.DisplayRole) -> Any:
+        if not index.isValid() or role not in (Qt.DisplayRole, Qt.UserRole):
+            return None
+        page_no, offset = divmod(index.row(), PAGE_SIZE)
+        page = self._page(page_no)
+        if page is None or offset >= len(page.orders):
+            return None
+        order = page.orders[offset]
+        if role == Qt.UserRole:
+            return order["order_id"]
+
+        if index.column() == MENU_COLUMN and order["order_id"] not in page.items:
+            self._load_items(page, offset)
+        return order_display_row(dict(order, items=page.items.get(order["order_id"], []))).column(index.column())
+
+    def headerData(self, section: int, orientation: Qt.Orientation, role: int = Qt.DisplayRole) -> Any:
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return ORDER_COLUMNS[section]
+        return super().headerData(section, orientation, role)
+
+    def order_id_at(self, row: int) -> Optional[Any]:
+        """행의 주문 ID (범위 밖이면 None)"""
+        if not 0 <= row < self._total:
+            return None
+        return self.data(self.index(row, 0), Qt.UserRole)
+
+    # ------------------------------------------------------------------
+    # 페이지 조회
+    def _cursor(self, page_no: int) -> Optional[Tuple[str, int]]:
+        if page_no in self._cursors:
+            return self._cursors[page_no]
+        # 가장 가까운 앞쪽 커서에서 색인만 읽어 바로 이동 (스크롤바를 끌어 멀리 이동한 경우)
+        known = max(no for no in self._cursors if no < page_no)
+        cursor = self.cache.get_order_cursor(self._cursors[known], (page_no - known) * PAGE_SIZE, self.filters)
+        self._cursors[page_no] = cursor
+        return cursor
+
+    def _page(self, page_no: int) -> Optional[_Page]:
+        page = self._pages.get(page_no)
+        if page is not None:
+            self._pages.move_to_end(page_no)
+            return page
+
+        try:
+            cursor = self._cursor(page_no)
+            if page_no and cursor is None:
+                return None  # 조회 후 주문이 줄어든 경우
+            page = _Page(self.cache.get_orders_page(cursor, PAGE_SIZE, self.filters))
+        except Exception as e:
+            logger.error(f"주문 내역 페이지 조회 실패 (페이지 {page_no}): {e}")
+            return None
+
+        if page.orders:
+            last = page.orders[-1]
+            self._cursors[page_no + 1] = (last["created_at"], last["order_id"])
+        self._pages[page_no] = page
+        while len(self._pages) > MAX_CACHED_PAGES:
+            self._pages.popitem(last=False)
+        return page
+
+    def _load_items(self, page: _Page, offset: int) -> None:
+        """화면에 그려지는 행 주변 묶음의 메뉴 목록을 한 번에 조회합니다."""
+        start = offset - offset % ITEM_BLOCK
+        order_ids = [order["order_id"] for order in page.orders[start:start + ITEM_BLOCK]]
+        try:
+            page.items.update(self.cache.get_item_summaries(order_ids))
+        except Exception as e:
+            logger.error(f"주문 내역 메뉴 조회 실패: {e}")
+            page.items.update({order_id: [] for order_id in order_ids})
+
+
+class OrderHistoryWidget(QWidget):
+    """전체 주문 내역 탭"""
+
+    def __init__(self, cache: SupabaseCache) -> None:
+        super().__init__()
+        layout = QVBoxLayout(self)
+
+        # 검색 / 필터
+        search_layout = QHBoxLayout()
+        self.search_edit = QLineEdit()
+        self.search_edit.setPlaceholderText("회사명, 메뉴, 옵션, 주문번호 검색")
+        self.search_edit.returnPressed.connect(self.search)
+        search_layout.addWidget(self.search_edit)
+
+        self.date_check = QCheckBox("기간")
+        self.date_check.toggled.connect(self._on_date_toggled)
+        search_layout.addWidget(self.date_check)
+        today = QDate.currentDate()
+        self.date_from_edit = QDateEdit(today.addDays(-7))
+        self.date_to_edit = QDateEdit(today)
+        for edit in (self.date_from_edit, self.date_to_edit):
+            edit.setCalendarPopup(True)
+            edit.setDisplayFormat("yyyy-MM-dd")
+            edit.setEnabled(False)
+        search_layout.addWidget(self.date_from_edit)
+        search_layout.addWidget(QLabel("~"))
+        search_layout.addWidget(self.date_to_edit)
+
+        self.status_combo = QComboBox()
+        self.status_combo.addItems(PRINT_STATUS_FILTERS)
+        self.status_combo.currentIndexChanged.connect(self.search)
+        search_layout.addWidget(self.status_combo)
+
+        search_btn = QPushButton("검색")
+        search_btn.clicked.connect(self.search)
+        search_layout.addWidget(search_btn)
+        layout.addLayout(search_layout)
+
+        top_layout = QHBoxLayout()
+        self.count_label = QLabel("")
+        top_layout.addWidget(self.count_label)
+        top_layout.addStretch()
+        refresh_btn = QPushButton("새로고침")
+        refresh_btn.clicked.connect(self.refresh)
+        top_layout.addWidget(refresh_btn)
+        layout.addLayout(top_layout)
+
+        self.model = OrderHistoryModel(cache, self)
+        self.table = QTableView()
+        self.table.setModel(self.model)
+        self.table.horizontalHeader().setStretchLastSection(True)
+        # 행 높이를 고정해야 화면에 보이는 행만 조회됨 (내용 맞춤은 전체 행을 읽음)
+        self.table.verticalHeader().setSectionResizeMode(QHeaderView.Fixed)
+        self.table.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        self.table.setSelectionBehavior(QAbstractItemView.SelectRows)
+        self.table.setSelectionMode(QAbstractItemView.SingleSelection)
+        layout.addWidget(self.table)
+
+    def current_filter(self) -> OrderFilter:
+        """입력된 검색 조건"""
+        date_from = date_to = None
+        if self.date_check.isChecked():
+            date_from = self.date_from_edit.date().toPython()
+            date_to = self.date_to_edit.date().toPython()
+        status = self.status_combo.currentText()
+        return OrderFilter(
+            query=self.search_edit.text(),
+            date_from=date_from,
+            date_to=date_to,
+            print_status=None if status == PRINT_STATUS_FILTERS[0] else status,
+        )
+
+    def search(self) -> None:
+        self.model.reload(self.current_filter())
+        self._update_count_label()
+
+    def refresh(self) -> None:
+        self._reload_keeping_position()
+        self._update_count_label()
+
+    def mark_dirty(self, batch: Any = None) -> None:
+        """주문 관리 탭의 화면 갱신 묶음(UiUpdateBatch)에 주문 변경이 있으면 다시 읽도록 표시합니다."""
+        if batch is None or batch.refresh or batch.statuses:
+            self.model.mark_dirty()
+
+    def _reload_keeping_position(self) -> None:
+        """주문 수를 다시 세고, 보던 맨 위 행과 선택한 주문을 유지합니다."""
+        top_row = self.table.rowAt(0)
+        top_id = self.model.order_id_at(top_row) if top_row >= 0 else None
+        current_row = self.table.currentIndex().row()
+        selected_id = self.model.order_id_at(current_row) if current_row >= 0 else None
+        old_total = self.model.rowCount()
+
+        self.model.reload()
+
+        # 새 주문은 맨 위에 추가되므로 늘어난 수만큼 아래로 밀린 자리부터 확인
+        shift = self.model.rowCount() - old_total
+        if top_id is not None:
+            row = self._find_row(top_id, top_row, shift)
+            if row is None:
+                row = min(max(top_row + shift, 0), self.model.rowCount() - 1)
+            if row >= 0:
+                self.table.scrollTo(self.model.index(row, 0), QAbstractItemView.PositionAtTop)
+        if selected_id is not None:
+            row = self._find_row(selected_id, current_row, shift)
+            if row is not None:
+                self.table.selectRow(row)
+
+    def _find_row(self, order_id: Any, row: int, shift: int) -> Optional[int]:
+        for candidate in (row + shift, row):
+            if self.model.order_id_at(candidate) == order_id:
+                return candidate
+        return None
+
+    def _on_date_toggled(self, checked: bool) -> None:
+        self.date_from_edit.setEnabled(checked)
+        self.date_to_edit.setEnabled(checked)
+        self.search()
+
+    def _update_count_label(self) -> None:
+        prefix = "검색 결과" if self.model.filters else "전체 주문"
+        self.count_label.setText(f"{prefix} {self.model.rowCount():,}건")
+
+    def showEvent(self, event) -> None:
+        # 동기화로 주문이 바뀌었거나 주문 수가 달라졌을 때만 다시 읽음 (그 외에는 스크롤/선택/페이지 유지)
+        if self.model.is_stale():
+            self.refresh()
+        super().showEvent(event)
@@ -0,0 +1,191 @@
+# -*- coding: utf-8 -*-
+"""주문 목록 테이블 모델.
+
+새로고침할 때 테이블을 비우고 다시 만드는 대신, 로컬 캐시에서 읽은 주문 목록과
+현재 행을 비교하여 실제로 바뀐 주문에 대해서만 행 추가/변경/삭제/이동 신호를 보냅니다.
+뷰의 선택과 스크롤 위치는 Qt가 유지하는 영구 인덱스로 보존됩니다.
+행은 화면에 표시할 문자열만 담은 __slots__ 레코드(OrderRow)이고,
+출력용 전체 주문 데이터는 필요할 때 캐시(메뉴/옵션 LRU)에서 읽습니다.
+"""
+import sys
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from PySide6.QtCore import QAbstractTableModel, QModelIndex, Qt
+
+ORDER_COLUMNS = ("주문번호", "회사명", "메뉴", "매장식사", "총액", "상태", "출력상태", "주문일시")
+STATUS_COLUMN = 5
+PRINT_STATUS_COLUMN = 6
+
+# 컬럼별 OrderRow 필드 (주문번호는 주문 ID에서 만듦)
+ROW_FIELDS = ("company_name", "menu", "dine_in", "total_price", "status", "print_status", "created_at")
+
+
+class OrderRow:
+    """주문 목록 한 행 (주문 ID + 표시 문자열만 보관)"""
+    __slots__ = ("order_id",) + ROW_FIELDS
+
+    def __init__(self, order_id: Any, company_name: str, menu: str, dine_in: str, total_price: str,
+                 status: str, print_status: str, created_at: str) -> None:
+        self.order_id = order_id
+        # 반복되는 문자열(회사명, 상태)은 행마다 따로 두지 않고 공유
+        self.company_name = sys.intern(company_name)
+        self.menu = menu
+        self.dine_in = dine_in
+        self.total_price = total_price
+        self.status = sys.intern(status)
+        self.print_status = sys.intern(print_status)
+        self.created_at = created_at
+
+    def column(self, column: int) -> str:
+        if column == 0:
+            return str(self.order_id)
+        return getattr(self, ROW_FIELDS[column - 1])
+
+    def values(self) -> Tuple[str, ...]:
+        """비교용 표시 문자열 (주문번호 제외)"""
+        return tuple(getattr(self, field) for field in ROW_FIELDS)
+
+
+def format_created_at(created_at: str) -> str:
+    """ISO 형식의 주문일시를 화면 표시용 문자열로 변환합니다."""
+    if not created_at:
+        return ""
+    try:
+        return datetime.fromisoformat(created_at.replace('Z', '+00:00')).strftime("%Y-%m-%d %H:%M:%S")
+    except ValueError:
+        return created_at
+
+
+def order_display_row(order_data: Dict[str, Any]) -> OrderRow:
+    """주문 데이터(요약 또는 상세)를 테이블 한 행(표시 문자열)으로 변환합니다."""
+    items_text = "\n".join(
+        f"{item.get('name', 'N/A')} x{item.get('quantity', 1)}"
+        for item in order_data.get("items", [])
+    )
+    return OrderRow(
+        order_data.get("order_id"),
+        order_data.get("company_name", "N/A") or "N/A",
+        items_text,
+        "매장식사" if order_data.get("is_dine_in", True) else "포장",
+        f"{order_data.get('total_price', 0) or 0:,}원",
+        "출력완료" if order_data.get("is_printed", False) else "신규",
+        order_data.get("print_status") or "신규",
+        format_created_at(order_data.get("created_at", "")),
+    )
+
+
+class OrderTableModel(QAbstractTableModel):
+    """주문 목록 모델 (변경분만 반영)"""
+
+    def __init__(self, parent=None) -> None:
+        super().__init__(parent)
+        self._rows: List[OrderRow] = []
+
+    # ------------------------------------------------------------------
+    # QAbstractTableModel 인터페이스
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(ORDER_COLUMNS)
+
+    def data(self, index: QModelIndex, role: int = Qt.DisplayRole) -> Any:
+        if not index.isValid():
+            return None
+        row = self._rows[index.row()]
+        if role == Qt.DisplayRole:
+            return row.column(index.column())
+        if role == Qt.UserRole:
+            return row.order_id
+        return None
+
+    def headerData(self, section: int, orientation: Qt.Orientation, role: int = Qt.DisplayRole) -> Any:
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return ORDER_COLUMNS[section]
+        return super().headerData(section, orientation, role)
+
+    # ------------------------------------------------------------------
+    # 조회
+    def order_id_at(self, row: int) -> Optional[Any]:
+        """행의 주문 ID (범위 밖이면 None)"""
+        if 0 <= row < len(self._rows):
+            return self._rows[row].order_id
+        return None
+
+    def row_of(self, order_id: Any) -> int:
+        """주문 ID의 행 번호 (없으면 -1)"""
+        for row, order_row in enumerate(self._rows):
+            if order_row.order_id == order_id:
+                return row
+        return -1
+
+    # ------------------------------------------------------------------
+    # 갱신
+    def set_orders(self, rows: Sequence[OrderRow]) -> int:
+        """
+        새 주문 목록을 반영합니다. 사라진 주문은 삭제, 새 주문은 추가, 순서가 바뀐 주문은 이동,
+        표시 내용이 바뀐 주문은 해당 행만 변경 신호를 보냅니다.
+
+        Returns:
+            int: 추가/변경/삭제/이동된 행 수
+        """
+        changes = 0
+        target_ids = {order_row.order_id for order_row in rows}
+
+        # 1. 사라진 주문 삭제 (연속 구간 단위, 뒤에서부터)
+        row = len(self._rows) - 1
+        while row >= 0:
+            if self._rows[row].order_id in target_ids:
+                row -= 1
+                continue
+            last = row
+            while row >= 0 and self._rows[row].order_id not in target_ids:
+                row -= 1
+            self.beginRemoveRows(QModelIndex(), row + 1, last)
+            del self._rows[row + 1:last + 1]
+            self.endRemoveRows()
+            changes += last - row
+
+        # 2. 목표 순서대로 추가/이동/변경
+        for target_row, order_row in enumerate(rows):
+            order_id = order_row.order_id
+            current = self._rows[target_row].order_id if target_row < len(self._rows) else None
+            if current != order_id:
+                source_row = self.row_of(order_id)
+                if source_row < 0:
+                    self.beginInsertRows(QModelIndex(), target_row, target_row)
+                    self._rows.insert(target_row, order_row)
+                    self.endInsertRows()
+                    changes += 1
+                    continue
+                # source_row > target_row (앞 행들은 이미 목표 순서로 정리됨)
+                self.beginMoveRows(QModelIndex(), source_row, source_row, QModelIndex(), target_row)
+                self._rows.insert(target_row, self._rows.pop(source_row))
+                self.endMoveRows()
+                changes += 1
+            if self._rows[target_row].values() != order_row.values():
+                self._update_row(target_row, order_row)
+                changes += 1
+        return changes
+
+    def update_status(self, order_id: Any, status: Optional[str] = None, print_status: Optional[str] = None) -> None:
+        """주문 하나의 상태 컬럼만 갱신합니다. (출력 직후 화면 반영용)"""
+        row = self.row_of(order_id)
+        if row < 0:
+            return
+        current = self._rows[row]
+        self._update_row(row, OrderRow(
+            order_id, current.company_name, current.menu, current.dine_in, current.total_price,
+            status if status is not None else current.status,
+            print_status if print_status is not None else current.print_status,
+            current.created_at,
+        ))
+
+    def _update_row(self, row: int, order_row: OrderRow) -> None:
+        previous = self._rows[row].values()
+        self._rows[row] = order_row
+        # 바뀐 컬럼 범위만 알림 (주문번호 컬럼은 바뀌지 않음)
+        changed = [column + 1 for column, (old, new) in enumerate(zip(previous, order_row.values())) if old != new]
+        if changed:
+            self.dataChanged.emit(self.index(row, changed[0]), self.index(row, changed[-1]), [Qt.DisplayRole])
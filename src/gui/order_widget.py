@@ -2,58 +2,81 @@ from PySide6.QtWidgets import (
     QWidget,
     QVBoxLayout,
     QHBoxLayout,
-    QTableWidget,
-    QTableWidgetItem,
+    QTableView,
+    QAbstractItemView,
     QPushButton,
     QLabel,
     QMessageBox,
     QProgressBar,
     QCheckBox,
 )
-from PySide6.QtCore import Qt, Slot, QTimer
+from PySide6.QtCore import Qt, Slot, QTimer, Signal
 import logging
-import sqlite3
-import requests
-from datetime import datetime, timedelta
-from typing import List, Dict, Any
 
 # Use an absolute import so this module works when executed directly.
-from src.database.cache import SupabaseCache
 from src.error_logger import get_error_logger
 
-from src.printer.manager import PrinterManager
+from src.gui.order_table_model import OrderTableModel, order_display_row
+from src.gui.ui_updates import Notice, UiUpdateBatch, UiUpdateCoordinator
+# 동기화/자동 출력 로직은 Qt 없는 서비스에 있음 (헤드리스 모드와 공유)
+from src.order_service import UPDATE_INTERVAL_SECONDS, OrderService, OrderStatus, format_order_for_print, printer_label
+from src.printer.status_monitor import get_status_monitor
 
-# 주문 상태 Enum
-class OrderStatus:
-    NEW = "신규"
-    PRINTING = "출력중"
-    PRINTED = "출력완료"
-    PRINT_FAILED = "출력실패"
+UPDATE_INTERVAL_MS = UPDATE_INTERVAL_SECONDS * 1000  # 미출력 주문 확인 주기
+FIRST_SYNC_DELAY_MS = 100    # 창 표시 후 첫 서버 동기화까지 대기 (첫 화면을 먼저 그림)
 
 class OrderWidget(QWidget):
+    # 상태 모니터 스레드에서 GUI 스레드로 프린터 상태 전달
+    printer_status_changed = Signal(str, object)
+
     def __init__(self, supabase_config, db_config):
         super().__init__()
-        self.printer_manager = PrinterManager()
-        self.cache = SupabaseCache(db_path=db_config['path'], supabase_config=supabase_config)
-        self.cache.setup_sqlite()
+        # 화면 변경은 모아서 일정 간격으로 한 번에 반영 (주문이 몰릴 때 재조회/다시 그리기 최소화)
+        self.ui_updates = UiUpdateCoordinator(parent=self)
+        self.ui_updates.batch_ready.connect(self.apply_ui_updates)
+
+        # 주문 동기화/자동 출력 서비스 (변경 알림은 화면 갱신 모음 처리기로)
+        self.service = OrderService(supabase_config, db_config, events=self.ui_updates)
+        self.printer_manager = self.service.printer_manager
+        self.cache = self.service.cache
+        self.printer_statuses = {}
         self.setup_ui()
-        self.orders = []
 
-        # 주문 갱신을 위한 단일 타이머
+        # 주문 갱신을 위한 단일 타이머 (창이 표시된 뒤 시작)
         self.update_timer = QTimer()
         self.update_timer.timeout.connect(self.check_for_updates)
-        self.update_timer.start(5000)
 
         # 메시지 표시를 위한 타이머
         self.message_timer = QTimer()
         self.message_timer.setSingleShot(True)
         self.message_timer.timeout.connect(self.clear_temporary_message)
 
-        # 초기 주문 로드
-        self.refresh_orders()
+        # 초기 주문 로드 (로컬 캐시만, 서버 동기화는 창이 그려진 뒤)
+        try:
+            self.reload_orders()
+        except Exception as e:
+            logging.error(f"캐시 주문 로드 오류: {e}")
+        self._background_started = False
         
         # 프로그램 시작 후 체크박스 상태 동기화
         self.sync_auto_print_checkbox()
+
+        # 프린터 상태 변경은 시그널로 GUI 스레드에 전달
+        self.printer_status_changed.connect(self.on_printer_status_changed)
+        get_status_monitor().add_listener(self.printer_status_changed.emit)
+
+    def showEvent(self, event) -> None:
+        # 첫 표시 후 (첫 화면이 그려질 시간을 두고) 네트워크 동기화와 주기 작업 시작
+        if not self._background_started:
+            self._background_started = True
+            QTimer.singleShot(FIRST_SYNC_DELAY_MS, self.start_background_work)
+        super().showEvent(event)
+
+    def start_background_work(self) -> None:
+        """첫 서버 동기화, 주문 확인 타이머, 프린터 상태 모니터를 시작합니다."""
+        self.printer_manager.start_status_monitor()
+        self.refresh_orders()
+        self.update_timer.start(UPDATE_INTERVAL_MS)
         
     def setup_ui(self):
         # 메인 레이아웃
@@ -104,29 +127,32 @@ class OrderWidget(QWidget):
         self.progress_bar.setVisible(False)
         layout.addWidget(self.progress_bar)
         
-        # 주문 테이블
-        self.order_table = QTableWidget()
-        self.order_table.setColumnCount(8)
-        self.order_table.setHorizontalHeaderLabels([
-            "주문번호", "회사명", "메뉴", "매장식사", "총액", "상태", "출력상태", "주문일시"
-        ])
+        # 주문 테이블 (모델/뷰: 새로고침 시 바뀐 행만 갱신)
+        self.order_model = OrderTableModel(self)
+        self.order_table = QTableView()
+        self.order_table.setModel(self.order_model)
         self.order_table.horizontalHeader().setStretchLastSection(True)
-        self.order_table.setEditTriggers(QTableWidget.NoEditTriggers)  # 편집 비활성화
-        self.order_table.setSelectionBehavior(QTableWidget.SelectRows)  # 행 전체 선택
-        self.order_table.setSelectionMode(QTableWidget.SingleSelection)  # 단일 행 선택만 허용
+        self.order_table.setEditTriggers(QAbstractItemView.NoEditTriggers)  # 편집 비활성화
+        self.order_table.setSelectionBehavior(QAbstractItemView.SelectRows)  # 행 전체 선택
+        self.order_table.setSelectionMode(QAbstractItemView.SingleSelection)  # 단일 행 선택만 허용
         layout.addWidget(self.order_table)
 
-        # 알림 레이블
+        # 알림 레이블 + 프린터 상태 레이블
+        bottom_layout = QHBoxLayout()
         self.notice_label = QLabel("")
-        layout.addWidget(self.notice_label)
+        bottom_layout.addWidget(self.notice_label)
+        bottom_layout.addStretch()
+        self.printer_status_label = QLabel("프린터 상태 확인 중...")
+        bottom_layout.addWidget(self.printer_status_label)
+        layout.addLayout(bottom_layout)
         
         # 스타일 설정
         self.setStyleSheet("""
-            QTableWidget {
+            QTableView {
                 background-color: white;
                 border: 1px solid #ddd;
             }
-            QTableWidget::item {
+            QTableView::item {
                 padding: 5px;
             }
             QPushButton {
@@ -219,254 +245,15 @@ class OrderWidget(QWidget):
     
     def update_order_status(self, order_id: int, status: str, print_attempts: int = None):
         """주문 상태를 업데이트합니다."""
-        try:
-            with sqlite3.connect(self.cache.db_path) as conn:
-                cursor = conn.cursor()
-                
-                # 현재 시간
-                now = datetime.now().isoformat()
-                
-                if print_attempts is not None:
-                    cursor.execute(
-                        'UPDATE "order" SET print_status = ?, print_attempts = ?, last_print_attempt = ? WHERE order_id = ?',
-                        (status, print_attempts, now, order_id)
-                    )
-                else:
-                    cursor.execute(
-                        'UPDATE "order" SET print_status = ?, last_print_attempt = ? WHERE order_id = ?',
-                        (status, now, order_id)
-                    )
-                
-                conn.commit()
-                logging.info(f"주문 {order_id}의 상태를 {status}로 업데이트")
-                
-                # Supabase에도 상태 업데이트 시도
-                if self.cache.base_url and status == OrderStatus.PRINTED:
-                    try:
-                        response = requests.patch(
-                            f"{self.cache.base_url}/rest/v1/order",
-                            headers=self.cache.headers,
-                            json={"is_printed": True},
-                            params={"order_id": f"eq.{order_id}"}
-                        )
-                        response.raise_for_status()
-                    except Exception as e:
-                        logging.error(f"Supabase 업데이트 실패: {e}")
-                        
-        except Exception as e:
-            logging.error(f"주문 상태 업데이트 오류: {e}")
-
-    def check_for_updates(self):
-        """미출력 주문을 확인하고 자동 출력을 처리합니다."""
-        try:
-            # 자동 출력이 비활성화된 경우 처리하지 않음
-            auto_print_enabled = self.printer_manager.is_auto_print_enabled()
-            logging.debug(f"check_for_updates 호출됨 - 자동출력 활성화: {auto_print_enabled}")
-            
-            if not auto_print_enabled:
-                logging.debug("자동 출력이 비활성화되어 있어 처리하지 않음")
-                return
-                
-            # 주문 관련 테이블 동기화 (항상 수행)
-            for table in ["order", "order_item", "order_item_option"]:
-                self.cache.fetch_and_store_table(table)
-            
-            # 미출력 주문들 가져오기
-            unprinteed_orders = self.get_unprinteed_orders()
-            logging.info(f"미출력 주문 조회 결과: {len(unprinteed_orders)}개")
-            
-            if unprinteed_orders:
-                logging.info(f"미출력 주문 {len(unprinteed_orders)}개를 확인했습니다.")
-                for order in unprinteed_orders:
-                    logging.info(f"미출력 주문 발견: ID={order.get('order_id')}, 회사={order.get('company_name')}")
-                
-                # 임시 메시지가 표시 중이 아닐 때만 미출력 주문 메시지 표시
-                if not self.message_timer.isActive():
-                    self.notice_label.setText(f"미출력 주문 {len(unprinteed_orders)}개 발견")
-                
-                # 각 미출력 주문에 대해 자동 출력 처리
-                for order in unprinteed_orders:
-                    order_detail = self.cache.join_order_detail(order["order_id"])
-                    order_id = order_detail.get("order_id")
-                    
-                    logging.info(f"주문 {order_id} 자동 출력 시도")
-                    
-                    # 프린터 상태 확인
-                    if not self.printer_manager.check_printer_status():
-                        logging.warning(f"주문 {order_id}: 프린터 상태 불량으로 출력 건너뜀")
-                        continue
-                    
-                    # 자동 출력 처리
-                    success = self.process_auto_print(order_detail)
-                    
-                    if success:
-                        logging.info(f"주문 {order_id} 자동 출력 성공")
-                        # 출력 성공 시 is_printed 상태 업데이트
-                        self.update_is_printed_status(order_id, True)
-                    else:
-                        logging.warning(f"주문 {order_id} 자동 출력 실패")
-                
-                # UI 새로고침
-                self.refresh_orders()
-            else:
-                # 미출력 주문이 없으면 조용히 처리
-                pass
-                
-        except Exception as e:
-            logging.error(f"자동 출력 처리 오류: {e}")
-            self.notice_label.setText("자동 출력 처리 중 오류가 발생했습니다.")
-            # Supabase에도 에러 로깅
-            error_logger = get_error_logger()
-            if error_logger:
-                error_logger.log_error(e, "자동 출력 처리 오류", {"context": "auto_print_processing"})
-
-    def get_unprinteed_orders(self) -> List[Dict[str, Any]]:
-        """출력되지 않은 주문들을 가져옵니다."""
-        conn = sqlite3.connect(self.cache.db_path)
-        conn.row_factory = sqlite3.Row
-        cursor = conn.cursor()
-        
-        # is_printed가 0(False)인 주문들을 최신순으로 가져오기
-        query = """
-        SELECT o.order_id, o.company_id, o.is_dine_in, o.total_price, o.created_at,
-               c.company_name
-        FROM "order" o
-        JOIN company c ON c.company_id = o.company_id
-        WHERE o.is_printed = 0
-        ORDER BY o.created_at DESC
-        LIMIT 10
-        """
-        
-        rows = cursor.execute(query).fetchall()
-        conn.close()
-        return [dict(row) for row in rows]
+        self.service.update_order_status(order_id, status, print_attempts)
 
     def update_is_printed_status(self, order_id: int, is_printed: bool) -> None:
         """주문의 출력 상태를 업데이트합니다."""
-        try:
-            # 로컬 DB 업데이트
-            with sqlite3.connect(self.cache.db_path) as conn:
-                cursor = conn.cursor()
-                cursor.execute(
-                    'UPDATE "order" SET is_printed = ? WHERE order_id = ?',
-                    (1 if is_printed else 0, order_id)
-                )
-                conn.commit()
-                logging.info(f"주문 {order_id}의 출력 상태를 {is_printed}로 업데이트")
-            
-            # Supabase에도 업데이트 시도
-            if self.cache.base_url:
-                try:
-                    response = requests.patch(
-                        f"{self.cache.base_url}/rest/v1/order",
-                        headers=self.cache.headers,
-                        json={"is_printed": is_printed},
-                        params={"order_id": f"eq.{order_id}"}
-                    )
-                    response.raise_for_status()
-                    logging.info(f"Supabase에 주문 {order_id} 출력 상태 업데이트 성공")
-                except Exception as e:
-                    logging.error(f"Supabase 출력 상태 업데이트 실패: {e}")
-                        
-        except Exception as e:
-            logging.error(f"출력 상태 업데이트 오류: {e}")
+        self.service.update_is_printed_status(order_id, is_printed)
 
-    def process_auto_print(self, order_data: dict) -> bool:
-        """자동 출력을 처리합니다."""
-        order_id = order_data.get("order_id")
-        
-        try:
-            # 이미 출력된 주문인지 확인
-            if order_data.get("is_printed", False):
-                logging.info(f"주문 {order_id}: 이미 출력됨")
-                return True
-                
-            # 출력 상태를 "출력중"으로 변경 (print_status는 별도 관리)
-            self.update_order_status(order_id, OrderStatus.PRINTING)
-            
-            # 주문 데이터 형식 변환
-            formatted_order = {
-                "order_id": str(order_data.get("order_id", "N/A")),
-                "company_name": order_data.get("company_name", "N/A"),
-                "created_at": order_data.get("created_at", ""),
-                "is_dine_in": order_data.get("is_dine_in", True),
-                "items": []
-            }
-            
-            # 주문 항목 처리
-            for item in order_data.get("items", []):
-                formatted_item = {
-                    "name": item.get("name", "N/A"),
-                    "quantity": item.get("quantity", 1),
-                    "price": item.get("price", 0),
-                    "options": item.get("options", [])
-                }
-                formatted_order["items"].append(formatted_item)
-            
-            # 양쪽 프린터 동시 출력 시도
-            results = self.printer_manager.print_both_receipts(formatted_order)
-            customer_success = results["customer"]
-            kitchen_success = results["kitchen"]
-            
-            if customer_success and kitchen_success:
-                # 모든 프린터 출력 성공
-                self.update_order_status(order_id, OrderStatus.PRINTED)
-                logging.info(f"주문 {order_id} 자동 출력 성공 (손님용+주방용)")
-                self.notice_label.setText(f"주문 {order_id}이(가) 자동으로 출력되었습니다 (손님용+주방용).")
-                return True
-            elif customer_success or kitchen_success:
-                # 부분 성공
-                success_printers = []
-                if customer_success:
-                    success_printers.append("손님용")
-                if kitchen_success:
-                    success_printers.append("주방용")
-                
-                logging.warning(f"주문 {order_id} 자동 출력 부분 성공: {', '.join(success_printers)}")
-                self.notice_label.setText(f"주문 {order_id} 일부 프린터만 출력됨: {', '.join(success_printers)}")
-                
-                # 손님용 프린터만 성공해도 주문을 완료로 처리
-                if customer_success:
-                    self.update_order_status(order_id, OrderStatus.PRINTED)
-                    return True
-                else:
-                    self.update_order_status(order_id, OrderStatus.PRINT_FAILED)
-                    return False
-            else:
-                # 모든 프린터 출력 실패
-                self.update_order_status(order_id, OrderStatus.PRINT_FAILED)
-                logging.error(f"주문 {order_id} 자동 출력 실패 (모든 프린터)")
-                self.notice_label.setText(f"주문 {order_id} 자동 출력 실패")
-                return False
-                
-        except Exception as e:
-            logging.error(f"자동 출력 처리 오류: {e}")
-            self.update_order_status(order_id, OrderStatus.PRINT_FAILED)
-            # Supabase에도 에러 로깅
-            error_logger = get_error_logger()
-            if error_logger:
-                error_logger.log_printer_error(
-                    printer_type="auto_print",
-                    error=e,
-                    order_id=str(order_id)
-                )
-            return False
-
-    def should_retry_print(self, order_data: dict) -> bool:
-        """재시도가 필요한지 확인합니다."""
-        if order_data.get("print_status") != OrderStatus.NEW:
-            return False
-            
-        last_attempt = order_data.get("last_print_attempt")
-        if not last_attempt:
-            return True
-            
-        try:
-            last_attempt_time = datetime.fromisoformat(last_attempt)
-            retry_interval = self.printer_manager.auto_print_config.get("retry_interval", 30)
-            return datetime.now() >= last_attempt_time + timedelta(seconds=retry_interval)
-        except Exception:
-            return True
+    def check_for_updates(self):
+        """미출력 주문을 확인하고 자동 출력을 처리합니다."""
+        self.service.check_for_updates()
     
     @Slot()
     def refresh_orders(self):
@@ -474,24 +261,10 @@ class OrderWidget(QWidget):
         try:
             self.set_loading_state(True)
             
-            # 주문 관련 테이블 동기화
-            for table in ["order", "order_item", "order_item_option"]:
-                self.cache.fetch_and_store_table(table)
-
-            orders = self.cache.get_recent_orders()
-
-            # 테이블 초기화
-            self.order_table.setRowCount(0)
-            self.orders = []
-
-            # 새로운 주문 데이터 추가 (최근 주문부터)
-            for order in orders:
-                detail = self.cache.join_order_detail(order["order_id"])
-                self.add_order(detail)
-
-            # 임시 메시지가 표시 중이 아닐 때만 갱신 메시지 표시
-            if not self.message_timer.isActive():
-                self.notice_label.setText("주문 목록이 갱신되었습니다.")
+            # 주문 관련 테이블 동기화 (검색 색인 포함)
+            self.cache.sync_order_tables()
+            self.reload_orders()
+            self.ui_updates.notice("주문 목록이 갱신되었습니다.")
 
         except Exception as e:
             QMessageBox.warning(self, "오류", f"주문 목록 갱신 중 오류가 발생했습니다: {str(e)}")
@@ -502,41 +275,65 @@ class OrderWidget(QWidget):
         finally:
             self.set_loading_state(False)
     
+    def reload_orders(self) -> None:
+        """로컬 캐시에서 최근 주문을 읽어 바뀐 주문만 테이블에 반영합니다. (서버 동기화 없음)
+
+        주문 상세(옵션, 서명 등)는 읽지 않고 요약과 메뉴 이름/수량만 두 번의 조회로 읽습니다.
+        """
+        orders = self.cache.get_recent_orders()
+        items = self.cache.get_item_summaries([order["order_id"] for order in orders])
+        rows = [order_display_row(dict(order, items=items[order["order_id"]])) for order in orders]
+        changes = self.order_model.set_orders(rows)
+        if changes:
+            logging.debug(f"주문 목록 변경 {changes}행 반영")
+
+    @Slot(object)
+    def apply_ui_updates(self, batch: UiUpdateBatch) -> None:
+        """모인 화면 변경을 한 번에 반영합니다."""
+        if batch.refresh:
+            try:
+                self.reload_orders()
+            except Exception as e:
+                logging.error(f"주문 목록 갱신 오류: {e}")
+        for order_id, (status, print_status) in batch.statuses.items():
+            self.order_model.update_status(order_id, status, print_status)
+
+        notice = batch.notice
+        if batch.printer_statuses:
+            self.printer_statuses.update(batch.printer_statuses)
+            self._update_printer_status_label()
+            # 출력 불가 알림은 다른 알림보다 우선
+            for name, status in batch.printer_statuses.items():
+                if not status.is_ready:
+                    notice = Notice(f"{printer_label(name)} 프린터 확인 필요: {status.describe()}", 5000)
+        if notice is not None:
+            self._show_notice(notice)
+
+    def _show_notice(self, notice: Notice) -> None:
+        if notice.duration_ms is not None:
+            self.notice_label.setText(notice.text)
+            self.message_timer.stop()
+            self.message_timer.start(notice.duration_ms)
+        elif not self.message_timer.isActive():
+            # 임시 메시지가 표시 중이 아닐 때만 일반 메시지 표시
+            self.notice_label.setText(notice.text)
+
     def get_selected_order_data(self):
         """선택된 주문 데이터를 가져와서 포맷팅합니다."""
-        current_row = self.order_table.currentRow()
-        if current_row < 0:
+        current_row = self.order_table.currentIndex().row()
+        order_id = self.order_model.order_id_at(current_row)
+        if order_id is None:
             QMessageBox.warning(self, "경고", "출력할 주문을 선택해주세요.")
             return None
             
-        order_item = self.order_table.item(current_row, 0)
-        if not order_item:
-            QMessageBox.warning(self, "경고", "선택한 주문 데이터를 찾을 수 없습니다.")
-            return None
-            
-        order_data = order_item.data(Qt.UserRole)
+        # 출력 시점의 최신 주문 데이터를 로컬 캐시에서 조회
+        order_data = self.cache.join_order_detail(order_id)
         if not order_data:
-            QMessageBox.warning(self, "경고", "선택한 주문 데이터가 유효하지 않습니다.")
+            QMessageBox.warning(self, "경고", "선택한 주문 데이터를 찾을 수 없습니다.")
             return None
             
         # 주문 데이터 형식 변환
-        formatted_order = {
-            "order_id": str(order_data.get("order_id", "N/A")),
-            "company_name": order_data.get("company_name", "N/A"),
-            "created_at": order_data.get("created_at", ""),
-            "is_dine_in": order_data.get("is_dine_in", True),
-            "items": []
-        }
-        
-        # 주문 항목 처리
-        for item in order_data.get("items", []):
-            formatted_item = {
-                "name": item.get("name", "N/A"),
-                "quantity": item.get("quantity", 1),
-                "price": item.get("price", 0),
-                "options": item.get("options", [])
-            }
-            formatted_order["items"].append(formatted_item)
+        formatted_order = format_order_for_print(order_data)
         
         return formatted_order, order_data, current_row
 
@@ -619,9 +416,6 @@ class OrderWidget(QWidget):
                     self.update_order_status(order_data["order_id"], OrderStatus.PRINTED)
                     self.update_is_printed_status(order_data["order_id"], True)
                     
-                    # UI 업데이트
-                    self.order_table.setItem(current_row, 5, QTableWidgetItem("출력완료"))
-                    self.order_table.setItem(current_row, 6, QTableWidgetItem(OrderStatus.PRINTED))
                     QMessageBox.information(self, "성공", "영수증이 성공적으로 출력되었습니다.")
                 else:
                     QMessageBox.warning(self, "출력 실패", "프린터 출력을 확인해주세요.")
@@ -651,87 +445,12 @@ class OrderWidget(QWidget):
         """기존 호환성을 위한 메서드 (동시 출력으로 연결)"""
         self.print_both_receipts()
 
-    def add_order(self, order_data):
-        """새로운 주문을 테이블에 추가"""
-        try:
-            row_position = self.order_table.rowCount()
-            self.order_table.insertRow(row_position)
-
-            # 주문 데이터 설정
-            order_id = str(order_data.get("order_id", "N/A"))
-            item_id = QTableWidgetItem(order_id)
-            item_id.setData(Qt.UserRole, order_data)
-            self.order_table.setItem(row_position, 0, item_id)
-            
-            # 회사명
-            company_name = order_data.get("company_name", "N/A")
-            self.order_table.setItem(row_position, 1, QTableWidgetItem(company_name))
-            
-            # 메뉴 항목 구성
-            items = order_data.get("items", [])
-            items_text = "\n".join([
-                f"{item.get('name', 'N/A')} x{item.get('quantity', 1)}"
-                for item in items
-            ])
-            self.order_table.setItem(row_position, 2, QTableWidgetItem(items_text))
-            
-            # 매장식사 여부
-            is_dine_in = "매장식사" if order_data.get("is_dine_in", True) else "포장"
-            self.order_table.setItem(row_position, 3, QTableWidgetItem(is_dine_in))
-            
-            # 총액
-            total_price = f"{order_data.get('total_price', 0):,}원"
-            self.order_table.setItem(row_position, 4, QTableWidgetItem(total_price))
-            
-            # 상태 (기존 is_printed 기반)
-            status = "출력완료" if order_data.get("is_printed", False) else "신규"
-            self.order_table.setItem(row_position, 5, QTableWidgetItem(status))
-            
-            # 출력상태 (새로운 print_status 기반)
-            print_status = order_data.get("print_status", OrderStatus.NEW)
-            self.order_table.setItem(row_position, 6, QTableWidgetItem(print_status))
-            
-            # 주문일시
-            created_at = order_data.get("created_at", "")
-            if created_at:
-                # ISO 형식의 날짜를 한국 시간으로 변환하여 표시
-                from datetime import datetime
-                try:
-                    dt = datetime.fromisoformat(created_at.replace('Z', '+00:00'))
-                    created_at = dt.strftime("%Y-%m-%d %H:%M:%S")
-                except:
-                    pass
-            self.order_table.setItem(row_position, 7, QTableWidgetItem(created_at))
-            
-            self.orders.append(order_data)
-        except Exception as e:
-            QMessageBox.warning(self, "오류", f"주문 추가 중 오류가 발생했습니다: {str(e)}")
-
     @Slot()
     def sync_static_tables(self):
         """고정 테이블을 수동 동기화합니다."""
-        tables = [
-            "company",
-            "menu_category",
-            "menu_item",
-            "menu_item_option_group",
-            "option_group",
-            "option_group_item",
-            "option_item",
-        ]
         try:
             self.set_loading_state(True)
-            
-            changes = []
-            for table in tables:
-                old_data = self.cache.get_table_data(table)
-                self.cache.fetch_and_store_table(table)
-                new_data = self.cache.get_table_data(table)
-                
-                # 변경사항 확인
-                if old_data != new_data:
-                    changes.append(f"{table}: {len(new_data) - len(old_data)}개 항목 변경")
-            
+            changes = self.service.sync_static_tables()
             if changes:
                 QMessageBox.information(
                     self, 
@@ -764,25 +483,24 @@ class OrderWidget(QWidget):
                 self.show_temporary_message(f"자동 출력이 {status}되었습니다.", 3000)
         
     def show_temporary_message(self, message: str, duration_ms: int = 2000):
-        """임시 메시지를 지정된 시간 동안 표시합니다."""
-        try:
-            logging.debug(f"show_temporary_message 호출됨: '{message}', 지속시간: {duration_ms}ms")
-            
-            # 메시지 설정
-            self.notice_label.setText(message)
-            
-            # 기존 타이머 중지 및 새 타이머 시작
-            self.message_timer.stop()
-            self.message_timer.start(duration_ms)
-            
-        except Exception as e:
-            logging.error(f"show_temporary_message 오류: {e}")
-            # 오류 발생 시 기본 메시지라도 표시하려고 시도
-            try:
-                self.notice_label.setText(message)
-            except:
-                pass
+        """임시 메시지를 지정된 시간 동안 표시합니다. (다음 화면 갱신 반영 시점에 표시)"""
+        logging.debug(f"show_temporary_message 호출됨: '{message}', 지속시간: {duration_ms}ms")
+        self.ui_updates.notice(message, duration_ms)
         
     def clear_temporary_message(self):
         """임시 메시지를 지웁니다."""
         self.notice_label.setText("")
+
+    @Slot(str, object)
+    def on_printer_status_changed(self, name, status):
+        """프린터 상태 변경을 모아서 화면에 반영합니다."""
+        self.ui_updates.printer_status(name, status)
+
+    def _update_printer_status_label(self) -> None:
+        parts = []
+        for key, printer_status in self.printer_statuses.items():
+            parts.append(f"{printer_label(key)}: {printer_status.describe()}")
+        self.printer_status_label.setText(" | ".join(parts))
+
+        all_ready = all(s.is_ready for s in self.printer_statuses.values())
+        self.printer_status_label.setStyleSheet("" if all_ready else "color: #C62828; font-weight: bold;")
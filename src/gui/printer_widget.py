@@ -131,14 +131,15 @@ class CustomerPrinterWidget(QWidget):
             net_layout = QVBoxLayout()
             addr_layout = QHBoxLayout()
             addr_layout.addWidget(QLabel("네트워크 주소:"))
+            network_info = self.printer_manager.get_customer_printer_config().get("network_info", {})
             self.network_addr_edit = QLineEdit()
-            self.network_addr_edit.setText("192.168.0.100")
+            self.network_addr_edit.setText(network_info.get("address", "192.168.0.100"))
             addr_layout.addWidget(self.network_addr_edit)
             net_layout.addLayout(addr_layout)
             port_layout = QHBoxLayout()
             port_layout.addWidget(QLabel("포트:"))
             self.network_port_edit = QLineEdit()
-            self.network_port_edit.setText("9100")
+            self.network_port_edit.setText(str(network_info.get("port", 9100)))
             port_layout.addWidget(self.network_port_edit)
             net_layout.addLayout(port_layout)
             self.printer_layout.addLayout(net_layout)
@@ -224,7 +225,13 @@ class CustomerPrinterWidget(QWidget):
     def confirm_network_printer(self):
         addr = self.network_addr_edit.text() if hasattr(self, 'network_addr_edit') else ''
         port = self.network_port_edit.text() if hasattr(self, 'network_port_edit') else ''
-        self.printer_manager.set_customer_printer_type("network", {"address": addr, "port": port})
+        if not addr:
+            QMessageBox.warning(self, "경고", "네트워크 주소를 입력해주세요.")
+            return
+
+        if not self.printer_manager.set_customer_printer_type("network", {"address": addr, "port": port}):
+            QMessageBox.warning(self, "경고", "네트워크 프린터 정보가 올바르지 않습니다. 주소와 포트를 확인해주세요.")
+            return
         QMessageBox.information(self, "적용 완료", f"손님용 네트워크 프린터 정보가 저장되었습니다:\n주소: {addr}\n포트: {port}")
 
 class KitchenPrinterWidget(QWidget):
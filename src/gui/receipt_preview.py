@@ -1,42 +1,221 @@
-import ast
+# -*- coding: utf-8 -*-
+"""영수증 미리보기 탭.
+
+주문 목록에서 선택한 주문을 실제 출력과 같은 렌더링 엔진으로 메모리에서 렌더링하고,
+ESC/POS 해석기(escpos_interpreter)로 정렬/볼드/글자 배율/이미지를 해석하여 그대로 보여 줍니다.
+디스크를 읽지 않으며 (렌더링 결과는 렌더링 캐시 공유), 캐시에 없는 주문은 영수증 보관소에서 찾습니다.
+"""
 import logging
-import os
-import re
-from typing import Optional
+from datetime import datetime
+from typing import Any, List, Optional, Tuple
+
+from PySide6.QtCore import Qt, QUrl
+from PySide6.QtGui import (
+    QColor,
+    QFont,
+    QFontMetrics,
+    QImage,
+    QTextBlockFormat,
+    QTextCharFormat,
+    QTextCursor,
+    QTextDocument,
+    QTextImageFormat,
+)
+from PySide6.QtWidgets import (
+    QComboBox,
+    QHBoxLayout,
+    QLabel,
+    QLineEdit,
+    QPushButton,
+    QTextEdit,
+    QVBoxLayout,
+    QWidget,
+)
+
+from src.database.cache import SupabaseCache
+from src.order_service import format_order_for_print
+from src.printer.escpos_interpreter import PreviewLine, interpret_escpos
+from src.printer.manager import PrinterManager
+from src.printer.receipt_archive import get_receipt_archive
+from src.printer.text_layout import DEFAULT_PAPER_WIDTH, PAPER_COLUMNS
 
 logger = logging.getLogger(__name__)
 
+PREVIEW_FONT_FAMILY = "Courier New"
+PREVIEW_POINT_SIZE = 10
+PAPER_DOTS = 576  # 80mm 용지 인쇄 폭 (dots), 래스터 이미지 크기 환산용
+RECEIPT_KINDS = (("손님용", "customer"), ("주방용", "kitchen"))
+ELEMENT_LABELS = {"barcode": "바코드", "qrcode": "QR", "graphic": "로고"}
+
+_ALIGN_FLAGS = {
+    "left": Qt.AlignLeft,
+    "center": Qt.AlignHCenter,
+    "right": Qt.AlignRight,
+}
+
+
+def _raster_image(width: int, height: int, raster: bytes) -> QImage:
+    """1비트 래스터(1 = 검정, MSB가 왼쪽)를 QImage로 변환합니다."""
+    image = QImage(raster, width, height, width // 8, QImage.Format_Mono)
+    image.setColorTable([QColor(Qt.white).rgb(), QColor(Qt.black).rgb()])
+    return image.copy()  # 원본 바이트와 분리
+
+
+def render_preview_document(document: QTextDocument, lines: List[PreviewLine], columns: int,
+                            font: QFont) -> None:
+    """해석된 미리보기 줄을 서식 있는 문서로 그립니다. (글자 배율은 글자 크기와 장평으로 표현)"""
+    document.clear()
+    cursor = QTextCursor(document)
+    char_width = QFontMetrics(font).horizontalAdvance("0")
+    base_format = QTextCharFormat()
+    base_format.setFont(font)
+    element_format = QTextCharFormat(base_format)
+    element_format.setForeground(QColor("#777777"))
+
+    for index, line in enumerate(lines):
+        block_format = QTextBlockFormat()
+        block_format.setAlignment(_ALIGN_FLAGS.get(line.align, Qt.AlignLeft))
+        if index:
+            cursor.insertBlock(block_format, base_format)
+        else:
+            cursor.setBlockFormat(block_format)
+
+        if line.kind == "text":
+            for run in line.runs:
+                char_format = QTextCharFormat(base_format)
+                char_format.setFontPointSize(font.pointSizeF() * run.height)
+                char_format.setFontStretch(round(100 * run.width / run.height))
+                char_format.setFontWeight(QFont.Bold if run.bold else QFont.Normal)
+                cursor.insertText(run.text, char_format)
+        elif line.kind == "cut":
+            cursor.insertText("✂ " + "-" * (columns - 2), element_format)
+        elif line.kind == "image":
+            width, height, raster = line.image
+            name = f"raster-{index}"
+            document.addResource(QTextDocument.ImageResource, QUrl(name), _raster_image(width, height, raster))
+            image_format = QTextImageFormat()
+            image_format.setName(name)
+            # 용지 폭(dots) 대비 비율로 화면 글자 폭에 맞춤
+            scale = columns * char_width / PAPER_DOTS
+            image_format.setWidth(width * scale)
+            image_format.setHeight(height * scale)
+            cursor.insertImage(image_format)
+        else:
+            label = ELEMENT_LABELS.get(line.kind, line.kind)
+            cursor.insertText(f"[{label}{': ' + line.data if line.data and line.kind != 'graphic' else ''}]",
+                              element_format)
+
+
+class ReceiptPreviewWidget(QWidget):
+    """선택한 주문의 영수증 미리보기"""
 
-def clean_escpos_bytes(data: bytes) -> bytes:
-    # 0x00~0x1F (제어문자), 0x7F(DEL) 제거
-    return bytes([b for b in data if b >= 0x20 or b in (0x0a, 0x0d)])
+    def __init__(self, printer_manager: PrinterManager, cache: SupabaseCache) -> None:
+        super().__init__()
+        self.printer_manager = printer_manager
+        self.cache = cache
+        self._stale = True
+        layout = QVBoxLayout(self)
 
-def try_decodings(data: bytes):
-    for enc in ['cp949', 'euc-kr', 'utf-8']:
+        # 주문 ID 조회 (비워 두면 가장 최근에 보관된 영수증)
+        search_layout = QHBoxLayout()
+        search_layout.addWidget(QLabel("주문 ID:"))
+        self.order_id_input = QLineEdit()
+        self.order_id_input.setPlaceholderText("주문 목록에서 선택하거나 입력 (비워 두면 최근 보관 영수증)")
+        self.order_id_input.returnPressed.connect(self.refresh_preview)
+        search_layout.addWidget(self.order_id_input)
+
+        self.kind_combo = QComboBox()
+        for label, kind in RECEIPT_KINDS:
+            self.kind_combo.addItem(label, kind)
+        self.kind_combo.currentIndexChanged.connect(self.refresh_preview)
+        search_layout.addWidget(self.kind_combo)
+
+        refresh_btn = QPushButton("조회")
+        refresh_btn.clicked.connect(self.refresh_preview)
+        search_layout.addWidget(refresh_btn)
+        layout.addLayout(search_layout)
+
+        self.source_label = QLabel("")
+        layout.addWidget(self.source_label)
+
+        # 미리보기 영역 (고정폭 폰트, 용지 한 줄 문자 수로 줄바꿈)
+        self.preview_font = QFont(PREVIEW_FONT_FAMILY, PREVIEW_POINT_SIZE)
+        self.preview_text = QTextEdit()
+        self.preview_text.setReadOnly(True)
+        self.preview_text.setFont(self.preview_font)
+        self.preview_text.setLineWrapMode(QTextEdit.FixedColumnWidth)
+        layout.addWidget(self.preview_text)
+
+    # ------------------------------------------------------------------
+    def show_order(self, order_id: Optional[Any]) -> None:
+        """주문 목록의 선택이 바뀌었을 때 호출됩니다. 탭이 보이지 않으면 다음에 열 때 렌더링합니다."""
+        if order_id is None:
+            return
+        self.order_id_input.setText(str(order_id))
+        if self.isVisible():
+            self.refresh_preview()
+        else:
+            self._stale = True
+
+    def showEvent(self, event) -> None:
+        if self._stale:
+            self.refresh_preview()
+        super().showEvent(event)
+
+    def refresh_preview(self) -> None:
+        self._stale = False
+        order_id = self.order_id_input.text().strip() or None
+        kind = self.kind_combo.currentData()
         try:
-            return data.decode(enc)
-        except UnicodeDecodeError:
-            continue
-    return data.decode('latin1', errors='replace')
-
-def read_receipt_file() -> Optional[str]:
-    """`test_print_output.bin` 파일을 읽어 영수증 텍스트를 반환한다."""
-    try:
-        # gui 폴더에서 printer/output 폴더로의 상대 경로 수정
-        current_dir = os.path.dirname(os.path.abspath(__file__))
-        path = os.path.join(current_dir, "..", "printer", "output", "test_receipt_output.bin")
-
-        if not os.path.exists(path):
-            return "영수증 파일이 없습니다."
-
-        # 바이너리 모드로 읽기 (encoding, errors 옵션 X)
-        with open(path, "rb") as f:
-            content = f.read()
-
-        cleaned = clean_escpos_bytes(content)
-        decoded = try_decodings(cleaned)
-        return decoded
-
-    except Exception as e:
-        logger.exception("영수증 파일 미리보기 생성 중 오류 발생")
-        return f"오류가 발생했습니다: {e}" 
\ No newline at end of file
+            previews, source = self._render(order_id, kind)
+        except Exception as e:
+            logger.exception("영수증 미리보기 생성 중 오류 발생")
+            self._show_message(f"오류가 발생했습니다: {e}")
+            return
+        if not previews:
+            self._show_message(source)
+            return
+
+        lines: List[PreviewLine] = []
+        columns = max(preview_columns for _, preview_columns, _ in previews)
+        for _, _, data in previews:
+            lines.extend(interpret_escpos(data))
+        self.preview_text.setLineWrapColumnOrWidth(columns)
+        render_preview_document(self.preview_text.document(), lines, columns, self.preview_font)
+        self.source_label.setText(source)
+
+    def _render(self, order_id: Optional[str], kind: str) -> Tuple[List[Tuple[str, int, bytes]], str]:
+        """
+        미리보기할 영수증 바이트를 준비합니다.
+
+        Returns:
+            ((종류, 한 줄 문자 수, ESC/POS 바이트) 목록, 출처 설명 또는 오류 메시지)
+        """
+        if order_id is not None:
+            order_data = self.cache.join_order_detail(int(order_id)) if order_id.isdigit() else None
+            if order_data:
+                rendered = self.printer_manager.render_receipt_preview(format_order_for_print(order_data), kind)
+                previews = [(receipt_kind, columns, receipt.data) for receipt_kind, columns, receipt in rendered]
+                return previews, f"[주문 {order_id} / 현재 프린터 설정으로 렌더링]"
+
+        # 로컬 캐시에 없는 주문 (또는 주문 ID 미입력): 실제로 출력되어 보관된 영수증
+        archive = get_receipt_archive()
+        if order_id is None:
+            receipts = [archive.latest()]
+        else:
+            kinds = [k for k in archive.kinds(order_id) if k == kind or k.startswith(kind + ":")]
+            receipts = [archive.get(order_id, k) for k in kinds]
+        receipts = [receipt for receipt in receipts if receipt is not None]
+        if not receipts:
+            if order_id:
+                return [], f"주문 {order_id}의 영수증을 찾을 수 없습니다."
+            return [], "보관된 영수증이 없습니다."
+        columns = PAPER_COLUMNS[DEFAULT_PAPER_WIDTH]
+        latest = max(receipts, key=lambda receipt: receipt.archived_at)
+        archived_at = datetime.fromtimestamp(latest.archived_at).strftime("%Y-%m-%d %H:%M:%S")
+        previews = [(receipt.kind, columns, receipt.data) for receipt in receipts]
+        return previews, f"[주문 {latest.order_id} / {latest.kind} / 보관 {archived_at}]"
+
+    def _show_message(self, message: str) -> None:
+        self.source_label.setText("")
+        self.preview_text.setPlainText(message)
@@ -0,0 +1,132 @@
+# -*- coding: utf-8 -*-
+"""GUI 스레드 멈춤 감시기.
+
+GUI 스레드의 하트비트 타이머가 주기마다 시각을 기록하고, 별도 감시 스레드가 그 시각을 확인합니다.
+하트비트가 임계값 이상 늦어지면 sys._current_frames()로 GUI 스레드의 스택을 채집하고,
+멈춤이 끝나면 걸린 시간과 가장 자주 잡힌 호출 경로(예: fetch_and_store_table, requests.patch,
+print_receipt_esc_usb)를 경고 로그로 남깁니다. 경고 로그는 에러 로깅 시스템을 통해 Supabase에도 전송됩니다.
+이벤트 루프 지연과 멈춤 시간은 운영 지표(src.metrics)에 기록되어 운영 현황 탭에 표시됩니다.
+"""
+import logging
+import sys
+import threading
+import time
+import traceback
+from collections import Counter
+from pathlib import Path
+from typing import List, Optional, Tuple
+
+from PySide6.QtCore import QObject, QTimer
+
+from src.metrics import GUI_LOOP_LATENCY, GUI_STALLS, get_metrics
+
+logger = logging.getLogger(__name__)
+
+HEARTBEAT_MS = 250            # 하트비트 주기
+STALL_THRESHOLD = 0.5         # 하트비트가 이만큼(초) 늦으면 멈춤으로 판단
+LONG_STALL_SECONDS = 5.0      # 멈춤이 끝나기 전에도 진행 중 경고를 남기는 시간
+SAMPLE_INTERVAL = 0.05        # 감시 스레드 확인 주기 (초)
+STACK_DEPTH = 12              # 로그에 남길 스택 프레임 수
+
+_PROJECT_ROOT = str(Path(__file__).resolve().parents[2])
+
+
+def _culprit(stack: traceback.StackSummary) -> str:
+    """스택에서 가장 안쪽의 프로젝트 코드 호출 (없으면 가장 안쪽 프레임)"""
+    for frame in reversed(stack):
+        if frame.filename.startswith(_PROJECT_ROOT) and "stall_watchdog" not in frame.filename:
+            return f"{frame.name} ({Path(frame.filename).name}:{frame.lineno})"
+    frame = stack[-1]
+    return f"{frame.name} ({Path(frame.filename).name}:{frame.lineno})"
+
+
+class GuiStallWatchdog(QObject):
+    """GUI 이벤트 루프 지연을 측정하고 멈춤이 생기면 원인 호출 경로를 기록합니다."""
+
+    def __init__(self, threshold: float = STALL_THRESHOLD, heartbeat_ms: int = HEARTBEAT_MS,
+                 parent: Optional[QObject] = None) -> None:
+        super().__init__(parent)
+        self.threshold = threshold
+        self._interval = heartbeat_ms / 1000.0
+        self._gui_thread_id = threading.get_ident()  # GUI 스레드에서 생성해야 함
+        self._last_beat = time.monotonic()
+        self._timer = QTimer(self)
+        self._timer.setInterval(heartbeat_ms)
+        self._timer.timeout.connect(self._beat)
+        self._shutdown_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> None:
+        """하트비트와 감시 스레드를 시작합니다."""
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._last_beat = time.monotonic()
+        self._timer.start()
+        self._shutdown_event.clear()
+        self._thread = threading.Thread(target=self._monitor_worker, name="GuiStallWatchdog", daemon=True)
+        self._thread.start()
+        logger.info(f"GUI 멈춤 감시 시작 (임계값: {self.threshold:.1f}초)")
+
+    def stop(self) -> None:
+        self._timer.stop()
+        self._shutdown_event.set()
+        if self._thread and self._thread.is_alive():
+            self._thread.join(timeout=1.0)
+        self._thread = None
+
+    # ------------------------------------------------------------------
+    def _beat(self) -> None:
+        """GUI 스레드: 하트비트 시각과 이벤트 루프 지연(예정보다 늦은 시간)을 기록합니다."""
+        now = time.monotonic()
+        get_metrics().observe(GUI_LOOP_LATENCY, max(0.0, now - self._last_beat - self._interval))
+        self._last_beat = now
+
+    def _capture_stack(self) -> Optional[traceback.StackSummary]:
+        frame = sys._current_frames().get(self._gui_thread_id)
+        if frame is None:
+            return None
+        return traceback.extract_stack(frame)
+
+    def _monitor_worker(self) -> None:
+        """감시 스레드: 하트비트가 늦어지면 GUI 스레드 스택을 채집하고 멈춤이 끝나면 보고합니다."""
+        samples: List[Tuple[str, traceback.StackSummary]] = []
+        stall_beat = None       # 멈춤이 시작된 하트비트 시각
+        long_reported = False
+        while not self._shutdown_event.wait(SAMPLE_INTERVAL):
+            last_beat = self._last_beat
+            late = time.monotonic() - last_beat - self._interval
+
+            if stall_beat is not None and last_beat != stall_beat:
+                # 하트비트 재개: 멈춤 종료
+                self._report(time.monotonic() - stall_beat - self._interval, samples)
+                samples, stall_beat, long_reported = [], None, False
+                continue
+            if late < self.threshold:
+                continue
+
+            stack = self._capture_stack()
+            if stack:
+                samples.append((_culprit(stack), stack))
+            if stall_beat is None:
+                stall_beat = last_beat
+            if not long_reported and late >= LONG_STALL_SECONDS:
+                # 멈춤이 끝나지 않고 프로그램이 종료될 수도 있으므로 진행 중에도 남김
+                long_reported = True
+                self._report(late, samples, finished=False)
+
+    def _report(self, duration: float, samples: List[Tuple[str, traceback.StackSummary]],
+                finished: bool = True) -> None:
+        if finished:
+            get_metrics().observe(GUI_STALLS, duration)
+        if not samples:
+            logger.warning(f"GUI 응답 없음 {duration:.2f}초 (스택 채집 실패)")
+            return
+        # 가장 자주 잡힌 호출 경로를 원인으로 보고 (멈춤 중 여러 번 채집)
+        counts = Counter(culprit for culprit, _ in samples)
+        culprit, hits = counts.most_common(1)[0]
+        stack = next(stack for name, stack in samples if name == culprit)
+        stack_text = "".join(traceback.format_list(stack[-STACK_DEPTH:])).rstrip()
+        state = "" if finished else " (진행 중)"
+        logger.warning(
+            f"GUI 응답 없음{state} {duration:.2f}초: {culprit} [{hits}/{len(samples)} 채집]\n{stack_text}"
+        )
@@ -0,0 +1,102 @@
+# -*- coding: utf-8 -*-
+"""화면 갱신 모음 처리기.
+
+동기화, 자동 출력, 수동 출력, 프린터 상태 모니터가 각각 화면을 직접 고치면
+주문이 몰릴 때 같은 틱 안에서도 목록 재조회와 알림 문구 변경이 수십~수백 번 일어납니다.
+이 모듈은 변경 알림만 모아 두었다가 최대 FLUSH_INTERVAL_MS마다 한 번의 묶음으로 반영합니다.
+- 목록 재조회 요청은 한 번으로 합침
+- 주문별 상태 변경은 마지막 값만 유지 (목록 재조회가 있으면 재조회에 포함)
+- 알림 문구는 마지막 것만 표시 (임시 메시지가 일반 메시지보다 우선)
+- 프린터 상태는 프린터별 마지막 값만 유지
+"""
+import logging
+from typing import Any, Dict, NamedTuple, Optional, Tuple
+
+from PySide6.QtCore import QObject, QTimer, Signal
+
+logger = logging.getLogger(__name__)
+
+FLUSH_INTERVAL_MS = 250
+
+
+class Notice(NamedTuple):
+    """알림 문구 (duration_ms가 있으면 그 시간 동안 유지되는 임시 메시지)"""
+    text: str
+    duration_ms: Optional[int] = None
+
+
+class UiUpdateBatch(NamedTuple):
+    """한 번에 반영할 화면 변경 묶음"""
+    refresh: bool
+    statuses: Dict[Any, Tuple[Optional[str], Optional[str]]]  # 주문 ID -> (상태, 출력 상태)
+    notice: Optional[Notice]
+    printer_statuses: Dict[str, Any]                          # 프린터 키 -> PrinterStatus
+
+
+class UiUpdateCoordinator(QObject):
+    """변경 알림을 모아 일정 간격으로 한 번에 반영합니다. (GUI 스레드 전용)"""
+
+    batch_ready = Signal(object)  # UiUpdateBatch
+
+    def __init__(self, interval_ms: int = FLUSH_INTERVAL_MS, parent: Optional[QObject] = None) -> None:
+        super().__init__(parent)
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setInterval(interval_ms)
+        self._timer.timeout.connect(self.flush)
+        self._reset()
+        self.notifications = 0  # 받은 알림 수 (통계)
+        self.flushes = 0        # 실제 반영 횟수 (통계)
+
+    def _reset(self) -> None:
+        self._refresh = False
+        self._statuses: Dict[Any, Tuple[Optional[str], Optional[str]]] = {}
+        self._notice: Optional[Notice] = None
+        self._printer_statuses: Dict[str, Any] = {}
+
+    def _schedule(self) -> None:
+        self.notifications += 1
+        # 이미 예약되어 있으면 그 묶음에 합침 (타이머를 다시 시작하지 않아 최대 지연이 간격 이내)
+        if not self._timer.isActive():
+            self._timer.start()
+
+    # ------------------------------------------------------------------
+    # 변경 알림
+    def request_refresh(self) -> None:
+        """주문 목록을 로컬 캐시에서 다시 읽도록 요청합니다."""
+        self._refresh = True
+        self._schedule()
+
+    def order_status(self, order_id: Any, status: Optional[str] = None, print_status: Optional[str] = None) -> None:
+        """주문 하나의 상태 변경을 알립니다."""
+        previous = self._statuses.get(order_id, (None, None))
+        self._statuses[order_id] = (status or previous[0], print_status or previous[1])
+        self._schedule()
+
+    def notice(self, text: str, duration_ms: Optional[int] = None) -> None:
+        """알림 문구를 표시합니다. 같은 묶음 안에서는 임시 메시지가 일반 메시지보다 우선합니다."""
+        if self._notice is None or duration_ms is not None or self._notice.duration_ms is None:
+            self._notice = Notice(text, duration_ms)
+        self._schedule()
+
+    def printer_status(self, name: str, status: Any) -> None:
+        """프린터 상태 변경을 알립니다."""
+        self._printer_statuses[name] = status
+        self._schedule()
+
+    # ------------------------------------------------------------------
+    def flush(self) -> None:
+        """모인 변경을 한 번에 반영합니다. (타이머 만료 시 호출, 즉시 반영이 필요하면 직접 호출)"""
+        self._timer.stop()
+        batch = UiUpdateBatch(
+            refresh=self._refresh,
+            statuses={} if self._refresh else self._statuses,
+            notice=self._notice,
+            printer_statuses=self._printer_statuses,
+        )
+        self._reset()
+        if not (batch.refresh or batch.statuses or batch.notice or batch.printer_statuses):
+            return
+        self.flushes += 1
+        logger.debug(f"화면 갱신 반영 #{self.flushes} (누적 알림 {self.notifications}건)")
+        self.batch_ready.emit(batch)
@@ -0,0 +1,125 @@
+# -*- coding: utf-8 -*-
+"""프로세스 내 운영 지표 저장소.
+
+출력/동기화 경로에서 이벤트와 측정값을 기록하고, 대시보드가 최근 구간의
+처리량(분당 건수), 지연 백분위수, 오류율, 현재 값(게이지)을 조회합니다.
+지표마다 고정 크기 링 버퍼(deque)에 (시각, 값)만 보관하므로 오래 실행해도 메모리가 늘지 않고,
+기록은 잠금 한 번과 append 한 번이라 출력 경로에 부담이 없습니다.
+"""
+import logging
+import math
+import threading
+import time
+from collections import deque
+from typing import Deque, Dict, Optional, Sequence, Tuple
+
+logger = logging.getLogger(__name__)
+
+MAX_SAMPLES = 4096  # 지표별 최대 보관 수 (점심 피크 1시간 분량 이상)
+
+# 지표 이름
+ORDERS_PRINTED = "orders.printed"          # 출력 완료 주문 (이벤트)
+PRINT_FAILURES = "print.failures"          # 출력 실패 주문 (이벤트)
+PRINT_LATENCY = "print.latency"            # 주문 접수 -> 출력 완료 (초)
+SYNC_ROUND_TRIP = "sync.round_trip"        # 주문 테이블 동기화 왕복 시간 (초)
+SUPABASE_REQUESTS = "supabase.requests"    # Supabase 요청 (이벤트)
+SUPABASE_ERRORS = "supabase.errors"        # Supabase 요청 실패 (이벤트)
+SUPABASE_CONNECTED = "supabase.connected"  # 마지막 요청 성공 여부 (게이지, 1/0)
+UNPRINTED_ORDERS = "queue.unprinted"       # 출력 대기 주문 수 (게이지)
+GUI_LOOP_LATENCY = "gui.loop_latency"      # GUI 이벤트 루프 지연 (초, 하트비트가 늦은 시간)
+GUI_STALLS = "gui.stalls"                  # GUI 멈춤 지속 시간 (초)
+
+
+def percentile(sorted_values: Sequence[float], pct: float) -> float:
+    """정렬된 값의 백분위수 (최근접 순위 방식)"""
+    if not sorted_values:
+        return 0.0
+    rank = max(1, math.ceil(pct / 100 * len(sorted_values)))
+    return sorted_values[min(rank, len(sorted_values)) - 1]
+
+
+class MetricsRegistry:
+    """링 버퍼 기반 시계열 지표 저장소 (스레드 안전)"""
+
+    def __init__(self, max_samples: int = MAX_SAMPLES) -> None:
+        self.max_samples = max_samples
+        self._series: Dict[str, Deque[Tuple[float, float]]] = {}
+        self._gauges: Dict[str, Tuple[float, float]] = {}  # 이름 -> (갱신 시각, 값)
+        self._lock = threading.Lock()
+
+    def _append(self, name: str, value: float) -> None:
+        with self._lock:
+            series = self._series.get(name)
+            if series is None:
+                series = self._series[name] = deque(maxlen=self.max_samples)
+            series.append((time.time(), value))
+
+    # ------------------------------------------------------------------
+    # 기록
+    def increment(self, name: str, count: int = 1) -> None:
+        """이벤트 발생을 기록합니다."""
+        self._append(name, count)
+
+    def observe(self, name: str, value: float) -> None:
+        """측정값(지연 시간 등)을 기록합니다."""
+        self._append(name, value)
+
+    def set_gauge(self, name: str, value: float) -> None:
+        """현재 값을 기록합니다."""
+        with self._lock:
+            self._gauges[name] = (time.time(), value)
+
+    # ------------------------------------------------------------------
+    # 조회
+    def values(self, name: str, window: float) -> list:
+        """최근 window초 동안의 값 목록 (오래된 순)"""
+        since = time.time() - window
+        with self._lock:
+            series = list(self._series.get(name, ()))
+        # 시각 순으로 쌓이므로 뒤에서부터 구간 시작점을 찾음
+        start = len(series)
+        while start > 0 and series[start - 1][0] >= since:
+            start -= 1
+        return [value for _, value in series[start:]]
+
+    def total(self, name: str, window: float) -> float:
+        """최근 window초 동안의 이벤트 수 합계"""
+        return sum(self.values(name, window))
+
+    def rate_per_minute(self, name: str, window: float = 60.0) -> float:
+        """최근 window초 기준 분당 이벤트 수"""
+        return self.total(name, window) * 60.0 / window
+
+    def percentiles(self, name: str, window: float,
+                    pcts: Sequence[float] = (50, 90, 99)) -> Optional[Dict[float, float]]:
+        """최근 window초 측정값의 백분위수 (측정값이 없으면 None)"""
+        values = sorted(self.values(name, window))
+        if not values:
+            return None
+        return {pct: percentile(values, pct) for pct in pcts}
+
+    def gauge(self, name: str) -> Optional[Tuple[float, float]]:
+        """게이지의 (갱신 시각, 값) (기록된 적 없으면 None)"""
+        with self._lock:
+            return self._gauges.get(name)
+
+
+def record_supabase_request(success: bool) -> None:
+    """Supabase 요청 결과를 기록합니다. (오류율, 연결 상태)"""
+    metrics = get_metrics()
+    metrics.increment(SUPABASE_REQUESTS)
+    if not success:
+        metrics.increment(SUPABASE_ERRORS)
+    metrics.set_gauge(SUPABASE_CONNECTED, 1 if success else 0)
+
+
+# 글로벌 지표 저장소
+_metrics: Optional[MetricsRegistry] = None
+
+
+def get_metrics() -> MetricsRegistry:
+    """글로벌 지표 저장소 반환 (없으면 생성)"""
+    global _metrics
+    if _metrics is None:
+        _metrics = MetricsRegistry()
+    return _metrics
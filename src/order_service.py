@@ -0,0 +1,531 @@
+# -*- coding: utf-8 -*-
+"""주문 동기화 / 자동 출력 서비스 (Qt 없음).
+
+Supabase 주문 동기화, 미출력 주문 자동 출력(단건/일괄), 출력 상태 기록(로컬 캐시 + Supabase),
+운영 지표 기록을 담당합니다. GUI(OrderWidget)는 이 서비스 위에 화면만 얹고,
+`main.py --headless`는 PySide6 없이 이 서비스만 주기적으로 실행합니다.
+
+화면 반영이 필요한 변경(주문 상태, 알림 문구, 목록 재조회)은 events 객체로 알립니다.
+GUI는 화면 갱신 모음 처리기(UiUpdateCoordinator)를, 헤드리스 모드는 기본 ServiceEvents(무시)를 넘깁니다.
+"""
+import logging
+import sqlite3
+import threading
+from concurrent.futures import Future
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Optional, Tuple
+
+import requests
+
+from src.database.cache import SupabaseCache
+from src.error_logger import get_error_logger
+from src.metrics import ORDERS_PRINTED, PRINT_FAILURES, PRINT_LATENCY, UNPRINTED_ORDERS, get_metrics, record_supabase_request
+from src.printer.manager import PrinterManager
+
+logger = logging.getLogger(__name__)
+
+UPDATE_INTERVAL_SECONDS = 5  # 미출력 주문 확인 주기
+
+# 수동 동기화 대상 고정 테이블
+STATIC_TABLES = (
+    "company",
+    "menu_category",
+    "menu_item",
+    "menu_item_option_group",
+    "option_group",
+    "option_group_item",
+    "option_item",
+)
+
+
+# 주문 상태 Enum
+class OrderStatus:
+    NEW = "신규"
+    PRINTING = "출력중"
+    PRINTED = "출력완료"
+    PRINT_FAILED = "출력실패"
+
+
+def format_order_for_print(order_data: Dict[str, Any]) -> Dict[str, Any]:
+    """캐시에서 조회한 주문 상세를 프린터 출력 형식으로 변환합니다."""
+    return {
+        "order_id": str(order_data.get("order_id", "N/A")),
+        "company_name": order_data.get("company_name", "N/A"),
+        "created_at": order_data.get("created_at", ""),
+        "is_dine_in": order_data.get("is_dine_in", True),
+        "required_signature": order_data.get("required_signature", False),
+        "signature_data": order_data.get("signature_data"),
+        "items": [
+            {
+                "name": item.get("name", "N/A"),
+                "quantity": item.get("quantity", 1),
+                "price": item.get("price", 0),
+                "category": item.get("category"),
+                "options": item.get("options", [])
+            }
+            for item in order_data.get("items", [])
+        ]
+    }
+
+
+# 프린터 이름 표시용
+PRINTER_LABELS = {
+    "customer": "손님용",
+    "kitchen": "주방용",
+}
+# 그룹 구성원/스테이션 표시용 (예: "customer:카운터2" -> "손님(카운터2)")
+PRINTER_MEMBER_LABELS = {
+    "customer": "손님",
+    "kitchen": "주방",
+}
+
+
+def printer_label(name: str) -> str:
+    """상태 모니터의 프린터 키를 화면 표시용 이름으로 변환합니다. (예: "kitchen:음료" -> "주방(음료)")"""
+    base, _, member = name.partition(":")
+    if member:
+        return f"{PRINTER_MEMBER_LABELS.get(base, base)}({member})"
+    return PRINTER_LABELS.get(name, name)
+
+
+def record_print_metrics(order_data: Dict[str, Any], success: bool) -> None:
+    """자동 출력 결과를 운영 지표에 기록합니다. (성공 시 주문 접수부터 출력까지 걸린 시간 포함)"""
+    metrics = get_metrics()
+    if not success:
+        metrics.increment(PRINT_FAILURES)
+        return
+    metrics.increment(ORDERS_PRINTED)
+    created_at = order_data.get("created_at")
+    if not created_at:
+        return
+    try:
+        created = datetime.fromisoformat(str(created_at).replace('Z', '+00:00'))
+    except ValueError:
+        return
+    now = datetime.now(created.tzinfo) if created.tzinfo else datetime.now()
+    metrics.observe(PRINT_LATENCY, max(0.0, (now - created).total_seconds()))
+
+
+class ServiceEvents:
+    """서비스가 보내는 화면 변경 알림 (기본 구현은 무시, GUI는 UiUpdateCoordinator를 사용)"""
+
+    def request_refresh(self) -> None:
+        pass
+
+    def order_status(self, order_id: Any, status: Optional[str] = None, print_status: Optional[str] = None) -> None:
+        pass
+
+    def notice(self, text: str, duration_ms: Optional[int] = None) -> None:
+        pass
+
+
+class OrderService:
+    """주문 동기화와 자동 출력을 처리합니다."""
+
+    def __init__(self, supabase_config: dict, db_config: dict,
+                 printer_manager: Optional[PrinterManager] = None, events: Any = None) -> None:
+        self.printer_manager = printer_manager or PrinterManager()
+        self.cache = SupabaseCache(db_path=db_config['path'], supabase_config=supabase_config)
+        self.cache.setup_sqlite()
+        self.events = events or ServiceEvents()
+        # 백그라운드로 전송 중인 주방용 영수증 (주문 ID 목록, 주문별 성공 여부)
+        self._kitchen_jobs: List[Tuple[List[Any], "Future[List[bool]]"]] = []
+
+    # ------------------------------------------------------------------
+    # 헤드리스 실행
+    def serve_forever(self, stop_event: threading.Event, interval: float = UPDATE_INTERVAL_SECONDS) -> None:
+        """stop_event가 설정될 때까지 주기적으로 주문을 동기화하고 자동 출력합니다."""
+        # 프린터 상태 변경은 상태 모니터가 로그로 남김
+        self.printer_manager.start_status_monitor()
+        if not self.printer_manager.is_auto_print_enabled():
+            logger.warning("자동 출력이 비활성화되어 있습니다. printer_config.json의 auto_print.enabled를 확인하세요.")
+        try:
+            self.cache.sync_order_tables()
+        except Exception as e:
+            logger.error(f"초기 주문 동기화 실패: {e}")
+        while not stop_event.is_set():
+            self.check_for_updates()
+            stop_event.wait(interval)
+
+    # ------------------------------------------------------------------
+    # 자동 출력
+    def check_for_updates(self) -> None:
+        """미출력 주문을 확인하고 자동 출력을 처리합니다."""
+        self._report_kitchen_results()
+        try:
+            # 자동 출력이 비활성화된 경우 처리하지 않음
+            auto_print_enabled = self.printer_manager.is_auto_print_enabled()
+            logger.debug(f"check_for_updates 호출됨 - 자동출력 활성화: {auto_print_enabled}")
+
+            if not auto_print_enabled:
+                logger.debug("자동 출력이 비활성화되어 있어 처리하지 않음")
+                return
+
+            # 주문 관련 테이블 동기화 (항상 수행, 검색 색인 포함)
+            self.cache.sync_order_tables()
+
+            # 미출력 주문들 가져오기
+            auto_print_config = self.printer_manager.get_auto_print_config()
+            batch_size = auto_print_config.get("batch_size", 20)
+            unprinteed_orders = self.get_unprinteed_orders(limit=batch_size)
+            get_metrics().set_gauge(UNPRINTED_ORDERS, self.cache.count_unprinted_orders())
+            logger.info(f"미출력 주문 조회 결과: {len(unprinteed_orders)}개")
+
+            if not unprinteed_orders:
+                # 미출력 주문이 없으면 조용히 처리
+                return
+
+            logger.info(f"미출력 주문 {len(unprinteed_orders)}개를 확인했습니다.")
+            for order in unprinteed_orders:
+                logger.info(f"미출력 주문 발견: ID={order.get('order_id')}, 회사={order.get('company_name')}")
+
+            # 임시 메시지가 표시 중이 아닐 때만 미출력 주문 메시지 표시
+            self.events.notice(f"미출력 주문 {len(unprinteed_orders)}개 발견")
+
+            # 주문이 밀려 있으면 일괄 출력 (프린터별 단일 세션, 상태 일괄 갱신)
+            if len(unprinteed_orders) >= auto_print_config.get("batch_threshold", 2):
+                if self.printer_manager.check_printer_status():
+                    self.process_auto_print_batch(unprinteed_orders)
+                else:
+                    logger.warning("프린터 상태 불량으로 일괄 출력 보류")
+                self.events.request_refresh()
+                return
+
+            # 각 미출력 주문에 대해 자동 출력 처리
+            for order in unprinteed_orders:
+                order_detail = self.cache.join_order_detail(order["order_id"])
+                order_id = order_detail.get("order_id")
+
+                logger.info(f"주문 {order_id} 자동 출력 시도")
+
+                # 프린터 상태 확인 (상태 모니터 캐시 조회)
+                if not self.printer_manager.check_printer_status():
+                    logger.warning(f"주문 {order_id}: 프린터 상태 불량으로 남은 주문 출력 보류")
+                    break
+
+                # 자동 출력 처리
+                success = self.process_auto_print(order_detail)
+                record_print_metrics(order_detail, success)
+
+                if success:
+                    logger.info(f"주문 {order_id} 자동 출력 성공")
+                    # 출력 성공 시 is_printed 상태 업데이트
+                    self.update_is_printed_status(order_id, True)
+                else:
+                    logger.warning(f"주문 {order_id} 자동 출력 실패")
+
+            # UI 새로고침 (방금 동기화한 로컬 캐시에서 다시 읽기, 다음 반영 시점에 한 번만)
+            self.events.request_refresh()
+
+        except Exception as e:
+            logger.error(f"자동 출력 처리 오류: {e}")
+            self.events.notice("자동 출력 처리 중 오류가 발생했습니다.")
+            # Supabase에도 에러 로깅
+            error_logger = get_error_logger()
+            if error_logger:
+                error_logger.log_error(e, "자동 출력 처리 오류", {"context": "auto_print_processing"})
+
+    def get_unprinteed_orders(self, limit: int = 10) -> List[Dict[str, Any]]:
+        """출력되지 않은 주문들을 가져옵니다."""
+        conn = sqlite3.connect(self.cache.db_path)
+        conn.row_factory = sqlite3.Row
+        cursor = conn.cursor()
+
+        # is_printed가 0(False)인 주문들을 최신순으로 가져오기
+        query = """
+        SELECT o.order_id, o.company_id, o.is_dine_in, o.total_price, o.created_at,
+               c.company_name
+        FROM "order" o
+        JOIN company c ON c.company_id = o.company_id
+        WHERE o.is_printed = 0
+        ORDER BY o.created_at DESC
+        LIMIT ?
+        """
+
+        rows = cursor.execute(query, (limit,)).fetchall()
+        conn.close()
+        return [dict(row) for row in rows]
+
+    def process_auto_print(self, order_data: dict) -> bool:
+        """자동 출력을 처리합니다."""
+        order_id = order_data.get("order_id")
+
+        try:
+            # 이미 출력된 주문인지 확인
+            if order_data.get("is_printed", False):
+                logger.info(f"주문 {order_id}: 이미 출력됨")
+                return True
+
+            # 출력 상태를 "출력중"으로 변경 (print_status는 별도 관리)
+            self.update_order_status(order_id, OrderStatus.PRINTING)
+
+            # 주문 데이터 형식 변환
+            formatted_order = format_order_for_print(order_data)
+
+            # 손님용은 바로 출력하고 주방용은 백그라운드로 전송 (주방 결과는 다음 확인 때 알림)
+            self._dispatch_kitchen([order_id], [formatted_order])
+            customer_success = self.printer_manager.print_customer_receipt(formatted_order)
+
+            # 손님용 프린터만 성공해도 주문을 완료로 처리
+            if customer_success:
+                self.update_order_status(order_id, OrderStatus.PRINTED)
+                logger.info(f"주문 {order_id} 자동 출력 성공 (손님용, 주방용 전송 중)")
+                self.events.notice(f"주문 {order_id}이(가) 자동으로 출력되었습니다.")
+                return True
+
+            self.update_order_status(order_id, OrderStatus.PRINT_FAILED)
+            logger.error(f"주문 {order_id} 손님용 자동 출력 실패")
+            self.events.notice(f"주문 {order_id} 자동 출력 실패")
+            return False
+
+        except Exception as e:
+            logger.error(f"자동 출력 처리 오류: {e}")
+            self.update_order_status(order_id, OrderStatus.PRINT_FAILED)
+            # Supabase에도 에러 로깅
+            error_logger = get_error_logger()
+            if error_logger:
+                error_logger.log_printer_error(
+                    printer_type="auto_print",
+                    error=e,
+                    order_id=str(order_id)
+                )
+            return False
+
+    def process_auto_print_batch(self, orders: List[Dict[str, Any]]) -> List[int]:
+        """밀린 주문들을 한 번의 프린터 세션으로 출력하고 상태를 일괄 갱신합니다.
+
+        Returns:
+            List[int]: 출력 완료 처리된 주문 ID 목록
+        """
+        # 오래된 주문부터 출력
+        details = [self.cache.join_order_detail(order["order_id"]) for order in reversed(orders)]
+        details = [detail for detail in details if detail and not detail.get("is_printed", False)]
+        if not details:
+            return []
+
+        order_ids = [detail["order_id"] for detail in details]
+        logger.info(f"미출력 주문 {len(order_ids)}개 일괄 출력 시작: {order_ids}")
+        self.update_order_status_batch(order_ids, OrderStatus.PRINTING)
+
+        try:
+            formatted = [format_order_for_print(detail) for detail in details]
+            # 주방용은 백그라운드로 전송 (주방 결과는 다음 확인 때 알림)
+            self._dispatch_kitchen(order_ids, formatted)
+            results = self.printer_manager.print_customer_receipts_batch(formatted)
+        except Exception as e:
+            logger.error(f"일괄 출력 처리 오류: {e}")
+            error_logger = get_error_logger()
+            if error_logger:
+                error_logger.log_printer_error(printer_type="auto_print_batch", error=e)
+            self.update_order_status_batch(order_ids, OrderStatus.PRINT_FAILED)
+            for detail in details:
+                record_print_metrics(detail, False)
+            return []
+
+        # 손님용 프린터만 성공해도 주문을 완료로 처리 (단건 자동 출력과 동일)
+        printed_ids = [order_id for order_id, success in zip(order_ids, results) if success]
+        failed_ids = [order_id for order_id, success in zip(order_ids, results) if not success]
+
+        self.update_print_results_batch(printed_ids, failed_ids)
+        for detail, success in zip(details, results):
+            record_print_metrics(detail, success)
+
+        message = f"주문 {len(printed_ids)}개 일괄 출력 완료"
+        if failed_ids:
+            message += f", 실패 {len(failed_ids)}개"
+        logger.info(f"{message}: 성공={printed_ids}, 실패={failed_ids}")
+        self.events.notice(message)
+        return printed_ids
+
+    def _dispatch_kitchen(self, order_ids: List[Any], orders: List[Dict[str, Any]]) -> None:
+        """주방용 영수증 전송을 시작합니다. 전송하는 동안 호출한 스레드(GUI 등)는 막히지 않습니다."""
+        try:
+            self._kitchen_jobs.append((order_ids, self.printer_manager.print_kitchen_receipts_async(orders)))
+        except Exception as e:
+            logger.error(f"주방용 영수증 전송 시작 오류: {e}")
+            self.events.notice(f"주문 {', '.join(str(order_id) for order_id in order_ids)} 주방용 출력 실패")
+
+    def _report_kitchen_results(self) -> None:
+        """끝난 주방용 전송의 실패를 알립니다. (events는 이 서비스를 실행하는 스레드에서만 사용)"""
+        pending = []
+        failed_ids = []
+        for order_ids, future in self._kitchen_jobs:
+            if not future.done():
+                pending.append((order_ids, future))
+                continue
+            try:
+                results = future.result()
+            except Exception as e:
+                logger.error(f"주방용 영수증 전송 오류: {e}")
+                results = [False] * len(order_ids)
+            failed_ids.extend(order_id for order_id, success in zip(order_ids, results) if not success)
+        self._kitchen_jobs = pending
+
+        if failed_ids:
+            logger.warning(f"주방용 출력 실패 주문: {failed_ids}")
+            self.events.notice(f"주문 {', '.join(str(order_id) for order_id in failed_ids)} 주방용 출력 실패")
+
+    def should_retry_print(self, order_data: dict) -> bool:
+        """재시도가 필요한지 확인합니다."""
+        if order_data.get("print_status") != OrderStatus.NEW:
+            return False
+
+        last_attempt = order_data.get("last_print_attempt")
+        if not last_attempt:
+            return True
+
+        try:
+            last_attempt_time = datetime.fromisoformat(last_attempt)
+            retry_interval = self.printer_manager.get_auto_print_config().get("retry_interval", 30)
+            return datetime.now() >= last_attempt_time + timedelta(seconds=retry_interval)
+        except Exception:
+            return True
+
+    # ------------------------------------------------------------------
+    # 출력 상태 기록
+    def update_order_status(self, order_id: int, status: str, print_attempts: int = None) -> None:
+        """주문 상태를 업데이트합니다."""
+        try:
+            with sqlite3.connect(self.cache.db_path) as conn:
+                cursor = conn.cursor()
+
+                # 현재 시간
+                now = datetime.now().isoformat()
+
+                if print_attempts is not None:
+                    cursor.execute(
+                        'UPDATE "order" SET print_status = ?, print_attempts = ?, last_print_attempt = ? WHERE order_id = ?',
+                        (status, print_attempts, now, order_id)
+                    )
+                else:
+                    cursor.execute(
+                        'UPDATE "order" SET print_status = ?, last_print_attempt = ? WHERE order_id = ?',
+                        (status, now, order_id)
+                    )
+
+                conn.commit()
+                logger.info(f"주문 {order_id}의 상태를 {status}로 업데이트")
+                self.events.order_status(order_id, print_status=status)
+
+                # Supabase에도 상태 업데이트 시도
+                if self.cache.base_url and status == OrderStatus.PRINTED:
+                    try:
+                        response = requests.patch(
+                            f"{self.cache.base_url}/rest/v1/order",
+                            headers=self.cache.headers,
+                            json={"is_printed": True},
+                            params={"order_id": f"eq.{order_id}"}
+                        )
+                        response.raise_for_status()
+                        record_supabase_request(True)
+                    except Exception as e:
+                        record_supabase_request(False)
+                        logger.error(f"Supabase 업데이트 실패: {e}")
+
+        except Exception as e:
+            logger.error(f"주문 상태 업데이트 오류: {e}")
+
+    def update_is_printed_status(self, order_id: int, is_printed: bool) -> None:
+        """주문의 출력 상태를 업데이트합니다."""
+        try:
+            # 로컬 DB 업데이트
+            with sqlite3.connect(self.cache.db_path) as conn:
+                cursor = conn.cursor()
+                cursor.execute(
+                    'UPDATE "order" SET is_printed = ? WHERE order_id = ?',
+                    (1 if is_printed else 0, order_id)
+                )
+                conn.commit()
+                logger.info(f"주문 {order_id}의 출력 상태를 {is_printed}로 업데이트")
+                self.events.order_status(order_id, status="출력완료" if is_printed else OrderStatus.NEW)
+
+            # Supabase에도 업데이트 시도
+            if self.cache.base_url:
+                try:
+                    response = requests.patch(
+                        f"{self.cache.base_url}/rest/v1/order",
+                        headers=self.cache.headers,
+                        json={"is_printed": is_printed},
+                        params={"order_id": f"eq.{order_id}"}
+                    )
+                    response.raise_for_status()
+                    record_supabase_request(True)
+                    logger.info(f"Supabase에 주문 {order_id} 출력 상태 업데이트 성공")
+                except Exception as e:
+                    record_supabase_request(False)
+                    logger.error(f"Supabase 출력 상태 업데이트 실패: {e}")
+
+        except Exception as e:
+            logger.error(f"출력 상태 업데이트 오류: {e}")
+
+    def update_order_status_batch(self, order_ids: List[int], status: str) -> None:
+        """여러 주문의 출력 상태를 한 번의 트랜잭션으로 업데이트합니다. (로컬 DB만)"""
+        if not order_ids:
+            return
+        try:
+            now = datetime.now().isoformat()
+            with sqlite3.connect(self.cache.db_path) as conn:
+                conn.executemany(
+                    'UPDATE "order" SET print_status = ?, last_print_attempt = ? WHERE order_id = ?',
+                    [(status, now, order_id) for order_id in order_ids]
+                )
+            logger.info(f"주문 {len(order_ids)}개의 상태를 {status}로 업데이트")
+            for order_id in order_ids:
+                self.events.order_status(order_id, print_status=status)
+        except Exception as e:
+            logger.error(f"주문 상태 일괄 업데이트 오류: {e}")
+
+    def update_print_results_batch(self, printed_ids: List[int], failed_ids: List[int]) -> None:
+        """일괄 출력 결과를 로컬 DB에 반영하고 Supabase에는 한 번의 요청으로 전송합니다."""
+        try:
+            now = datetime.now().isoformat()
+            with sqlite3.connect(self.cache.db_path) as conn:
+                conn.executemany(
+                    'UPDATE "order" SET print_status = ?, is_printed = 1, last_print_attempt = ? WHERE order_id = ?',
+                    [(OrderStatus.PRINTED, now, order_id) for order_id in printed_ids]
+                )
+                conn.executemany(
+                    'UPDATE "order" SET print_status = ?, last_print_attempt = ? WHERE order_id = ?',
+                    [(OrderStatus.PRINT_FAILED, now, order_id) for order_id in failed_ids]
+                )
+            for order_id in printed_ids:
+                self.events.order_status(order_id, "출력완료", OrderStatus.PRINTED)
+            for order_id in failed_ids:
+                self.events.order_status(order_id, print_status=OrderStatus.PRINT_FAILED)
+        except Exception as e:
+            logger.error(f"출력 결과 일괄 업데이트 오류: {e}")
+
+        if self.cache.base_url and printed_ids:
+            try:
+                response = requests.patch(
+                    f"{self.cache.base_url}/rest/v1/order",
+                    headers=self.cache.headers,
+                    json={"is_printed": True},
+                    params={"order_id": f"in.({','.join(str(order_id) for order_id in printed_ids)})"},
+                    timeout=10
+                )
+                response.raise_for_status()
+                record_supabase_request(True)
+                logger.info(f"Supabase에 주문 {len(printed_ids)}개 출력 상태 일괄 업데이트 성공")
+            except Exception as e:
+                record_supabase_request(False)
+                logger.error(f"Supabase 출력 상태 일괄 업데이트 실패: {e}")
+
+    # ------------------------------------------------------------------
+    # 고정 데이터
+    def sync_static_tables(self) -> List[str]:
+        """고정 테이블을 동기화하고 변경 내역 목록을 반환합니다."""
+        changes = []
+        for table in STATIC_TABLES:
+            old_data = self.cache.get_table_data(table)
+            self.cache.fetch_and_store_table(table)
+            new_data = self.cache.get_table_data(table)
+
+            # 변경사항 확인
+            if old_data != new_data:
+                changes.append(f"{table}: {len(new_data) - len(old_data)}개 항목 변경")
+
+        if changes:
+            # 회사/메뉴/옵션 이름이 바뀌었을 수 있으므로 검색 색인 전체 재구성
+            self.cache.update_search_index(full=True)
+        return changes
@@ -2,11 +2,50 @@
 """COM 포트 시리얼 프린터 출력 모듈."""
 import serial
 import logging
-from typing import Dict, Any
-from src.printer.receipt_template import format_receipt_string
+from functools import partial
+from typing import Dict, Any, List, Optional
+from src.printer.receipt_template import render_customer_receipt
+from src.printer.escpos_renderer import DEFAULT_COLUMNS, ReceiptDocument, render_text
+from src.printer.render_cache import RenderedReceipt, get_render_cache
+from src.printer.status_monitor import PrinterStatus, get_device_lock, query_realtime_status
 
 logger = logging.getLogger(__name__)
 
+def serial_device_key(com_port: str) -> str:
+    """시리얼 프린터의 장치 잠금 키를 반환합니다."""
+    return f"com:{com_port.upper()}"
+
+def probe_serial_status(com_port: str = "COM3", baudrate: int = 9600):
+    """
+    COM 포트 프린터의 실시간 상태(DLE EOT)를 조회합니다.
+    
+    Args:
+        com_port: COM 포트
+        baudrate: 통신 속도
+        
+    Returns:
+        PrinterStatus: 조회된 상태 (출력 중이라 포트를 사용할 수 없으면 None)
+    """
+    device_key = serial_device_key(com_port)
+    lock = get_device_lock(device_key)
+    if not lock.acquire(blocking=False):
+        return None  # 출력 중에는 조회하지 않음
+    try:
+        with serial.Serial(com_port, baudrate, timeout=0.5, write_timeout=1) as ser:
+            ser.reset_input_buffer()
+
+            def read_byte():
+                data = ser.read(1)
+                return data[0] if data else None
+
+            # 시리얼 포트는 프린터가 꺼져 있어도 열리므로 응답 이력으로 연결 여부 판단
+            return query_realtime_status(ser.write, read_byte, device_key)
+    except Exception as e:
+        logger.debug(f"COM 포트 {com_port} 상태 조회 실패: {e}")
+        return PrinterStatus(reachable=False, message="포트 연결 실패")
+    finally:
+        lock.release()
+
 def print_receipt_com(order_data: Dict[str, Any], com_port: str = "COM3", baudrate: int = 9600, timeout: int = 5) -> bool:
     """
     COM 포트를 통해 시리얼 프린터로 영수증을 출력합니다.
@@ -23,43 +62,22 @@ def print_receipt_com(order_data: Dict[str, Any], com_port: str = "COM3", baudra
     try:
         logger.info(f"COM 포트 프린터 출력 시작: {com_port}")
         
-        # 영수증 텍스트 생성
-        receipt_text = format_receipt_string(order_data)
+        # 영수증 바이트 생성 (초기화/스타일/컷 명령 포함, 재출력 시 캐시 사용)
+        receipt_bytes = render_customer_receipt(order_data).data
         
-        # 시리얼 포트 연결
-        with serial.Serial(com_port, baudrate, timeout=timeout) as ser:
+        # 시리얼 포트 연결 (상태 조회와 겹치지 않도록 장치 잠금)
+        with get_device_lock(serial_device_key(com_port)), serial.Serial(com_port, baudrate, timeout=timeout) as ser:
             if not ser.is_open:
                 logger.error(f"COM 포트 {com_port} 열기 실패")
                 return False
                 
             logger.info(f"COM 포트 {com_port} 연결 성공")
             
-            # 텍스트를 바이트로 변환하여 전송
-            # 한글 인코딩 처리 (CP949 또는 UTF-8)
-            try:
-                receipt_bytes = receipt_text.encode('cp949')
-            except UnicodeEncodeError:
-                # CP949로 인코딩할 수 없는 경우 UTF-8 사용
-                receipt_bytes = receipt_text.encode('utf-8')
-            
-            # 프린터 제어 명령어 추가 (ESC/POS 호환)
-            esc_commands = b'\x1b\x40'  # 프린터 초기화
-            esc_commands += b'\x1b\x61\x00'  # 왼쪽 정렬
-            esc_commands += b'\x1b\x45\x01'  # 볼드체 켜기
-            esc_commands += b'\x1d\x21\x11'  # 가로/세로 2배 크기
-            
-            # 제어 명령어 + 영수증 내용 + 용지 컷팅 명령어
-            # 출력 후 볼드 및 크기 리셋
-            reset_commands = b'\x1b\x45\x00'  # 볼드체 끄기
-            reset_commands += b'\x1d\x21\x00'  # 정상 크기로 복원
-            
-            full_data = esc_commands + receipt_bytes + reset_commands + b'\x1d\x56\x00'  # 부분 컷팅
-            
             # 데이터 전송
-            ser.write(full_data)
+            ser.write(receipt_bytes)
             ser.flush()  # 버퍼 플러시
             
-            logger.info(f"COM 포트 {com_port}로 영수증 출력 완료 (볼드체, 큰 글자)")
+            logger.info(f"COM 포트 {com_port}로 영수증 출력 완료 ({len(receipt_bytes)} bytes)")
             return True
             
     except serial.SerialException as e:
@@ -81,7 +99,7 @@ def test_com_printer(com_port: str = "COM3", baudrate: int = 9600) -> bool:
         bool: 연결 테스트 성공 여부
     """
     try:
-        with serial.Serial(com_port, baudrate, timeout=2) as ser:
+        with get_device_lock(serial_device_key(com_port)), serial.Serial(com_port, baudrate, timeout=2) as ser:
             if ser.is_open:
                 # 간단한 테스트 메시지 전송 (볼드, 큰 글자로)
                 esc_commands = b'\x1b\x40'  # 초기화
@@ -107,54 +125,80 @@ def test_com_printer(com_port: str = "COM3", baudrate: int = 9600) -> bool:
         logger.error(f"COM 포트 {com_port} 연결 테스트 실패: {e}")
         return False
 
-def format_kitchen_receipt(order_data: Dict[str, Any]) -> str:
+def build_kitchen_document(order_data: Dict[str, Any], order_barcode: bool = False) -> ReceiptDocument:
     """
-    주방용 영수증 포맷 (간소화된 버전)
+    주방용 영수증 문서 구성 (간소화된 버전, 볼드체 2배 크기)
     
     Args:
         order_data: 주문 데이터
+        order_barcode: 주문번호 바코드 출력 여부 (완료 처리 스캔용)
         
     Returns:
-        str: 주방용 영수증 텍스트
+        ReceiptDocument: 주방용 영수증 문서
     """
-    lines = []
+    doc = ReceiptDocument()
+    style = {"width": 2, "height": 2, "bold": True}
     
     # 헤더
-    lines.append("=== 주방 주문서 ===")
-    lines.append("")
+    doc.text("=== 주방 주문서 ===", **style)
+    station = order_data.get('station')
+    if station:
+        doc.text(f"[{station}]", **style)
+    doc.feed()
     
     # 주문 정보
     order_id = order_data.get('order_id', 'N/A')
     created_at = order_data.get('created_at', '')
     is_dine_in = order_data.get('is_dine_in', True)
     
-    lines.append(f"주문번호: {order_id}")
-    lines.append(f"주문시간: {created_at}")
-    lines.append(f"주문유형: {'매장식사' if is_dine_in else '포장'}")
-    lines.append("")
-    lines.append("-" * 30)
+    doc.text(f"주문번호: {order_id}", **style)
+    doc.text(f"주문시간: {created_at}", **style)
+    doc.text(f"주문유형: {'매장식사' if is_dine_in else '포장'}", **style)
+    doc.feed()
+    doc.separator(**style)
     
     # 메뉴 항목 (주방에서 필요한 정보만)
     for item in order_data.get("items", []):
         name = item.get("name", "N/A")
         qty = item.get("quantity", 0)
         
-        lines.append(f"[{qty}개] {name}")
+        doc.text(f"[{qty}개] {name}", **style)
         
         # 옵션 정보
         for opt in item.get("options", []):
-            lines.append(f"  + {opt['name']}")
+            doc.text(f"  + {opt['name']}", **style)
         
-        lines.append("")  # 아이템 간 간격
+        doc.feed()  # 아이템 간 간격
     
-    lines.append("-" * 30)
-    lines.append("주방에서 확인 완료")
-    lines.append("")
-    lines.append("")  # 추가 공백
+    doc.separator(**style)
+    if order_barcode and str(order_id).isascii():
+        doc.barcode(str(order_id))
+    doc.text("주방에서 확인 완료", **style)
+    doc.feed(3)  # 추가 공백
+    doc.cut()
     
-    return "\n".join(lines)
+    return doc
 
-def print_kitchen_receipt_com(order_data: Dict[str, Any], com_port: str = "COM3", baudrate: int = 9600) -> bool:
+def format_kitchen_receipt(order_data: Dict[str, Any]) -> str:
+    """
+    주방용 영수증 포맷 (일반 텍스트)
+    
+    Args:
+        order_data: 주문 데이터
+        
+    Returns:
+        str: 주방용 영수증 텍스트
+    """
+    return render_text(build_kitchen_document(order_data))
+
+def render_kitchen_receipt(order_data: Dict[str, Any], columns: int = DEFAULT_COLUMNS,
+                           order_barcode: bool = False) -> RenderedReceipt:
+    """주방용 영수증을 렌더링합니다. 같은 주문의 재출력은 캐시된 결과를 사용합니다."""
+    build = partial(build_kitchen_document, order_barcode=order_barcode)
+    return get_render_cache().render("kitchen", order_data, build, columns=columns, variant=order_barcode)
+
+def print_kitchen_receipt_com(order_data: Dict[str, Any], com_port: str = "COM3", baudrate: int = 9600,
+                              columns: int = DEFAULT_COLUMNS) -> bool:
     """
     주방용 영수증을 COM 포트로 출력합니다.
     
@@ -162,6 +206,7 @@ def print_kitchen_receipt_com(order_data: Dict[str, Any], com_port: str = "COM3"
         order_data: 주문 데이터
         com_port: COM 포트
         baudrate: 통신 속도
+        columns: 용지 폭에 따른 한 줄 문자 수
         
     Returns:
         bool: 출력 성공 여부
@@ -169,42 +214,62 @@ def print_kitchen_receipt_com(order_data: Dict[str, Any], com_port: str = "COM3"
     try:
         logger.info(f"주방용 영수증 COM 포트 출력 시작: {com_port}")
         
-        # 주방용 영수증 포맷으로 생성
-        receipt_text = format_kitchen_receipt(order_data)
+        # 주방용 영수증 바이트 생성 (볼드, 큰 글자)
+        receipt_bytes = render_kitchen_receipt(order_data, columns).data
         
-        # 시리얼 포트 연결 및 출력
-        with serial.Serial(com_port, baudrate, timeout=5) as ser:
+        # 시리얼 포트 연결 및 출력 (상태 조회와 겹치지 않도록 장치 잠금)
+        with get_device_lock(serial_device_key(com_port)), serial.Serial(com_port, baudrate, timeout=5) as ser:
             if not ser.is_open:
                 logger.error(f"주방 프린터 COM 포트 {com_port} 열기 실패")
                 return False
             
-            # 텍스트 인코딩
-            try:
-                receipt_bytes = receipt_text.encode('cp949')
-            except UnicodeEncodeError:
-                receipt_bytes = receipt_text.encode('utf-8')
-            
-            # ESC/POS 명령어 (주방용도 볼드, 큰 글자로)
-            esc_commands = b'\x1b\x40'  # 초기화
-            esc_commands += b'\x1b\x61\x00'  # 왼쪽 정렬
-            esc_commands += b'\x1b\x45\x01'  # 볼드체 켜기
-            esc_commands += b'\x1d\x21\x11'  # 가로/세로 2배 크기
-            
-            # 출력 후 리셋
-            reset_commands = b'\x1b\x45\x00'  # 볼드체 끄기
-            reset_commands += b'\x1d\x21\x00'  # 정상 크기로 복원
-            
-            # 전체 데이터
-            full_data = esc_commands + receipt_bytes + reset_commands + b'\x1d\x56\x00'  # 부분 컷팅
-            
             # 데이터 전송
-            ser.write(full_data)
+            ser.write(receipt_bytes)
             ser.flush()
-            print(full_data)
             
-            logger.info(f"주방용 영수증 COM 포트 {com_port} 출력 완료 (볼드체, 큰 글자)")
+            logger.info(f"주방용 영수증 COM 포트 {com_port} 출력 완료 ({len(receipt_bytes)} bytes)")
             return True
             
     except Exception as e:
         logger.error(f"주방용 영수증 COM 포트 출력 오류 ({com_port}): {e}")
-        return False 
\ No newline at end of file
+        return False 
+
+def print_kitchen_receipts_com_batch(orders: List[Dict[str, Any]], com_port: str = "COM3", baudrate: int = 9600,
+                                     columns: int = DEFAULT_COLUMNS,
+                                     rendered_list: Optional[List[RenderedReceipt]] = None) -> List[bool]:
+    """
+    여러 주문의 주방용 영수증을 한 번의 COM 포트 세션으로 연속 출력합니다.
+    
+    Args:
+        orders: 주문 데이터 목록
+        com_port: COM 포트
+        baudrate: 통신 속도
+        columns: 용지 폭에 따른 한 줄 문자 수
+        rendered_list: 미리 렌더링된 영수증 목록 (없으면 렌더링)
+        
+    Returns:
+        List[bool]: 주문별 출력 성공 여부
+    """
+    results = [False] * len(orders)
+    if not orders:
+        return results
+
+    try:
+        if rendered_list is None:
+            rendered_list = [render_kitchen_receipt(order, columns) for order in orders]
+        
+        with get_device_lock(serial_device_key(com_port)), serial.Serial(com_port, baudrate, timeout=5) as ser:
+            if not ser.is_open:
+                logger.error(f"주방 프린터 COM 포트 {com_port} 열기 실패")
+                return results
+            
+            for index, rendered in enumerate(rendered_list):
+                ser.write(rendered.data)
+                results[index] = True
+            ser.flush()  # 마지막에 한 번만 플러시
+            
+    except Exception as e:
+        logger.error(f"주방용 영수증 일괄 출력 오류 ({com_port}): {e}")
+    
+    logger.info(f"주방용 영수증 일괄 출력 완료: {sum(results)}/{len(orders)}건 ({com_port})")
+    return results
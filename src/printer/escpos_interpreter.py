@@ -0,0 +1,209 @@
+# -*- coding: utf-8 -*-
+"""ESC/POS 바이트 스트림 해석기 (미리보기용).
+
+렌더러가 만든 바이트를 프린터처럼 해석하여 줄 단위 미리보기 구조로 변환합니다.
+정렬(ESC a), 볼드(ESC E / ESC !), 글자 배율(GS !), 용지 컷(GS V), 바코드(GS k),
+QR 코드(GS ( k), NV 그래픽(GS ( L), 래스터 이미지(GS v 0)를 인식하고, 나머지 명령은 길이만큼 건너뜁니다.
+텍스트는 제어 바이트 사이의 구간 단위로 한 번에 디코딩합니다. (바이트 단위 반복 없음)
+"""
+import logging
+import re
+from typing import List, NamedTuple, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+ALIGNMENTS = ("left", "center", "right")
+
+# 텍스트가 아닌 바이트 (cp949 두 번째 바이트는 0x41 이상이므로 한글과 겹치지 않음)
+_CONTROL = re.compile(rb"[\x00-\x1f\x7f]")
+
+ESC, GS, FS, LF = 0x1b, 0x1d, 0x1c, 0x0a
+# 인자 바이트 수가 고정된 명령 (무시하고 건너뜀)
+_ESC_PARAMS = {0x2d: 1, 0x32: 0, 0x33: 1, 0x4a: 1, 0x4d: 1, 0x52: 1, 0x74: 1, 0x7b: 1, 0x20: 1, 0x47: 1, 0x56: 1}
+_GS_PARAMS = {0x48: 1, 0x66: 1, 0x68: 1, 0x77: 1, 0x42: 1, 0x4c: 2, 0x57: 2}
+
+
+class PreviewRun(NamedTuple):
+    """같은 스타일의 텍스트 구간"""
+    text: str
+    bold: bool
+    width: int
+    height: int
+
+
+class PreviewLine(NamedTuple):
+    """미리보기 한 줄
+
+    kind: "text", "cut", "barcode", "qrcode", "graphic"(NV 로고), "image"(래스터)
+    image: 래스터 이미지의 (가로 dots, 세로 dots, 행 우선 1비트 데이터)
+    """
+    kind: str
+    align: str
+    runs: Tuple[PreviewRun, ...] = ()
+    data: str = ""
+    image: Optional[Tuple[int, int, bytes]] = None
+
+    @property
+    def text(self) -> str:
+        return "".join(run.text for run in self.runs)
+
+
+class EscposInterpreter:
+    """ESC/POS 명령을 해석하며 현재 프린터 모드와 줄을 추적합니다."""
+
+    def __init__(self, encoding: str = "cp949") -> None:
+        self.encoding = encoding
+        self.lines: List[PreviewLine] = []
+        self._runs: List[PreviewRun] = []
+        self._qr_data = ""
+        self._reset_mode()
+
+    def _reset_mode(self) -> None:
+        self.align = "left"
+        self.bold = False
+        self.width = 1
+        self.height = 1
+
+    # ------------------------------------------------------------------
+    def _text(self, chunk: bytes) -> None:
+        if not chunk:
+            return
+        text = chunk.decode(self.encoding, errors="replace")
+        runs = self._runs
+        if runs and (runs[-1].bold, runs[-1].width, runs[-1].height) == (self.bold, self.width, self.height):
+            runs[-1] = runs[-1]._replace(text=runs[-1].text + text)
+        else:
+            runs.append(PreviewRun(text, self.bold, self.width, self.height))
+
+    def _end_line(self) -> None:
+        self.lines.append(PreviewLine("text", self.align, tuple(self._runs)))
+        self._runs = []
+
+    def _element(self, kind: str, data: str = "", image: Optional[Tuple[int, int, bytes]] = None) -> None:
+        # 인쇄 중이던 텍스트가 있으면 먼저 줄로 내보냄 (프린터도 그래픽 전에 줄을 비움)
+        if self._runs:
+            self._end_line()
+        last = self.lines[-1] if self.lines else None
+        if kind == "image" and last is not None and last.kind == "image" and last.image[0] == image[0]:
+            # 전송 단위로 나뉜 래스터 띠는 한 이미지로 합침
+            width, height, raster = last.image
+            self.lines[-1] = last._replace(image=(width, height + image[1], raster + image[2]))
+            return
+        self.lines.append(PreviewLine(kind, self.align, data=data, image=image))
+
+    # ------------------------------------------------------------------
+    def feed(self, data: bytes) -> List[PreviewLine]:
+        """바이트 스트림을 해석하여 지금까지의 줄 목록을 반환합니다."""
+        pos, size = 0, len(data)
+        while pos < size:
+            match = _CONTROL.search(data, pos)
+            if match is None:
+                self._text(data[pos:])
+                break
+            start = match.start()
+            self._text(data[pos:start])
+            pos = self._command(data, start)
+        return self.lines
+
+    def finish(self) -> List[PreviewLine]:
+        """줄바꿈 없이 끝난 마지막 텍스트를 줄로 내보냅니다."""
+        if self._runs:
+            self._end_line()
+        return self.lines
+
+    def _command(self, data: bytes, pos: int) -> int:
+        """pos 위치의 제어 명령을 해석하고 다음 위치를 반환합니다."""
+        code = data[pos]
+        if code == LF:
+            self._end_line()
+            return pos + 1
+        if code == ESC:
+            return self._esc(data, pos + 1)
+        if code == GS:
+            return self._gs(data, pos + 1)
+        if code == FS:
+            return pos + 2  # FS & / FS . 등 한글 모드 전환 (인자 없음)
+        return pos + 1      # CR, NUL 등
+
+    def _esc(self, data: bytes, pos: int) -> int:
+        if pos >= len(data):
+            return pos
+        command = data[pos]
+        arg = data[pos + 1] if pos + 1 < len(data) else 0
+        if command == 0x40:    # ESC @ : 초기화
+            self._reset_mode()
+            return pos + 1
+        if command == 0x61:    # ESC a n : 정렬
+            self.align = ALIGNMENTS[min(arg & 0x0f, 2)]  # 0/1/2 또는 "0"/"1"/"2"
+            return pos + 2
+        if command == 0x45:    # ESC E n : 볼드
+            self.bold = bool(arg & 1)
+            return pos + 2
+        if command == 0x21:    # ESC ! n : 인쇄 모드 (볼드, 배높이, 배폭)
+            self.bold = bool(arg & 0x08)
+            self.height = 2 if arg & 0x10 else 1
+            self.width = 2 if arg & 0x20 else 1
+            return pos + 2
+        if command == 0x64:    # ESC d n : n줄 피드
+            if self._runs:
+                self._end_line()
+            for _ in range(arg):
+                self._end_line()
+            return pos + 2
+        return pos + 1 + _ESC_PARAMS.get(command, 0)
+
+    def _gs(self, data: bytes, pos: int) -> int:
+        size = len(data)
+        if pos >= size:
+            return pos
+        command = data[pos]
+        arg = data[pos + 1] if pos + 1 < size else 0
+        if command == 0x21:    # GS ! n : 글자 배율
+            self.width = (arg >> 4) + 1
+            self.height = (arg & 0x0f) + 1
+            return pos + 2
+        if command == 0x56:    # GS V m [n] : 용지 컷
+            self._element("cut")
+            return pos + (3 if arg in (65, 66) else 2)
+        if command == 0x6b:    # GS k m ... : 바코드
+            if arg <= 6:       # 형식 A: NUL로 끝남
+                end = data.find(b"\x00", pos + 2)
+                end = size if end < 0 else end
+                self._element("barcode", data[pos + 2:end].decode("ascii", errors="replace"))
+                return end + 1
+            length = data[pos + 2] if pos + 2 < size else 0
+            payload = data[pos + 3:pos + 3 + length]
+            if payload[:2] in (b"{A", b"{B", b"{C"):
+                payload = payload[2:]  # CODE128 코드 세트 지정
+            self._element("barcode", payload.decode("ascii", errors="replace"))
+            return pos + 3 + length
+        if command == 0x28 and pos + 3 < size:  # GS ( X pL pH ... : 길이 지정 명령
+            function = data[pos + 1]
+            length = data[pos + 2] | (data[pos + 3] << 8)
+            body = data[pos + 4:pos + 4 + length]
+            if function == 0x6b and len(body) >= 2:     # GS ( k : QR 코드
+                if body[1] == 0x50:                     # fn=80 : 데이터 저장
+                    self._qr_data = body[3:].decode("utf-8", errors="replace")
+                elif body[1] == 0x51:                   # fn=81 : 저장된 심볼 출력
+                    self._element("qrcode", self._qr_data)
+            elif function == 0x4c and len(body) >= 4 and body[1] == 0x45:  # GS ( L fn=69 : NV 그래픽 출력
+                self._element("graphic", body[2:4].decode("ascii", errors="replace"))
+            return pos + 4 + length
+        if command == 0x38 and pos + 5 < size:  # GS 8 L p1 p2 p3 p4 ... : 4바이트 길이 (그래픽 정의)
+            length = int.from_bytes(data[pos + 2:pos + 6], "little")
+            return pos + 6 + length
+        if command == 0x76 and pos + 6 < size:  # GS v 0 m xL xH yL yH d... : 래스터 이미지
+            row_bytes = data[pos + 3] | (data[pos + 4] << 8)
+            rows = data[pos + 5] | (data[pos + 6] << 8)
+            start = pos + 7
+            self._element("image", image=(row_bytes * 8, rows, bytes(data[start:start + row_bytes * rows])))
+            return start + row_bytes * rows
+        return pos + 1 + _GS_PARAMS.get(command, 0)
+
+
+def interpret_escpos(data: bytes, encoding: str = "cp949") -> List[PreviewLine]:
+    """ESC/POS 바이트 스트림을 미리보기 줄 목록으로 변환합니다."""
+    interpreter = EscposInterpreter(encoding)
+    interpreter.feed(data)
+    return interpreter.finish()
+
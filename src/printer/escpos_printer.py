@@ -1,7 +1,6 @@
 import logging
-import os
-import time
-from src.printer.receipt_template import format_receipt_string
+from src.printer.receipt_template import render_customer_receipt
+from src.printer.status_monitor import PrinterStatus, get_device_lock, query_realtime_status
 from src.error_logger import get_error_logger
 
 # USB 프린터 관련 모듈 import (에러 발생 시 우회)
@@ -20,43 +19,56 @@ except ImportError as e:
 
 logger = logging.getLogger(__name__)
 
-# ESC/POS 프린터 스타일 명령어
-STYLE_COMMANDS = {
-    'init': b'\x1b\x40',  # 프린터 초기화
-    'center': b'\x1b\x61\x01',  # 가운데 정렬
-    'left': b'\x1b\x61\x00',  # 왼쪽 정렬
-    'right': b'\x1b\x61\x02',  # 오른쪽 정렬
-    'text_2x': b'\x1d\x21\x11',  # 글자 크기 2배
-    'text_normal': b'\x1d\x21\x00',  # 기본 글자 크기
-    'cut': b'\x1d\x56\x41\x00',  # 용지 자르기
-    'line_feed': b'\x0a',  # 줄바꿈 (LF)
-    'carriage_return': b'\x0d',  # 캐리지 리턴 (CR)
-    'crlf': b'\x0d\x0a'  # CR+LF
-}
-
-def debug_save_receipt_text(receipt_text: str, filename: str = "debug_receipt.txt"):
-    """디버깅을 위해 영수증 텍스트를 파일로 저장합니다."""
+# USB 벌크 전송 단위 (bytes)
+USB_CHUNK_SIZE = 4096
+
+# 기본 프린터 코드페이지 (CP949 / 조합형 한글)
+ESCPOS_CODEPAGE = 0x13
+
+def usb_device_key(vendor_id: int, product_id: int) -> str:
+    """USB 프린터의 장치 잠금 키를 반환합니다."""
+    return f"usb:{vendor_id:04x}:{product_id:04x}"
+
+def _get_usb_backend():
+    """현재 디렉토리의 libusb DLL로 백엔드를 생성합니다."""
+    return usb.backend.libusb1.get_backend(find_library=lambda x: "./libusb-1.0.dll")
+
+def probe_usb_status(vendor_id: int, product_id: int, interface: int = 0):
+    """USB 프린터의 실시간 상태(DLE EOT)를 조회합니다.
+
+    Returns:
+        PrinterStatus: 조회된 상태 (출력 중이라 장치를 사용할 수 없으면 None)
+    """
+    if not USB_PRINTER_AVAILABLE:
+        return PrinterStatus(reachable=False, message="USB 프린터 모듈 없음")
+
+    device_key = usb_device_key(vendor_id, product_id)
+    lock = get_device_lock(device_key)
+    if not lock.acquire(blocking=False):
+        return None  # 출력 중에는 조회하지 않음
     try:
-        output_dir = os.path.join("src", "printer", "output")
-        os.makedirs(output_dir, exist_ok=True)
-        
-        filepath = os.path.join(output_dir, filename)
-        with open(filepath, 'w', encoding='utf-8') as f:
-            f.write(receipt_text)
-            f.write(f"\n\n=== 디버그 정보 ===\n")
-            f.write(f"총 문자 수: {len(receipt_text)}\n")
-            f.write(f"줄 수: {len(receipt_text.split(chr(10)))}\n")
-            lines = receipt_text.split('\n')
-            for i, line in enumerate(lines):
-                f.write(f"줄 {i+1:2d}: '{line}' (길이: {len(line)})\n")
-        
-        logger.info(f"영수증 텍스트를 디버그 파일에 저장: {filepath}")
-        return filepath
+        backend = _get_usb_backend()
+        if backend is None:
+            return PrinterStatus(reachable=False, message="libusb 로드 실패")
+        printer = Usb(idVendor=vendor_id, idProduct=product_id, interface=interface, backend=backend)
+        try:
+            def read_byte():
+                try:
+                    data = printer._read()
+                except usb.core.USBError:
+                    return None
+                return data[0] if data else None
+
+            return query_realtime_status(printer._raw, read_byte, device_key)
+        finally:
+            printer.close()
     except Exception as e:
-        logger.error(f"디버그 파일 저장 중 오류: {e}")
-        return None
+        logger.debug(f"USB 프린터 상태 조회 실패: {e}")
+        return PrinterStatus(reachable=False, message="USB 연결 실패")
+    finally:
+        lock.release()
 
-def print_receipt_esc_usb(order, vendor_id, product_id, interface, codepage=0x13):
+def print_receipt_esc_usb(order, vendor_id, product_id, interface, codepage=ESCPOS_CODEPAGE, rendered=None):
     """libusb DLL을 사용하여 USB 프린터로 영수증을 출력합니다.
     
     Args:
@@ -67,6 +79,7 @@ def print_receipt_esc_usb(order, vendor_id, product_id, interface, codepage=0x13
         codepage: 프린터 코드페이지 (기본값: 0x13 = 19)
             - 0x03 (3): CP949 / 완성형 한글
             - 0x13 (19): CP949 / 조합형 한글
+        rendered: 미리 렌더링된 영수증 (없으면 렌더링 캐시에서 가져옴)
     """
     # USB 프린터 모듈이 사용 불가능한 경우
     if not USB_PRINTER_AVAILABLE:
@@ -83,10 +96,10 @@ def print_receipt_esc_usb(order, vendor_id, product_id, interface, codepage=0x13
         return False
     
     try:
-        receipt_text = format_receipt_string(order)
-        
-        # 디버깅을 위해 텍스트 저장
-        debug_save_receipt_text(receipt_text, f"receipt_{order.get('order_id', 'test')}.txt")
+        # 초기화/코드페이지/스타일/컷 명령을 포함한 전체 바이트를 장치 연결 전에 준비
+        if rendered is None:
+            rendered = render_customer_receipt(order, codepage=codepage)
+        receipt_bytes = rendered.data
         
     except Exception as e:
         logger.error(f"영수증 텍스트 포맷팅 중 오류 발생: {e}")
@@ -102,7 +115,7 @@ def print_receipt_esc_usb(order, vendor_id, product_id, interface, codepage=0x13
 
     # libusb DLL을 현재 디렉토리에서 로드
     try:
-        backend = usb.backend.libusb1.get_backend(find_library=lambda x: "./libusb-1.0.dll")
+        backend = _get_usb_backend()
     except Exception as e:
         error_msg = f"libusb 백엔드 생성 실패: {e}"
         logger.error(error_msg)
@@ -121,64 +134,17 @@ def print_receipt_esc_usb(order, vendor_id, product_id, interface, codepage=0x13
         return False
 
     try:
-        # 백엔드를 명시적으로 전달
-        printer = Usb(idVendor=vendor_id, idProduct=product_id, interface=interface, backend=backend)
-        
-        # 프린터 초기화 및 인코딩 설정
-        printer._raw(STYLE_COMMANDS['init'])  # 프린터 초기화
-        printer._raw(bytes([0x1b, 0x74, codepage]))  # 코드페이지 설정
-        printer.encoding = 'cp949'  # python-escpos의 인코딩 속성 지정
-
-        try:
-            # 영수증 텍스트를 CP949로 직접 인코딩하여 바이트로 전송
-            lines = receipt_text.split('\n')
+        # 상태 조회와 겹치지 않도록 장치 잠금 후 연결
+        with get_device_lock(usb_device_key(vendor_id, product_id)):
+            # 백엔드를 명시적으로 전달
+            printer = Usb(idVendor=vendor_id, idProduct=product_id, interface=interface, backend=backend)
             
-            # 디버깅을 위한 로그 추가
-            logger.info(f"영수증 총 줄 수: {len(lines)}")
-            logger.debug(f"영수증 전체 텍스트:\n{receipt_text}")
-            
-            for i, line in enumerate(lines):
-                # 빈 줄 처리
-                if not line.strip():
-                    printer._raw(STYLE_COMMANDS['crlf'])
-                    time.sleep(0.01)  # 10ms 지연
-                    continue
-                    
-                logger.debug(f"처리 중인 줄 {i+1}: {line}")
-                
-                if '주문번호' in line:
-                    printer._raw(STYLE_COMMANDS['center'])  # 가운데 정렬
-                    time.sleep(0.01)
-                    printer._raw(STYLE_COMMANDS['text_2x'])  # 글자 크기 2배
-                    time.sleep(0.01)
-                    printer._raw(line.encode('cp949', errors='strict'))
-                    printer._raw(STYLE_COMMANDS['crlf'])  # CR+LF로 줄바꿈
-                    time.sleep(0.02)  # 큰 텍스트는 조금 더 기다림
-                    printer._raw(STYLE_COMMANDS['text_normal'])  # 기본 글자 크기
-                    time.sleep(0.01)
-                    printer._raw(STYLE_COMMANDS['left'])  # 왼쪽 정렬
-                    time.sleep(0.01)
-                else:
-                    printer._raw(line.encode('cp949', errors='strict'))
-                    printer._raw(STYLE_COMMANDS['crlf'])  # CR+LF로 줄바꿈
-                    time.sleep(0.01)  # 10ms 지연
-            
-            # 추가 줄바꿈으로 여백 확보
-            printer._raw(STYLE_COMMANDS['crlf'])
-            time.sleep(0.02)
-            printer._raw(STYLE_COMMANDS['crlf'])
-            time.sleep(0.02)
-            
-            # 용지 자르기 전에 충분한 시간 대기
-            time.sleep(0.1)
-            printer._raw(STYLE_COMMANDS['cut'])  # 용지 자르기
-            time.sleep(0.05)  # 자르기 완료 대기
-        except UnicodeEncodeError as e:
-            logger.error(f"텍스트 인코딩 중 오류 발생: {e}")
-            logger.error(f"인코딩 실패한 텍스트: {receipt_text}")
-            return False
-        finally:
-            printer.close()  # 명시적으로 닫기
+            try:
+                # 한 번의 세션에서 청크 단위로 전송
+                for offset in range(0, len(receipt_bytes), USB_CHUNK_SIZE):
+                    printer._raw(receipt_bytes[offset:offset + USB_CHUNK_SIZE])
+            finally:
+                printer.close()  # 명시적으로 닫기
 
         logger.info(f"USB 프린터(vID={vendor_id:04x}, pID={product_id:04x})로 영수증 전송 완료")
         return True
@@ -190,4 +156,87 @@ def print_receipt_esc_usb(order, vendor_id, product_id, interface, codepage=0x13
     except Exception as e:
         logger.error(f"USB 프린터 출력 중 알 수 없는 오류 발생: {e}")
 
-    return False
\ No newline at end of file
+    return False
+
+def print_receipts_esc_usb_batch(orders, vendor_id, product_id, interface, codepage=ESCPOS_CODEPAGE, rendered_list=None):
+    """여러 주문의 영수증을 한 번의 USB 세션으로 연속 출력합니다.
+
+    Args:
+        orders: 주문 정보 딕셔너리 목록
+        vendor_id: USB 벤더 ID
+        product_id: USB 제품 ID
+        interface: USB 인터페이스 번호
+        codepage: 프린터 코드페이지
+        rendered_list: 주문별로 미리 렌더링된 영수증 목록 (없으면 렌더링 캐시에서 가져옴)
+
+    Returns:
+        list: 주문별 출력 성공 여부
+    """
+    results = [False] * len(orders)
+    if not orders:
+        return results
+
+    if not USB_PRINTER_AVAILABLE:
+        logger.error("USB 프린터 모듈이 로드되지 않아 일괄 출력할 수 없습니다.")
+        return results
+
+    try:
+        if rendered_list is None:
+            rendered_list = [render_customer_receipt(order, codepage=codepage) for order in orders]
+        backend = _get_usb_backend()
+    except Exception as e:
+        logger.error(f"일괄 출력 준비 중 오류 발생: {e}")
+        return results
+
+    if backend is None:
+        logger.error("libusb-1.0.dll을 로드할 수 없습니다. 백엔드 생성 실패.")
+        return results
+
+    try:
+        with get_device_lock(usb_device_key(vendor_id, product_id)):
+            printer = Usb(idVendor=vendor_id, idProduct=product_id, interface=interface, backend=backend)
+            try:
+                for index, rendered in enumerate(rendered_list):
+                    receipt_bytes = rendered.data
+                    for offset in range(0, len(receipt_bytes), USB_CHUNK_SIZE):
+                        printer._raw(receipt_bytes[offset:offset + USB_CHUNK_SIZE])
+                    results[index] = True
+            finally:
+                printer.close()
+    except PermissionError as e:
+        logger.error(f"USB 접근 권한이 없습니다: {e}")
+    except usb.core.USBError as e:
+        logger.error(f"USB 통신 오류: {e}")
+    except Exception as e:
+        logger.error(f"USB 프린터 일괄 출력 중 알 수 없는 오류 발생: {e}")
+
+    logger.info(f"USB 프린터 일괄 출력 완료: {sum(results)}/{len(orders)}건")
+    return results
+
+def write_usb_raw(vendor_id, product_id, interface, data):
+    """USB 프린터로 원시 바이트를 전송합니다. (NV 그래픽 업로드 등)
+
+    Returns:
+        bool: 전송 성공 여부
+    """
+    if not USB_PRINTER_AVAILABLE:
+        logger.error("USB 프린터 모듈이 로드되지 않아 전송할 수 없습니다.")
+        return False
+
+    try:
+        backend = _get_usb_backend()
+        if backend is None:
+            logger.error("libusb-1.0.dll을 로드할 수 없습니다. 백엔드 생성 실패.")
+            return False
+
+        with get_device_lock(usb_device_key(vendor_id, product_id)):
+            printer = Usb(idVendor=vendor_id, idProduct=product_id, interface=interface, backend=backend)
+            try:
+                for offset in range(0, len(data), USB_CHUNK_SIZE):
+                    printer._raw(data[offset:offset + USB_CHUNK_SIZE])
+            finally:
+                printer.close()
+        return True
+    except Exception as e:
+        logger.error(f"USB 프린터 전송 오류: {e}")
+        return False
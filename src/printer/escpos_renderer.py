@@ -0,0 +1,310 @@
+# -*- coding: utf-8 -*-
+"""구조화된 영수증 문서를 ESC/POS 바이트 스트림으로 변환하는 렌더러.
+
+영수증은 블록(텍스트, 좌우 컬럼, 구분선, NV 그래픽, 래스터 이미지, 바코드/QR, 줄바꿈, 용지 컷)의 목록으로 표현되며,
+렌더러는 현재 프린터 모드(정렬/크기/볼드)를 추적하여 바뀐 경우에만 명령어를 출력합니다.
+USB, COM, 파일 등 모든 출력 경로가 같은 렌더러를 사용합니다.
+"""
+import logging
+from typing import Any, List, Optional
+
+from src.printer.printer_assets import nv_print_command
+from src.printer.text_encoder import get_encoder
+from src.printer.text_layout import PAPER_COLUMNS, DEFAULT_PAPER_WIDTH, display_width, layout_columns, wrap_text
+
+logger = logging.getLogger(__name__)
+
+ALIGN_LEFT = "left"
+ALIGN_CENTER = "center"
+ALIGN_RIGHT = "right"
+
+# 기본 인쇄 폭 (80mm 용지, Font A 기준 문자 수)
+DEFAULT_COLUMNS = PAPER_COLUMNS[DEFAULT_PAPER_WIDTH]
+
+# 미리 계산된 ESC/POS 명령어 테이블
+CMD_INIT = b'\x1b\x40'  # 프린터 초기화
+CMD_ALIGN = {
+    ALIGN_LEFT: b'\x1b\x61\x00',
+    ALIGN_CENTER: b'\x1b\x61\x01',
+    ALIGN_RIGHT: b'\x1b\x61\x02',
+}
+CMD_BOLD = {
+    False: b'\x1b\x45\x00',
+    True: b'\x1b\x45\x01',
+}
+# GS ! n : 상위 4비트 = 가로 배율-1, 하위 4비트 = 세로 배율-1 (1~8배)
+CMD_SIZE = {
+    (width, height): bytes((0x1d, 0x21, ((width - 1) << 4) | (height - 1)))
+    for width in range(1, 9)
+    for height in range(1, 9)
+}
+CMD_CODEPAGE = {n: bytes((0x1b, 0x74, n)) for n in range(256)}  # ESC t n
+CMD_CUT = {
+    False: b'\x1d\x56\x41\x00',  # 전체 컷 (피드 후)
+    True: b'\x1d\x56\x42\x00',  # 부분 컷 (피드 후)
+}
+LINE_END = b'\x0d\x0a'  # CR+LF
+
+# 바코드 (GS k, CODE128) / QR 코드 (GS ( k, 모델 2)
+BARCODE_HRI_NONE = 0
+BARCODE_HRI_BELOW = 2
+QR_ERROR_LEVELS = {"L": 48, "M": 49, "Q": 50, "H": 51}
+
+
+class Text:
+    """한 줄 텍스트 블록"""
+    __slots__ = ("text", "align", "width", "height", "bold")
+
+    def __init__(self, text: str, align: str = ALIGN_LEFT, width: int = 1, height: int = 1, bold: bool = False):
+        self.text = text
+        self.align = align
+        self.width = width
+        self.height = height
+        self.bold = bold
+
+
+class Columns:
+    """왼쪽/오른쪽 정렬 텍스트를 한 줄에 배치하는 블록 (예: 메뉴명 ... 가격)"""
+    __slots__ = ("left", "right", "width", "height", "bold")
+
+    def __init__(self, left: str, right: str, width: int = 1, height: int = 1, bold: bool = False):
+        self.left = left
+        self.right = right
+        self.width = width
+        self.height = height
+        self.bold = bold
+
+
+class Separator:
+    """인쇄 폭 전체를 채우는 구분선 블록"""
+    __slots__ = ("char", "width", "height", "bold")
+
+    def __init__(self, char: str = "-", width: int = 1, height: int = 1, bold: bool = False):
+        self.char = char
+        self.width = width
+        self.height = height
+        self.bold = bold
+
+
+class Graphic:
+    """프린터 NV 메모리에 저장된 그래픽(로고)을 키 코드로 출력하는 블록"""
+    __slots__ = ("key", "align")
+
+    def __init__(self, key: str, align: str = ALIGN_CENTER):
+        self.key = key
+        self.align = align
+
+
+class Raster:
+    """미리 변환된 래스터 이미지 명령 블록 (예: 서명). 텍스트 렌더링에서는 대체 문구를 출력합니다."""
+    __slots__ = ("data", "align", "text")
+
+    def __init__(self, data: bytes, align: str = ALIGN_CENTER, text: str = ""):
+        self.data = data
+        self.align = align
+        self.text = text
+
+
+class Barcode:
+    """프린터 내장 CODE128 바코드 블록"""
+    __slots__ = ("data", "height", "module_width", "hri", "align")
+
+    def __init__(self, data: str, height: int = 60, module_width: int = 2, hri: bool = True,
+                 align: str = ALIGN_CENTER):
+        self.data = data
+        self.height = height
+        self.module_width = module_width
+        self.hri = hri
+        self.align = align
+
+
+class QRCode:
+    """프린터 내장 QR 코드 블록"""
+    __slots__ = ("data", "size", "error_level", "align")
+
+    def __init__(self, data: str, size: int = 6, error_level: str = "M", align: str = ALIGN_CENTER):
+        self.data = data
+        self.size = size
+        self.error_level = error_level
+        self.align = align
+
+
+class Feed:
+    """빈 줄 블록"""
+    __slots__ = ("lines",)
+
+    def __init__(self, lines: int = 1):
+        self.lines = lines
+
+
+class Cut:
+    """용지 컷 블록"""
+    __slots__ = ("partial",)
+
+    def __init__(self, partial: bool = False):
+        self.partial = partial
+
+
+class ReceiptDocument:
+    """영수증 블록 목록. 빌더 메서드는 체이닝을 위해 self를 반환합니다."""
+
+    def __init__(self, blocks: Optional[List[Any]] = None):
+        self.blocks: List[Any] = blocks if blocks is not None else []
+
+    def text(self, text: str, align: str = ALIGN_LEFT, width: int = 1, height: int = 1, bold: bool = False) -> "ReceiptDocument":
+        self.blocks.append(Text(text, align, width, height, bold))
+        return self
+
+    def columns(self, left: str, right: str, width: int = 1, height: int = 1, bold: bool = False) -> "ReceiptDocument":
+        self.blocks.append(Columns(left, right, width, height, bold))
+        return self
+
+    def separator(self, char: str = "-", width: int = 1, height: int = 1, bold: bool = False) -> "ReceiptDocument":
+        self.blocks.append(Separator(char, width, height, bold))
+        return self
+
+    def graphic(self, key: str, align: str = ALIGN_CENTER) -> "ReceiptDocument":
+        self.blocks.append(Graphic(key, align))
+        return self
+
+    def raster(self, data: bytes, align: str = ALIGN_CENTER, text: str = "") -> "ReceiptDocument":
+        self.blocks.append(Raster(data, align, text))
+        return self
+
+    def barcode(self, data: str, height: int = 60, module_width: int = 2, hri: bool = True,
+                align: str = ALIGN_CENTER) -> "ReceiptDocument":
+        self.blocks.append(Barcode(data, height, module_width, hri, align))
+        return self
+
+    def qrcode(self, data: str, size: int = 6, error_level: str = "M", align: str = ALIGN_CENTER) -> "ReceiptDocument":
+        self.blocks.append(QRCode(data, size, error_level, align))
+        return self
+
+    def feed(self, lines: int = 1) -> "ReceiptDocument":
+        self.blocks.append(Feed(lines))
+        return self
+
+    def cut(self, partial: bool = False) -> "ReceiptDocument":
+        self.blocks.append(Cut(partial))
+        return self
+
+
+def barcode_command(block: Barcode) -> bytes:
+    """CODE128 바코드 명령을 생성합니다. (코드 세트 B, 데이터는 ASCII)"""
+    data = b"{B" + block.data.encode("ascii")
+    hri = BARCODE_HRI_BELOW if block.hri else BARCODE_HRI_NONE
+    return (
+        bytes((0x1d, 0x68, block.height))          # GS h : 바코드 높이
+        + bytes((0x1d, 0x77, block.module_width))  # GS w : 모듈 폭
+        + bytes((0x1d, 0x48, hri))                 # GS H : 사람이 읽는 문자(HRI) 위치
+        + bytes((0x1d, 0x6b, 73, len(data)))       # GS k m=73 : CODE128
+        + data
+    )
+
+
+def qrcode_command(block: QRCode) -> bytes:
+    """QR 코드 저장/출력 명령을 생성합니다. (프린터가 직접 심볼을 생성)"""
+    data = block.data.encode("utf-8")
+    store_length = len(data) + 3
+    return (
+        b'\x1d\x28\x6b\x04\x00\x31\x41\x32\x00'                                # fn=65 : 모델 2
+        + b'\x1d\x28\x6b\x03\x00\x31\x43' + bytes((block.size,))                 # fn=67 : 모듈 크기
+        + b'\x1d\x28\x6b\x03\x00\x31\x45' + bytes((QR_ERROR_LEVELS[block.error_level],))  # fn=69 : 오류 정정 수준
+        + b'\x1d\x28\x6b' + bytes((store_length & 0xFF, store_length >> 8)) + b'\x31\x50\x30' + data  # fn=80 : 데이터 저장
+        + b'\x1d\x28\x6b\x03\x00\x31\x51\x30'                                    # fn=81 : 저장된 심볼 출력
+    )
+
+
+def _block_lines(block: Any, columns: int) -> List[str]:
+    """텍스트 계열 블록을 글자 배율을 반영한 폭에 맞춰 줄 단위로 배치합니다."""
+    line_columns = max(1, columns // block.width)
+    kind = type(block)
+    if kind is Text:
+        return wrap_text(block.text, line_columns)
+    if kind is Columns:
+        return layout_columns(block.left, block.right, line_columns)
+    return [block.char * max(1, line_columns // max(1, display_width(block.char)))]
+
+
+def render_document(document: ReceiptDocument, columns: int = DEFAULT_COLUMNS,
+                    codepage: Optional[int] = None, encoding: str = "cp949") -> bytes:
+    """영수증 문서를 ESC/POS 바이트 스트림으로 렌더링합니다.
+
+    Args:
+        document: 렌더링할 영수증 문서
+        columns: 기본 글자 크기 기준 한 줄의 문자 수
+        codepage: 설정할 프린터 코드페이지 (None이면 설정하지 않음)
+        encoding: 텍스트 인코딩 (표현할 수 없는 문자는 문자 단위로 대체)
+
+    Returns:
+        bytes: 프린터로 그대로 전송할 수 있는 바이트 스트림
+    """
+    encode = get_encoder(encoding).encode
+    out = [CMD_INIT]
+    if codepage is not None:
+        out.append(CMD_CODEPAGE[codepage])
+
+    # 초기화 직후 프린터 상태
+    align, size, bold = ALIGN_LEFT, (1, 1), False
+
+    for block in document.blocks:
+        kind = type(block)
+        if kind is Feed:
+            out.append(LINE_END * block.lines)
+            continue
+        if kind is Cut:
+            out.append(CMD_CUT[block.partial])
+            continue
+        if kind is Graphic or kind is Raster:
+            if block.align != align:
+                out.append(CMD_ALIGN[block.align])
+                align = block.align
+            out.append(nv_print_command(block.key) if kind is Graphic else block.data)
+            continue
+        if kind is Barcode or kind is QRCode:
+            if block.align != align:
+                out.append(CMD_ALIGN[block.align])
+                align = block.align
+            out.append(barcode_command(block) if kind is Barcode else qrcode_command(block))
+            out.append(LINE_END)
+            continue
+
+        if kind is Text:
+            block_align = block.align
+        else:
+            block_align = ALIGN_LEFT
+        block_size = (block.width, block.height)
+
+        # 바뀐 모드만 출력
+        if block_align != align:
+            out.append(CMD_ALIGN[block_align])
+            align = block_align
+        if block_size != size:
+            out.append(CMD_SIZE[block_size])
+            size = block_size
+        if block.bold != bold:
+            out.append(CMD_BOLD[block.bold])
+            bold = block.bold
+
+        for line in _block_lines(block, columns):
+            out.append(encode(line))
+            out.append(LINE_END)
+
+    return b"".join(out)
+
+
+def render_text(document: ReceiptDocument, columns: int = DEFAULT_COLUMNS) -> str:
+    """영수증 문서를 스타일 없는 일반 텍스트로 렌더링합니다. (미리보기/윈도우 프린터용)"""
+    lines = []
+    for block in document.blocks:
+        kind = type(block)
+        if kind is Feed:
+            lines.extend([""] * block.lines)
+        elif kind is Raster:
+            if block.text:
+                lines.append(block.text)
+        elif kind is Barcode or kind is QRCode:
+            lines.append(block.data)
+        elif kind is not Cut and kind is not Graphic:
+            lines.extend(_block_lines(block, columns))
+    return "\n".join(lines)
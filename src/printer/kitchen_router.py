@@ -0,0 +1,259 @@
+# -*- coding: utf-8 -*-
+"""주방 스테이션별 주문서 분배 모듈.
+
+메뉴 카테고리(menu_category.category_name)를 주방 스테이션(그릴, 음료, 디저트 등)에
+매핑하여 주문을 스테이션별 주문서로 나누고, 각 스테이션 프린터로 동시에 전송합니다.
+어느 스테이션에도 속하지 않는 메뉴는 기본 주방 프린터(kitchen_printer 설정)로 출력합니다.
+
+설정 예 (printer_config.json의 kitchen_printer):
+    "stations": [
+        {"name": "음료", "categories": ["음료", "커피"], "printer_type": "com",
+         "com_port": "COM4", "baudrate": 9600},
+        {"name": "그릴", "categories": ["버거"], "printer_type": "network",
+         "network_info": {"address": "192.168.0.101", "port": 9100}}
+    ]
+"""
+import logging
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import partial
+from typing import Any, Dict, List, Optional, Tuple
+
+from src.printer.com_printer import print_kitchen_receipts_com_batch, probe_serial_status, render_kitchen_receipt, serial_device_key
+from src.printer.kitchen_scheduler import get_kitchen_scheduler
+from src.printer.network_printer import DEFAULT_PORT as NETWORK_DEFAULT_PORT, get_network_pool, network_device_key, probe_network_status
+from src.printer.receipt_archive import archive_receipt
+from src.printer.render_cache import RenderedReceipt
+from src.printer.text_layout import DEFAULT_PAPER_WIDTH, PAPER_COLUMNS, get_paper_columns
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_STATION_NAME = "주방"
+STATION_PRINTER_TYPES = ("com", "network")
+MAX_DISPATCH_WORKERS = 8
+
+
+class KitchenStation:
+    """주방 스테이션 하나와 그 프린터 설정"""
+    __slots__ = ("name", "categories", "printer_type", "com_port", "baudrate", "address", "port", "columns")
+
+    def __init__(self, config: Dict[str, Any], name: Optional[str] = None) -> None:
+        self.name = name or config.get("name", DEFAULT_STATION_NAME)
+        self.categories = tuple(config.get("categories", []))
+        self.printer_type = config.get("printer_type", "com")
+        self.com_port = config.get("com_port", "COM3")
+        self.baudrate = config.get("baudrate", 9600)
+        network_info = config.get("network_info", {})
+        self.address = network_info.get("address", "")
+        self.port = network_info.get("port", NETWORK_DEFAULT_PORT)
+        self.columns = get_paper_columns(config.get("paper_width", DEFAULT_PAPER_WIDTH))
+
+    @property
+    def device(self) -> str:
+        """로그 표시용 장치 이름"""
+        if self.printer_type == "network":
+            return f"{self.address}:{self.port}"
+        return self.com_port
+
+    @property
+    def device_key(self) -> str:
+        """장치 잠금/전송 스케줄러가 사용하는 장치 키"""
+        if self.printer_type == "network":
+            return network_device_key(self.address, self.port)
+        return serial_device_key(self.com_port)
+
+    @property
+    def line_baudrate(self) -> Optional[int]:
+        """전송 시간 추정용 통신 속도 (네트워크 프린터는 전송 시간을 무시하므로 None)"""
+        return None if self.printer_type == "network" else self.baudrate
+
+    def probe_status(self):
+        """스테이션 프린터의 실시간 상태를 조회합니다. (상태 모니터용)"""
+        if self.printer_type == "network":
+            return probe_network_status(self.address, self.port)
+        return probe_serial_status(self.com_port, self.baudrate)
+
+    def print_tickets(self, tickets: List[Dict[str, Any]], rendered_list: List[RenderedReceipt]) -> List[bool]:
+        """렌더링된 주문서들을 한 번의 장치 세션으로 출력합니다."""
+        if self.printer_type == "network":
+            data = b"".join(rendered.data for rendered in rendered_list)
+            success = get_network_pool().send(self.address, self.port, data)
+            return [success] * len(tickets)
+        return print_kitchen_receipts_com_batch(
+            tickets, self.com_port, self.baudrate, self.columns, rendered_list=rendered_list
+        )
+
+
+def _station_config_error(station: Any) -> Optional[str]:
+    """스테이션 설정 하나의 오류 내용을 반환합니다. (유효하면 None)"""
+    if not isinstance(station, dict):
+        return f"잘못된 주방 스테이션 설정: {station}"
+    if not station.get("name"):
+        return f"주방 스테이션 이름 없음: {station}"
+    printer_type = station.get("printer_type", "com")
+    if printer_type not in STATION_PRINTER_TYPES:
+        return f"잘못된 주방 스테이션 프린터 타입: {printer_type}"
+    if printer_type == "com" and not str(station.get("com_port", "")).startswith("COM"):
+        return f"잘못된 주방 스테이션 COM 포트: {station.get('com_port')}"
+    if printer_type == "network" and not station.get("network_info", {}).get("address"):
+        return f"주방 스테이션 네트워크 주소 없음: {station.get('name')}"
+    if station.get("paper_width", DEFAULT_PAPER_WIDTH) not in PAPER_COLUMNS:
+        return f"잘못된 주방 스테이션 용지 폭: {station.get('paper_width')}"
+    return None
+
+
+def validate_station_config(station: Dict[str, Any]) -> bool:
+    """스테이션 설정 하나의 유효성을 검증합니다."""
+    error = _station_config_error(station)
+    if error:
+        logger.warning(error)
+        return False
+    return True
+
+
+class KitchenRouter:
+    """주문을 스테이션별 주문서로 나누고 스테이션 프린터로 동시에 출력합니다."""
+
+    def __init__(self, kitchen_config: Dict[str, Any]) -> None:
+        self.default_station = KitchenStation(kitchen_config, name=DEFAULT_STATION_NAME)
+        self.order_barcode = kitchen_config.get("order_barcode", False)
+        self.stations: List[KitchenStation] = []
+        self._category_map: Dict[str, KitchenStation] = {}
+        for station_config in kitchen_config.get("stations", []):
+            if _station_config_error(station_config):
+                continue  # 잘못된 스테이션은 건너뜀 (경고는 설정 로드 시 한 번만 남김)
+            if not station_config.get("enabled", True):
+                continue  # 비활성 스테이션의 메뉴는 기본 주방 프린터로 출력
+            station = KitchenStation(station_config)
+            self.stations.append(station)
+            for category in station.categories:
+                self._category_map.setdefault(category, station)
+
+    @property
+    def is_routed(self) -> bool:
+        """스테이션 분배가 설정되어 있는지 여부"""
+        return bool(self.stations)
+
+    def all_stations(self) -> List[KitchenStation]:
+        return [self.default_station] + self.stations
+
+    def split_order(self, order: Dict[str, Any]) -> List[Tuple[KitchenStation, Dict[str, Any]]]:
+        """주문을 스테이션별 주문서로 나눕니다. (메뉴 순서 유지)"""
+        if not self.is_routed:
+            return [(self.default_station, order)]
+
+        grouped: Dict[str, List[Dict[str, Any]]] = {}
+        stations: Dict[str, KitchenStation] = {}
+        for item in order.get("items", []):
+            station = self._category_map.get(item.get("category"), self.default_station)
+            grouped.setdefault(station.name, []).append(item)
+            stations[station.name] = station
+
+        if not grouped:
+            return [(self.default_station, order)]
+        return [
+            (stations[name], dict(order, items=items, station=name))
+            for name, items in grouped.items()
+        ]
+
+    def dispatch(self, orders: List[Dict[str, Any]]) -> List[bool]:
+        """
+        주문들의 주방용 주문서를 스테이션별로 나누어 동시에 출력하고 끝날 때까지 기다립니다.
+
+        Returns:
+            List[bool]: 주문별 성공 여부 (해당 주문의 모든 주문서가 출력되어야 성공)
+        """
+        return self.dispatch_async(orders).result()
+
+    def dispatch_async(self, orders: List[Dict[str, Any]]) -> "Future[List[bool]]":
+        """
+        주문들의 주방용 주문서를 스테이션별로 나누어 백그라운드에서 동시에 출력합니다.
+
+        주문서는 호출한 스레드에서 한 번씩 렌더링하고 전송 순서/수신 예상 시각을 기록한 뒤 바로 반환합니다.
+        스테이션마다 하나의 작업이 자신의 주문서를 한 번의 장치 세션으로 출력하므로, 스테이션이 늘어도
+        스테이션끼리는 병렬로 전송되어 주문당 지연이 늘지 않습니다. 전송하는 동안 남은 시간은
+        스케줄러(kitchen_scheduler)의 ETA로 조회할 수 있습니다.
+        스테이션 안에서는 우선순위별로 전송 시간이 짧은 주문서부터 보냅니다.
+
+        Returns:
+            Future[List[bool]]: 주문별 성공 여부 (해당 주문의 모든 주문서가 출력되어야 성공)
+        """
+        done: "Future[List[bool]]" = Future()
+        results = [True] * len(orders)
+        if not orders:
+            done.set_result(results)
+            return done
+
+        # 스테이션별 작업 목록: (주문 인덱스, 주문서, 렌더링 결과)
+        jobs: Dict[str, Tuple[KitchenStation, List[Tuple[int, Dict[str, Any], RenderedReceipt]]]] = {}
+        for index, order in enumerate(orders):
+            for station, ticket in self.split_order(order):
+                rendered = render_kitchen_receipt(ticket, station.columns, self.order_barcode)
+                jobs.setdefault(station.name, (station, []))[1].append((index, ticket, rendered))
+
+        # 같은 우선순위 안에서는 전송 시간이 짧은 주문서부터 (수신 예상 시각 기록)
+        scheduler = get_kitchen_scheduler()
+        for name, (station, station_jobs) in jobs.items():
+            order = scheduler.schedule(station.device_key, station.name, station.line_baudrate,
+                                       [job[1] for job in station_jobs], [len(job[2].data) for job in station_jobs])
+            jobs[name] = (station, [station_jobs[i] for i in order])
+            drain = scheduler.drain_eta(station.device_key)
+            if drain >= 0.1:
+                logger.info(f"주방 스테이션 [{station.name}] 예상 전송 완료: {drain:.1f}초 후 ({station.device})")
+
+        def run(station: KitchenStation, station_jobs) -> List[bool]:
+            byte_count = sum(len(job[2].data) for job in station_jobs)
+            started = time.perf_counter()
+            try:
+                station_results = station.print_tickets([job[1] for job in station_jobs], [job[2] for job in station_jobs])
+            except Exception as e:
+                logger.error(f"주방 스테이션 [{station.name}] 출력 오류 ({station.device}): {e}")
+                station_results = [False] * len(station_jobs)
+            scheduler.complete(station.device_key, byte_count, station.line_baudrate,
+                               time.perf_counter() - started, all(station_results))
+
+            kind = f"kitchen:{station.name}" if self.is_routed else "kitchen"
+            for (index, ticket, rendered), success in zip(station_jobs, station_results):
+                if success:  # 실제로 출력된 주문서만 보관
+                    archive_receipt(ticket.get("order_id", "Unknown"), kind, rendered.data)
+            failed = len(station_results) - sum(station_results)
+            if failed:
+                logger.error(f"주방 스테이션 [{station.name}] 출력 실패 {failed}건 ({station.device})")
+            elif self.is_routed:
+                logger.info(f"주방 스테이션 [{station.name}] 주문서 {len(station_jobs)}건 출력 ({station.device})")
+            return station_results
+
+        # 마지막 스테이션이 끝나면 주문별 결과를 모아 완료 (작업 스레드에서 다른 작업을 기다리지 않음)
+        lock = threading.Lock()
+        remaining = [len(jobs)]
+
+        def collect(station_jobs, future: "Future[List[bool]]") -> None:
+            try:
+                station_results = future.result()
+            except Exception as e:
+                logger.error(f"주방 주문서 전송 작업 오류: {e}")
+                station_results = [False] * len(station_jobs)
+            with lock:
+                for (index, _, _), success in zip(station_jobs, station_results):
+                    results[index] = results[index] and success
+                remaining[0] -= 1
+                finished = remaining[0] == 0
+            if finished:
+                done.set_result(results)
+
+        executor = _get_dispatch_executor()
+        for station, station_jobs in jobs.values():
+            executor.submit(run, station, station_jobs).add_done_callback(partial(collect, station_jobs))
+        return done
+
+
+# 스테이션 동시 출력용 공유 스레드 풀
+_dispatch_executor: Optional[ThreadPoolExecutor] = None
+
+
+def _get_dispatch_executor() -> ThreadPoolExecutor:
+    global _dispatch_executor
+    if _dispatch_executor is None:
+        _dispatch_executor = ThreadPoolExecutor(max_workers=MAX_DISPATCH_WORKERS, thread_name_prefix="KitchenDispatch")
+    return _dispatch_executor
@@ -0,0 +1,132 @@
+# -*- coding: utf-8 -*-
+"""주방 주문서 전송 스케줄러.
+
+시리얼(COM) 주방 프린터는 9600 baud에서 초당 약 960바이트만 전송할 수 있어
+큰 글씨 주문서 한 장도 수백 ms가 걸립니다. 주문서 바이트 수와 통신 속도로 전송 시간을
+추정하여, 같은 우선순위 안에서는 짧은 주문서부터 보내고(대기 시간 합 최소화)
+스테이션별 큐가 비워지는 예상 시각(ETA)을 제공합니다.
+실제 전송 시간을 측정하여 추정치를 보정합니다. (흐름 제어로 baud보다 느린 프린터 대응)
+"""
+import logging
+import threading
+import time
+from typing import Dict, List, NamedTuple, Optional, Sequence
+
+logger = logging.getLogger(__name__)
+
+BITS_PER_BYTE = 10        # 8N1: 시작 비트 + 8 데이터 비트 + 정지 비트
+DEFAULT_PRIORITY = 0      # 작을수록 먼저 출력
+CALIBRATION_WEIGHT = 0.2  # 실측 보정 계수의 지수 이동 평균 가중치
+MIN_CALIBRATION_SECONDS = 0.05  # 이보다 짧은 전송은 측정 오차가 커서 보정에 쓰지 않음
+MAX_CALIBRATION_FACTOR = 10.0   # 장치 대기 등 이상치로 추정치가 과도하게 커지지 않도록 제한
+
+
+def transmit_seconds(byte_count: int, baudrate: Optional[int]) -> float:
+    """바이트 수와 통신 속도로 전송 시간을 추정합니다. (네트워크 프린터는 0)"""
+    if not baudrate:
+        return 0.0
+    return byte_count * BITS_PER_BYTE / baudrate
+
+
+def ticket_priority(ticket: Dict) -> int:
+    """주문서 우선순위 (주문 데이터의 priority 값, 없으면 기본값)"""
+    try:
+        return int(ticket.get("priority", DEFAULT_PRIORITY))
+    except (TypeError, ValueError):
+        return DEFAULT_PRIORITY
+
+
+class TicketEta(NamedTuple):
+    """전송 대기 중인 주문서의 수신 예상 정보"""
+    order_id: str
+    station: str
+    byte_count: int
+    transmit: float   # 예상 전송 시간 (초)
+    eta: float        # 주방 수신 예상 시각 (time.time() 기준)
+
+
+class KitchenScheduler:
+    """스테이션(장치)별 전송 큐의 예상 완료 시각을 관리합니다."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._busy_until: Dict[str, float] = {}      # 장치 키 -> 큐가 비는 예상 시각
+        self._pending: Dict[str, List[TicketEta]] = {}
+        self._factor: Dict[str, float] = {}          # 장치 키 -> 실측/추정 비율
+
+    def estimate(self, device_key: str, byte_count: int, baudrate: Optional[int]) -> float:
+        """장치별 보정 계수를 반영한 전송 시간 추정치"""
+        with self._lock:
+            factor = self._factor.get(device_key, 1.0)
+        return transmit_seconds(byte_count, baudrate) * factor
+
+    def schedule(self, device_key: str, station: str, baudrate: Optional[int],
+                 tickets: Sequence[Dict], sizes: Sequence[int]) -> List[int]:
+        """
+        주문서 전송 순서를 정하고 수신 예상 시각을 기록합니다.
+
+        Args:
+            device_key: 장치 키 (장치 잠금과 같은 키)
+            station: 스테이션 이름 (표시용)
+            baudrate: 통신 속도 (네트워크 프린터는 None)
+            tickets: 주문서 데이터 목록
+            sizes: 주문서별 렌더링 바이트 수
+
+        Returns:
+            List[int]: 전송 순서 (tickets 인덱스, 우선순위 -> 짧은 주문서 순)
+        """
+        with self._lock:
+            factor = self._factor.get(device_key, 1.0)
+        durations = [transmit_seconds(size, baudrate) * factor for size in sizes]
+        order = sorted(range(len(tickets)), key=lambda i: (ticket_priority(tickets[i]), durations[i]))
+
+        now = time.time()
+        with self._lock:
+            pending = [entry for entry in self._pending.get(device_key, []) if entry.eta > now]
+            eta = max(now, self._busy_until.get(device_key, now))
+            for index in order:
+                eta += durations[index]
+                pending.append(TicketEta(str(tickets[index].get("order_id", "Unknown")), station,
+                                         sizes[index], durations[index], eta))
+            self._pending[device_key] = pending
+            self._busy_until[device_key] = eta
+        return order
+
+    def complete(self, device_key: str, byte_count: int, baudrate: Optional[int],
+                 elapsed: float, success: bool) -> None:
+        """전송 완료를 기록합니다. 실측 시간으로 보정 계수를 갱신하고, 실패 시 대기 항목을 비웁니다."""
+        with self._lock:
+            if not success:
+                self._pending.pop(device_key, None)
+                self._busy_until.pop(device_key, None)
+                return
+            estimated = transmit_seconds(byte_count, baudrate)
+            if estimated >= MIN_CALIBRATION_SECONDS:
+                factor = self._factor.get(device_key, 1.0)
+                measured = min(MAX_CALIBRATION_FACTOR, max(1.0, elapsed / estimated))  # baud보다 빠를 수는 없음
+                self._factor[device_key] = factor + CALIBRATION_WEIGHT * (measured - factor)
+
+    def etas(self) -> List[TicketEta]:
+        """아직 수신되지 않은 것으로 예상되는 주문서 목록 (수신 예상 시각 순)"""
+        now = time.time()
+        with self._lock:
+            entries = [entry for pending in self._pending.values() for entry in pending if entry.eta > now]
+        return sorted(entries, key=lambda entry: entry.eta)
+
+    def drain_eta(self, device_key: str) -> float:
+        """장치 큐가 모두 전송되기까지 남은 예상 시간 (초)"""
+        with self._lock:
+            busy_until = self._busy_until.get(device_key, 0.0)
+        return max(0.0, busy_until - time.time())
+
+
+# 글로벌 스케줄러 인스턴스 (라우터는 출력마다 새로 만들어지므로 상태는 여기에 유지)
+_kitchen_scheduler: Optional[KitchenScheduler] = None
+
+
+def get_kitchen_scheduler() -> KitchenScheduler:
+    """글로벌 주방 전송 스케줄러 인스턴스 반환 (없으면 생성)"""
+    global _kitchen_scheduler
+    if _kitchen_scheduler is None:
+        _kitchen_scheduler = KitchenScheduler()
+    return _kitchen_scheduler
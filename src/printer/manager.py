@@ -1,14 +1,26 @@
 import json
 import logging
 from pathlib import Path
-from typing import List
+from concurrent.futures import Future
+from typing import List, Optional, Tuple
 import win32print
 from datetime import datetime, time
 from src.error_logger import get_error_logger, log_exception
 
-from src.printer.escpos_printer import print_receipt_esc_usb  # USB 프린터 출력 함수
-from src.printer.file_printer import print_receipt as file_print_receipt, print_receipt_win  # 파일/윈도우 프린터 출력 함수
-from src.printer.com_printer import print_receipt_com, print_kitchen_receipt_com, test_com_printer  # COM 포트 프린터 출력 함수
+from functools import partial
+from src.printer.escpos_printer import print_receipt_esc_usb, print_receipts_esc_usb_batch, probe_usb_status, write_usb_raw, usb_device_key, ESCPOS_CODEPAGE  # USB 프린터 출력 함수
+from src.printer.printer_assets import DEFAULT_LOGO_WIDTH, LOGO_KEY, get_asset_manager
+from src.printer.status_monitor import PrinterStatus, get_status_monitor
+from src.printer.receipt_template import render_customer_receipt
+from src.printer.text_layout import PAPER_COLUMNS, DEFAULT_PAPER_WIDTH, get_paper_columns
+from src.printer.file_printer import print_receipt_win  # 윈도우 프린터 출력 함수
+from src.printer.receipt_archive import archive_receipt  # 출력 영수증 백그라운드 보관
+from src.printer.render_cache import RenderedReceipt
+from src.printer.network_printer import print_receipt_network, probe_network_status, get_network_pool, network_device_key, DEFAULT_PORT as NETWORK_DEFAULT_PORT  # 네트워크 프린터 출력 함수
+from src.printer.com_printer import render_kitchen_receipt, test_com_printer  # COM 포트 프린터 테스트 함수
+from src.printer.kitchen_router import KitchenRouter, validate_station_config  # 주방 스테이션별 출력
+from src.printer.kitchen_scheduler import TicketEta, get_kitchen_scheduler
+from src.printer.printer_group import GROUP_MODES, PrinterGroup, validate_member_config  # 손님용 프린터 장애 조치/부하 분산
 
 logger = logging.getLogger(__name__)
 
@@ -20,6 +32,7 @@ class PrinterManager:
         self._customer_printer = {}
         self._kitchen_printer = {}
         self._auto_print_config = {}
+        self._customer_group = PrinterGroup([])
         self.load_config()
 
     @property
@@ -37,6 +50,11 @@ class PrinterManager:
         """현재 USB 정보를 반환합니다. (기존 호환성)"""
         return self._customer_printer.get("usb_info", {})
 
+    @property
+    def network_info(self) -> dict:
+        """현재 네트워크 프린터 정보를 반환합니다."""
+        return self._customer_printer.get("network_info", {})
+
     def _get_default_config(self) -> dict:
         """기본 설정을 반환합니다."""
         try:
@@ -52,19 +70,37 @@ class PrinterManager:
                     "vendor_id": "",
                     "product_id": "",
                     "interface": "0"
+                },
+                "network_info": {},
+                "paper_width": DEFAULT_PAPER_WIDTH,
+                "logo": {
+                    "path": "",
+                    "width": DEFAULT_LOGO_WIDTH
+                },
+                "order_barcode": False,
+                "pickup_qr_url": "",
+                "group": {
+                    "mode": "failover",
+                    "members": []
                 }
             },
             "kitchen_printer": {
                 "printer_type": "com",
                 "com_port": "COM3",
                 "baudrate": 9600,
-                "enabled": True
+                "enabled": True,
+                "paper_width": DEFAULT_PAPER_WIDTH,
+                "order_barcode": False,
+                "stations": []
             },
             "auto_print": {
                 "enabled": False,
                 "retry_count": 3,
                 "retry_interval": 30,
-                "check_printer_status": True
+                "check_printer_status": True,
+                "status_poll_interval": 5,
+                "batch_threshold": 2,
+                "batch_size": 20
             }
         }
 
@@ -74,7 +110,7 @@ class PrinterManager:
             # 손님용 프린터 검증
             customer = config.get("customer_printer", {})
             printer_type = customer.get("printer_type")
-            if printer_type not in ["escpos", "default"]:
+            if printer_type not in ["escpos", "default", "network"]:
                 logger.warning(f"잘못된 손님용 프린터 타입: {printer_type}")
                 return False
 
@@ -91,6 +127,26 @@ class PrinterManager:
                         logger.warning("잘못된 USB ID 형식")
                         return False
 
+            if printer_type == "network":
+                port = customer.get("network_info", {}).get("port", NETWORK_DEFAULT_PORT)
+                if not isinstance(port, int) or not 0 < port < 65536:
+                    logger.warning(f"잘못된 네트워크 프린터 포트: {port}")
+                    return False
+
+            # 손님용 프린터 그룹 검증
+            group = customer.get("group", {})
+            if group.get("mode", "failover") not in GROUP_MODES:
+                logger.warning(f"잘못된 프린터 그룹 모드: {group.get('mode')}")
+                return False
+            # 잘못된 구성원은 그룹에서 제외하고 나머지 설정은 유지
+            members = group.get("members", [])
+            if not isinstance(members, list):
+                logger.warning(f"잘못된 프린터 그룹 구성원 목록: {members}")
+                return False
+            for member in members:
+                if not validate_member_config(member):
+                    logger.warning("잘못된 프린터 그룹 구성원은 그룹에서 제외합니다.")
+
             # 주방용 프린터 검증
             kitchen = config.get("kitchen_printer", {})
             com_port = kitchen.get("com_port", "")
@@ -103,6 +159,22 @@ class PrinterManager:
                 logger.warning(f"잘못된 baudrate: {baudrate}")
                 return False
 
+            # 주방 스테이션 검증 (잘못된 스테이션은 출력 시 건너뛰고 나머지 설정은 유지)
+            stations = kitchen.get("stations", [])
+            if not isinstance(stations, list):
+                logger.warning(f"잘못된 주방 스테이션 목록: {stations}")
+                return False
+            for station in stations:
+                if not validate_station_config(station):
+                    logger.warning("잘못된 주방 스테이션은 건너뜁니다. (해당 메뉴는 기본 주방 프린터로 출력)")
+
+            # 용지 폭 검증
+            for section in (customer, kitchen):
+                paper_width = section.get("paper_width", DEFAULT_PAPER_WIDTH)
+                if paper_width not in PAPER_COLUMNS:
+                    logger.warning(f"잘못된 용지 폭: {paper_width}")
+                    return False
+
             return True
         except Exception as e:
             logger.error(f"설정 검증 오류: {e}")
@@ -151,6 +223,7 @@ class PrinterManager:
         self._customer_printer = config.get("customer_printer", {})
         self._kitchen_printer = config.get("kitchen_printer", {})
         self._auto_print_config = config.get("auto_print", {})
+        self._customer_group = PrinterGroup.from_config("customer", self._customer_printer)
         
         logger.info(f"손님용 프린터 설정: {self._customer_printer}")
         logger.info(f"주방용 프린터 설정: {self._kitchen_printer}")
@@ -168,6 +241,12 @@ class PrinterManager:
                 json.dump(config, f, ensure_ascii=False, indent=2)
             
             logger.info("설정 저장 완료")
+            self._customer_group = PrinterGroup.from_config("customer", self._customer_printer)
+
+            # 상태 모니터가 동작 중이면 바뀐 장치 정보로 조회 대상 갱신
+            monitor = get_status_monitor()
+            if monitor.is_running():
+                monitor.set_probes(self._status_probes())
             return True
         except Exception as e:
             logger.exception("설정 저장 오류: %s", e)
@@ -205,9 +284,23 @@ class PrinterManager:
 
     def set_customer_printer_type(self, printer_type: str, extra_info: dict = None) -> bool:
         """손님용 프린터 타입을 설정합니다."""
-        if printer_type not in ["escpos", "default"]:
+        if printer_type not in ["escpos", "default", "network"]:
             logger.error(f"지원하지 않는 프린터 타입: {printer_type}")
             return False
+
+        if printer_type == "network":
+            # 주소 없이 네트워크 타입으로 바꾸면 출력할 수 없으므로 먼저 검증
+            network_info = extra_info or self.network_info
+            address = str(network_info.get("address", "")).strip()
+            try:
+                port = int(network_info.get("port") or NETWORK_DEFAULT_PORT)
+            except ValueError:
+                logger.error(f"잘못된 네트워크 프린터 포트: {network_info.get('port')}")
+                return False
+            if not address or not 0 < port < 65536:
+                logger.error(f"잘못된 네트워크 프린터 정보: {network_info}")
+                return False
+            self._customer_printer["network_info"] = {"address": address, "port": port}
         
         self._customer_printer["printer_type"] = printer_type
         
@@ -253,6 +346,25 @@ class PrinterManager:
         """손님용 프린터 설정을 반환합니다."""
         return self._customer_printer.copy()
 
+    def set_kitchen_stations(self, stations: List[dict]) -> bool:
+        """주방 스테이션 분배 설정을 업데이트합니다. (빈 목록이면 기본 주방 프린터만 사용)"""
+        if not all(validate_station_config(station) for station in stations):
+            logger.error(f"잘못된 주방 스테이션 설정: {stations}")
+            return False
+        self._kitchen_printer["stations"] = stations
+        return self.save_config()
+
+    def set_customer_printer_group(self, mode: str, members: List[dict]) -> bool:
+        """손님용 프린터 그룹(장애 조치/부하 분산) 설정을 업데이트합니다. (빈 목록이면 단일 프린터)"""
+        if mode not in GROUP_MODES:
+            logger.error(f"잘못된 프린터 그룹 모드: {mode}")
+            return False
+        if not all(validate_member_config(member) for member in members):
+            logger.error(f"잘못된 프린터 그룹 설정: {members}")
+            return False
+        self._customer_printer["group"] = {"mode": mode, "members": members}
+        return self.save_config()
+
     def get_kitchen_printer_config(self) -> dict:
         """주방용 프린터 설정을 반환합니다."""
         return self._kitchen_printer.copy()
@@ -293,10 +405,81 @@ class PrinterManager:
         logger.info(f"주문 {order_id}: 자동 출력 조건을 만족함")
         return True
 
+    def _status_probes(self) -> dict:
+        """상태 모니터가 사용할 프린터별 상태 조회 함수를 구성합니다."""
+        probes = {}
+        for status_key, device in self._customer_group.members:
+            probes[status_key] = self._customer_probe(device)
+
+        if self._kitchen_printer.get("enabled", True):
+            router = KitchenRouter(self._kitchen_printer)
+            probes["kitchen"] = router.default_station.probe_status
+            for station in router.stations:
+                probes[f"kitchen:{station.name}"] = station.probe_status
+        return probes
+
+    def _customer_probe(self, device: dict):
+        """손님용 프린터(그룹 구성원) 하나의 상태 조회 함수"""
+        printer_type = device.get("printer_type")
+        if printer_type == "escpos":
+            usb_info = device.get("usb_info", {})
+            try:
+                vendor_id = int(usb_info.get("vendor_id", ""), 16)
+                product_id = int(usb_info.get("product_id", ""), 16)
+                interface = int(usb_info.get("interface", "0"))
+                return partial(probe_usb_status, vendor_id, product_id, interface)
+            except ValueError:
+                return lambda: PrinterStatus(reachable=False, message="USB 정보 미설정")
+        elif printer_type == "default":
+            return partial(self._probe_windows_printer, device.get("printer_name"))
+        elif printer_type == "network":
+            network_info = device.get("network_info", {})
+            if network_info.get("address"):
+                return partial(
+                    probe_network_status,
+                    network_info["address"],
+                    network_info.get("port", NETWORK_DEFAULT_PORT)
+                )
+            return lambda: PrinterStatus(reachable=False, message="네트워크 정보 미설정")
+        return lambda: PrinterStatus(reachable=False, message=f"알 수 없는 프린터 타입: {printer_type}")
+
+    @staticmethod
+    def _probe_windows_printer(printer_name: str) -> PrinterStatus:
+        """윈도우 프린터가 목록에 있는지 확인합니다."""
+        flags = win32print.PRINTER_ENUM_LOCAL | win32print.PRINTER_ENUM_CONNECTIONS
+        printers = [p[2] for p in win32print.EnumPrinters(flags)]
+        if printer_name in printers:
+            return PrinterStatus(reachable=True, online=True)
+        return PrinterStatus(reachable=False, message="프린터를 찾을 수 없음")
+
+    def start_status_monitor(self) -> None:
+        """백그라운드 프린터 상태 모니터를 시작합니다."""
+        monitor = get_status_monitor()
+        monitor.interval = self._auto_print_config.get("status_poll_interval", 5)
+        monitor.set_probes(self._status_probes())
+        monitor.start()
+
+    def get_printer_status(self, name: str = "customer"):
+        """상태 모니터에 캐시된 프린터 상태를 반환합니다. (장치 조회 없음)"""
+        return get_status_monitor().get_status(name)
+
     def check_printer_status(self) -> bool:
-        """프린터 상태를 확인합니다."""
+        """프린터 상태를 확인합니다. 상태 모니터가 동작 중이면 캐시된 상태를 사용합니다."""
         if not self._auto_print_config.get("check_printer_status", True):
             return True
+
+        monitor = get_status_monitor()
+        status = monitor.get_status("customer") if monitor.is_running() else None
+        if status is not None:
+            if status.is_ready:
+                return True
+            # 그룹의 다른 프린터가 출력 가능하면 장애 조치로 출력
+            standby = [key for key, _ in self._customer_group.members[1:] if PrinterGroup.is_healthy(key)]
+            if standby:
+                logger.warning(f"손님용 프린터 출력 불가 상태: {status.describe()} - 대체 프린터 사용: {standby}")
+                return True
+            logger.warning(f"손님용 프린터 출력 불가 상태: {status.describe()}")
+            return False
             
         try:
             printer_type = self.printer_type
@@ -316,6 +499,15 @@ class PrinterManager:
                     logger.warning("ESC/POS 프린터의 USB 정보가 설정되지 않았습니다.")
                     return False
                 return True
+
+            elif printer_type == "network":
+                # 네트워크 프린터의 경우 실시간 상태 조회
+                network_info = self.network_info
+                if not network_info.get("address"):
+                    logger.warning("네트워크 프린터 주소가 설정되지 않았습니다.")
+                    return False
+                status = probe_network_status(network_info["address"], network_info.get("port", NETWORK_DEFAULT_PORT))
+                return status.is_ready
                 
             else:
                 logger.warning(f"알 수 없는 프린터 타입: {printer_type}")
@@ -325,17 +517,88 @@ class PrinterManager:
             logger.error(f"프린터 상태 확인 오류: {e}")
             return False
 
+    def _customer_logo_key(self, device: Optional[dict] = None) -> Optional[str]:
+        """손님용 프린터에 로고가 저장되어 있는지 확인하고(없으면 업로드) 영수증에서 참조할 키 코드를 반환합니다."""
+        device = device or self._customer_printer
+        logo = device.get("logo", {})
+        path = logo.get("path")
+        if not path:
+            return None
+        if not Path(path).exists():
+            logger.warning(f"로고 이미지 파일이 없습니다: {path}")
+            return None
+
+        try:
+            printer_type = device.get("printer_type")
+            if printer_type == "escpos":
+                usb_info = device.get("usb_info", {})
+                vendor_id = int(usb_info.get("vendor_id"), 16)
+                product_id = int(usb_info.get("product_id"), 16)
+                interface = int(usb_info.get("interface", "0"))
+                device_key = usb_device_key(vendor_id, product_id)
+                write = partial(write_usb_raw, vendor_id, product_id, interface)
+            elif printer_type == "network":
+                network_info = device.get("network_info", {})
+                address = network_info.get("address")
+                port = network_info.get("port", NETWORK_DEFAULT_PORT)
+                if not address:
+                    return None
+                device_key = network_device_key(address, port)
+                write = partial(get_network_pool().send, address, port)
+            else:
+                return None  # ESC/POS 명령을 보낼 수 없는 프린터
+        except (TypeError, ValueError):
+            return None
+
+        asset_manager = get_asset_manager()
+        asset = asset_manager.get_asset(path, logo.get("width", DEFAULT_LOGO_WIDTH))
+        if asset_manager.ensure_asset(device_key, asset, write):
+            return asset.key
+        return None
+
+    def _customer_receipt_options(self, device: Optional[dict] = None, upload_logo: bool = True) -> dict:
+        """손님용 영수증 렌더링 옵션 (로고, 바코드, 픽업 QR)
+
+        upload_logo가 False이면 프린터에 접근하지 않고 로고 설정 여부만 반영합니다. (미리보기용)
+        """
+        printer = device or self._customer_printer
+        if upload_logo:
+            logo_key = self._customer_logo_key(printer)
+        else:
+            path = printer.get("logo", {}).get("path")
+            has_logo = bool(path) and Path(path).exists() and printer.get("printer_type") in ("escpos", "network")
+            logo_key = LOGO_KEY if has_logo else None
+        # 윈도우 프린터는 ESC/POS 명령을 해석하지 않으므로 텍스트 대체 문구만 출력됨
+        return {
+            "logo_key": logo_key,
+            "order_barcode": printer.get("order_barcode", False),
+            "pickup_qr_url": printer.get("pickup_qr_url") or None,
+        }
+
     def print_customer_receipt(self, order_data: dict) -> bool:
-        """손님용 영수증을 출력합니다."""
-        printer_type = self.printer_type
+        """손님용 영수증을 출력합니다. 프린터 그룹이 설정되어 있으면 출력 불가/실패 시 다른 프린터로 출력합니다."""
+        return self._customer_group.run_batch(
+            1, lambda member, indexes: [self._print_customer_on(member[1], order_data)]
+        )[0]
+
+    def _print_customer_on(self, device: dict, order_data: dict) -> bool:
+        """손님용 영수증을 지정한 프린터(그룹 구성원) 하나로 출력합니다."""
+        printer_type = device.get("printer_type")
         success = False
         error_msg = None
+        rendered = None
 
         logger.info(f"손님용 프린터 출력 시작 - 타입: {printer_type}")
 
         try:
+            # 실제 프린터와 보관소가 공유할 렌더링 결과 (재출력 시 캐시 사용)
+            codepage = ESCPOS_CODEPAGE if printer_type in ("escpos", "network") else None
+            columns = get_paper_columns(device.get("paper_width", DEFAULT_PAPER_WIDTH))
+            rendered = render_customer_receipt(order_data, codepage=codepage, columns=columns,
+                                               **self._customer_receipt_options(device))
+
             if printer_type == "escpos":
-                usb_info = self.usb_info
+                usb_info = device.get("usb_info", {})
                 vendor_id = usb_info.get("vendor_id")
                 product_id = usb_info.get("product_id")
                 
@@ -353,7 +616,8 @@ class PrinterManager:
                             order_data,
                             vendor_id_int,
                             product_id_int,
-                            interface
+                            interface,
+                            rendered=rendered
                         )
                         
                         if success:
@@ -365,14 +629,27 @@ class PrinterManager:
                         error_msg = f"USB ID 변환 오류: {e}"
                         
             elif printer_type == "default":
-                printer_name = self.printer_name
+                printer_name = device.get("printer_name")
                 if not printer_name:
                     error_msg = "윈도우 프린터 이름이 설정되지 않았습니다."
                 else:
                     logger.info(f"윈도우 프린터 출력 시도: {printer_name}")
-                    success = print_receipt_win(order_data, printer_name)
+                    success = print_receipt_win(order_data, printer_name, rendered=rendered)
                     if not success:
                         error_msg = f"윈도우 프린터({printer_name}) 출력 실패"
+
+            elif printer_type == "network":
+                network_info = device.get("network_info", {})
+                address = network_info.get("address")
+                if not address:
+                    error_msg = "네트워크 프린터 주소가 설정되지 않았습니다."
+                else:
+                    port = network_info.get("port", NETWORK_DEFAULT_PORT)
+                    success = print_receipt_network(order_data, address, port, rendered=rendered)
+                    if success:
+                        logger.info("손님용 네트워크 프린터 출력 성공")
+                    else:
+                        error_msg = f"네트워크 프린터({address}:{port}) 출력 실패"
             else:
                 error_msg = f"지원하지 않는 프린터 타입: {printer_type}"
 
@@ -383,6 +660,7 @@ class PrinterManager:
         # 실패 시 오류 로그 작성
         if error_msg:
             logger.error(error_msg)
+            get_status_monitor().poll_now()  # 실패 원인 확인을 위해 상태 즉시 재조회
             error_logger = get_error_logger()
             if error_logger:
                 error_logger.log_printer_error(
@@ -391,18 +669,16 @@ class PrinterManager:
                     order_id=order_data.get('order_id', 'Unknown')
                 )
 
-        # 파일로 백업 출력
-        file_success = file_print_receipt(order_data)
-        if file_success:
-            logger.info("파일 프린터 출력 성공")
-        else:
-            logger.error("파일 프린터 출력 실패")
+        # 실제로 출력된 영수증만 보관 (백그라운드 기록, 출력 경로를 막지 않음)
+        # 그룹 장애 조치/재시도에서 실패한 시도는 보관하지 않음
+        if success and rendered is not None:
+            archive_receipt(order_data.get('order_id', 'Unknown'), "customer", rendered.data)
 
-        logger.info(f"손님용 프린터 출력 결과: 실제프린터={success}, 파일={file_success}")
+        logger.info(f"손님용 프린터 출력 결과: {success}")
         return success
 
     def print_kitchen_receipt(self, order_data: dict) -> bool:
-        """주방용 영수증을 출력합니다."""
+        """주방용 영수증을 출력합니다. 스테이션이 설정되어 있으면 스테이션별로 나누어 출력합니다."""
         kitchen_config = self._kitchen_printer
         
         # 주방 프린터가 비활성화된 경우
@@ -410,20 +686,17 @@ class PrinterManager:
             logger.info("주방 프린터가 비활성화되어 있습니다.")
             return True
 
-        com_port = kitchen_config.get("com_port", "COM3")
-        baudrate = kitchen_config.get("baudrate", 9600)
-        
         try:
-            success = print_kitchen_receipt_com(order_data, com_port, baudrate)
+            success = KitchenRouter(kitchen_config).dispatch([order_data])[0]
             if success:
-                logger.info(f"주방용 영수증 출력 성공: {com_port}")
+                logger.info(f"주방용 영수증 출력 성공: 주문 {order_data.get('order_id')}")
             else:
-                logger.error(f"주방용 COM 포트 프린터({com_port}) 출력 실패")
+                logger.error(f"주방용 프린터 출력 실패: 주문 {order_data.get('order_id')}")
                 error_logger = get_error_logger()
                 if error_logger:
                     error_logger.log_printer_error(
                         printer_type="com_kitchen",
-                        error=Exception(f"주방용 COM 포트 프린터({com_port}) 출력 실패"),
+                        error=Exception("주방용 프린터 출력 실패"),
                         order_id=order_data.get('order_id', 'Unknown')
                     )
             return success
@@ -454,6 +727,177 @@ class PrinterManager:
 
         return results
 
+    def print_customer_receipts_batch(self, orders: List[dict]) -> List[bool]:
+        """
+        여러 주문의 손님용 영수증을 프린터별 한 번의 장치 세션으로 출력합니다.
+        프린터 그룹이 부하 분산 모드이면 출력 가능한 프린터들이 주문을 나누어 동시에 출력합니다.
+        """
+        if not orders:
+            return []
+
+        def print_batch(member, indexes: List[int]) -> List[bool]:
+            return self._print_customer_batch_on(member[1], [orders[index] for index in indexes])
+
+        results = self._customer_group.run_batch(len(orders), print_batch)
+        if not all(results):
+            get_status_monitor().poll_now()
+        return results
+
+    def _print_customer_batch_on(self, device: dict, orders: List[dict]) -> List[bool]:
+        """여러 주문의 손님용 영수증을 지정한 프린터 하나의 장치 세션으로 출력합니다."""
+        if device.get("printer_type") != "escpos":
+            # 세션 재사용이 의미 없는 프린터는 주문별로 출력
+            return [self._print_customer_on(device, order) for order in orders]
+
+        usb_info = device.get("usb_info", {})
+        try:
+            vendor_id = int(usb_info.get("vendor_id"), 16)
+            product_id = int(usb_info.get("product_id"), 16)
+            interface = int(usb_info.get("interface", "0"))
+        except (TypeError, ValueError) as e:
+            logger.error(f"ESC/POS 프린터 USB 정보 오류: {e}")
+            return [False] * len(orders)
+
+        columns = get_paper_columns(device.get("paper_width", DEFAULT_PAPER_WIDTH))
+        options = self._customer_receipt_options(device)
+        rendered_list = [
+            render_customer_receipt(order, codepage=ESCPOS_CODEPAGE, columns=columns, **options)
+            for order in orders
+        ]
+
+        results = print_receipts_esc_usb_batch(
+            orders, vendor_id, product_id, interface, rendered_list=rendered_list
+        )
+
+        error_logger = get_error_logger()
+        for order, rendered, success in zip(orders, rendered_list, results):
+            if not success:
+                logger.error(f"손님용 영수증 일괄 출력 실패: 주문 {order.get('order_id')}")
+                if error_logger:
+                    error_logger.log_printer_error(
+                        printer_type="escpos",
+                        error=Exception("ESC/POS 프린터 일괄 출력 실패"),
+                        order_id=order.get('order_id', 'Unknown')
+                    )
+            else:
+                # 실제로 출력된 영수증만 보관 (백그라운드 기록)
+                archive_receipt(order.get('order_id', 'Unknown'), "customer", rendered.data)
+        return results
+
+    def render_receipt_preview(self, order_data: dict, kind: str = "customer") -> List[Tuple[str, int, RenderedReceipt]]:
+        """
+        주문의 영수증을 실제 출력과 같은 설정(용지 폭, 로고, 바코드, 스테이션 분배)으로 렌더링합니다.
+        프린터나 디스크에 접근하지 않으며 렌더링 캐시를 공유합니다. (미리보기용)
+
+        Args:
+            order_data: 출력 형식의 주문 데이터
+            kind: "customer" 또는 "kitchen"
+
+        Returns:
+            List[Tuple[str, int, RenderedReceipt]]: (영수증 종류, 한 줄 문자 수, 렌더링 결과) 목록
+                (주방은 스테이션별 주문서마다 하나)
+        """
+        if kind == "customer":
+            device = self._customer_printer
+            codepage = ESCPOS_CODEPAGE if device.get("printer_type") in ("escpos", "network") else None
+            columns = get_paper_columns(device.get("paper_width", DEFAULT_PAPER_WIDTH))
+            rendered = render_customer_receipt(order_data, codepage=codepage, columns=columns,
+                                               **self._customer_receipt_options(device, upload_logo=False))
+            return [("customer", columns, rendered)]
+
+        router = KitchenRouter(self._kitchen_printer)
+        previews = []
+        for station, ticket in router.split_order(order_data):
+            ticket_kind = f"kitchen:{station.name}" if router.is_routed else "kitchen"
+            rendered = render_kitchen_receipt(ticket, station.columns, router.order_barcode)
+            previews.append((ticket_kind, station.columns, rendered))
+        return previews
+
+    def kitchen_queue_etas(self) -> List[TicketEta]:
+        """주방에서 아직 수신하지 않은 것으로 예상되는 주문서 목록 (수신 예상 시각 순)"""
+        return get_kitchen_scheduler().etas()
+
+    def kitchen_drain_etas(self) -> dict:
+        """스테이션별 전송 큐가 비기까지 남은 예상 시간 (초)"""
+        scheduler = get_kitchen_scheduler()
+        router = KitchenRouter(self._kitchen_printer)
+        return {station.name: scheduler.drain_eta(station.device_key) for station in router.all_stations()}
+
+    def kitchen_queue_depths(self) -> dict:
+        """주방 프린터(상태 모니터 키)별 (전송 대기 주문서 수, 큐가 비기까지 남은 예상 시간(초))"""
+        scheduler = get_kitchen_scheduler()
+        router = KitchenRouter(self._kitchen_printer)
+        pending = {}
+        for entry in scheduler.etas():
+            pending[entry.station] = pending.get(entry.station, 0) + 1
+        depths = {}
+        for station in router.all_stations():
+            key = "kitchen" if station is router.default_station else f"kitchen:{station.name}"
+            depths[key] = (pending.get(station.name, 0), scheduler.drain_eta(station.device_key))
+        return depths
+
+    def print_kitchen_receipts_batch(self, orders: List[dict]) -> List[bool]:
+        """여러 주문의 주방용 영수증을 프린터(스테이션)별 한 번의 장치 세션으로 출력합니다."""
+        kitchen_config = self._kitchen_printer
+        if not kitchen_config.get("enabled", True):
+            logger.info("주방 프린터가 비활성화되어 있습니다.")
+            return [True] * len(orders)
+
+        results = KitchenRouter(kitchen_config).dispatch(orders)
+        self._log_kitchen_failures(orders, results)
+        return results
+
+    def print_kitchen_receipts_async(self, orders: List[dict]) -> "Future[List[bool]]":
+        """
+        여러 주문의 주방용 영수증 전송을 시작하고 바로 반환합니다. (자동 출력용)
+
+        렌더링과 전송 순서 결정은 호출한 스레드에서 하고 장치 전송은 주방 전송 스레드 풀에서 진행되므로,
+        전송하는 동안 호출한 쪽(GUI 스레드 등)이 막히지 않고 운영 현황 탭에 남은 전송 시간이 표시됩니다.
+
+        Returns:
+            Future[List[bool]]: 주문별 주방용 출력 성공 여부
+        """
+        kitchen_config = self._kitchen_printer
+        if not kitchen_config.get("enabled", True):
+            done: "Future[List[bool]]" = Future()
+            done.set_result([True] * len(orders))
+            return done
+
+        future = KitchenRouter(kitchen_config).dispatch_async(orders)
+        future.add_done_callback(lambda f: self._log_kitchen_failures(orders, f.result()))
+        return future
+
+    def _log_kitchen_failures(self, orders: List[dict], results: List[bool]) -> None:
+        if all(results):
+            return
+        error_logger = get_error_logger()
+        if error_logger:
+            failed = [str(order.get('order_id')) for order, ok in zip(orders, results) if not ok]
+            error_logger.log_printer_error(
+                printer_type="com_kitchen",
+                error=Exception("주방용 프린터 일괄 출력 실패"),
+                order_id=",".join(failed)
+            )
+
+    def print_both_receipts_batch(self, orders: List[dict]) -> List[dict]:
+        """여러 주문의 손님용/주방용 영수증을 프린터별 단일 세션으로 출력합니다."""
+        try:
+            customer_results = self.print_customer_receipts_batch(orders)
+        except Exception as e:
+            logger.error(f"손님용 영수증 일괄 출력 오류: {e}")
+            customer_results = [False] * len(orders)
+
+        try:
+            kitchen_results = self.print_kitchen_receipts_batch(orders)
+        except Exception as e:
+            logger.error(f"주방용 영수증 일괄 출력 오류: {e}")
+            kitchen_results = [False] * len(orders)
+
+        return [
+            {"customer": customer, "kitchen": kitchen}
+            for customer, kitchen in zip(customer_results, kitchen_results)
+        ]
+
     # 기존 호환성을 위한 메서드들
     def print_receipt(self, order_data: dict) -> bool:
         """주문 데이터를 기반으로 영수증을 출력합니다. (기존 호환성 유지)"""
@@ -0,0 +1,285 @@
+# -*- coding: utf-8 -*-
+"""네트워크(TCP 9100, Raw) ESC/POS 프린터 출력 모듈.
+
+하나의 백그라운드 asyncio 이벤트 루프가 프린터(주소, 포트)별 연결을 유지하고,
+여러 LAN 프린터로의 전송을 동시에 처리합니다. 연결은 재사용되며(keep-alive),
+일정 시간 사용하지 않으면 닫힙니다. 동기 코드에서는 모듈 함수를 통해 호출합니다.
+"""
+import asyncio
+import logging
+import socket
+import threading
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+from src.printer.render_cache import RenderedReceipt
+from src.printer.receipt_template import render_customer_receipt
+from src.printer.status_monitor import (
+    DLE_EOT_OFFLINE, DLE_EOT_PAPER, DLE_EOT_PRINTER, PrinterStatus, parse_realtime_status
+)
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_PORT = 9100
+CONNECT_TIMEOUT = 3.0   # 연결 타임아웃 (초)
+WRITE_TIMEOUT = 10.0    # 전송(drain) 타임아웃 (초)
+STATUS_TIMEOUT = 0.5    # 상태 응답 1바이트 대기 (초)
+IDLE_TIMEOUT = 60.0     # 사용하지 않는 연결을 닫기까지의 시간 (초)
+
+PrinterAddress = Tuple[str, int]
+
+
+def network_device_key(address: str, port: int = DEFAULT_PORT) -> str:
+    """네트워크 프린터의 장치 키를 반환합니다."""
+    return f"tcp:{address}:{port}"
+
+
+class _Connection:
+    """프린터 하나와의 TCP 연결. 같은 프린터로의 작업은 잠금으로 순서대로 처리됩니다."""
+    __slots__ = ("reader", "writer", "lock", "last_used")
+
+    def __init__(self) -> None:
+        self.reader: Optional[asyncio.StreamReader] = None
+        self.writer: Optional[asyncio.StreamWriter] = None
+        self.lock = asyncio.Lock()
+        self.last_used = time.monotonic()
+
+    @property
+    def is_open(self) -> bool:
+        return self.writer is not None and not self.writer.is_closing()
+
+    def close(self) -> None:
+        if self.writer is not None:
+            self.writer.close()
+        self.reader = self.writer = None
+
+
+class NetworkPrinterPool:
+    """네트워크 프린터 연결 풀 (전용 스레드의 asyncio 이벤트 루프에서 동작)"""
+
+    def __init__(self, connect_timeout: float = CONNECT_TIMEOUT, write_timeout: float = WRITE_TIMEOUT,
+                 idle_timeout: float = IDLE_TIMEOUT) -> None:
+        self.connect_timeout = connect_timeout
+        self.write_timeout = write_timeout
+        self.idle_timeout = idle_timeout
+        self._connections: Dict[PrinterAddress, _Connection] = {}
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+        self._start_lock = threading.Lock()
+        self._reaper: Optional[asyncio.Task] = None
+
+    # ------------------------------------------------------------------
+    # 이벤트 루프 관리
+    def _ensure_loop(self) -> asyncio.AbstractEventLoop:
+        with self._start_lock:
+            if self._loop is None or not self._thread.is_alive():
+                loop = asyncio.new_event_loop()
+                ready = threading.Event()
+
+                def run() -> None:
+                    asyncio.set_event_loop(loop)
+                    loop.call_soon(ready.set)
+                    self._reaper = loop.create_task(self._reap_idle())
+                    loop.run_forever()
+
+                self._loop = loop
+                self._connections = {}
+                self._thread = threading.Thread(target=run, name="NetworkPrinterPool", daemon=True)
+                self._thread.start()
+                ready.wait()
+                logger.info("네트워크 프린터 연결 풀 시작")
+            return self._loop
+
+    def _run(self, coro, timeout: float) -> Any:
+        """코루틴을 풀의 이벤트 루프에서 실행하고 결과를 기다립니다."""
+        future = asyncio.run_coroutine_threadsafe(coro, self._ensure_loop())
+        return future.result(timeout)
+
+    def close(self) -> None:
+        """모든 연결을 닫고 이벤트 루프를 종료합니다."""
+        with self._start_lock:
+            loop, thread = self._loop, self._thread
+            self._loop = self._thread = None
+        if loop is None:
+            return
+
+        async def close_all() -> None:
+            if self._reaper is not None:
+                self._reaper.cancel()
+            for connection in self._connections.values():
+                connection.close()
+            self._connections.clear()
+
+        try:
+            asyncio.run_coroutine_threadsafe(close_all(), loop).result(2.0)
+        except Exception as e:
+            logger.debug(f"네트워크 프린터 연결 종료 오류: {e}")
+        loop.call_soon_threadsafe(loop.stop)
+        thread.join(timeout=2.0)
+        logger.info("네트워크 프린터 연결 풀 종료")
+
+    # ------------------------------------------------------------------
+    # 비동기 작업 (이벤트 루프 스레드에서 실행)
+    async def _reap_idle(self) -> None:
+        """오래 사용하지 않은 연결을 주기적으로 닫습니다."""
+        while True:
+            await asyncio.sleep(self.idle_timeout / 2)
+            now = time.monotonic()
+            for address, connection in list(self._connections.items()):
+                if connection.is_open and not connection.lock.locked() and now - connection.last_used > self.idle_timeout:
+                    logger.debug(f"유휴 연결 종료: {network_device_key(*address)}")
+                    connection.close()
+
+    async def _open(self, address: PrinterAddress, connection: _Connection) -> None:
+        reader, writer = await asyncio.wait_for(asyncio.open_connection(*address), self.connect_timeout)
+        sock = writer.get_extra_info("socket")
+        if sock is not None:
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        connection.reader, connection.writer = reader, writer
+        logger.info(f"네트워크 프린터 연결: {network_device_key(*address)}")
+
+    async def _write(self, address: PrinterAddress, connection: _Connection, data: bytes) -> None:
+        if not connection.is_open:
+            await self._open(address, connection)
+        connection.writer.write(data)
+        await asyncio.wait_for(connection.writer.drain(), self.write_timeout)
+
+    async def send_async(self, address: PrinterAddress, data: bytes) -> bool:
+        """프린터로 데이터를 전송합니다. 재사용한 연결이 끊겨 있으면 한 번 다시 연결합니다."""
+        connection = self._connections.setdefault(address, _Connection())
+        async with connection.lock:
+            # 재사용한 연결이면 한 번 더 시도 (프린터가 유휴 연결을 끊은 경우)
+            attempts = 2 if connection.is_open else 1
+            try:
+                for attempt in range(attempts):
+                    try:
+                        await self._write(address, connection, data)
+                        return True
+                    except Exception as e:
+                        connection.close()
+                        if attempt + 1 < attempts:
+                            logger.debug(f"끊긴 연결 재시도 ({network_device_key(*address)}): {e}")
+                        else:
+                            logger.error(f"네트워크 프린터 전송 실패 ({network_device_key(*address)}): {e}")
+                return False
+            finally:
+                connection.last_used = time.monotonic()
+
+    async def query_status_async(self, address: PrinterAddress) -> PrinterStatus:
+        """DLE EOT 1/2/4로 프린터 실시간 상태를 조회합니다."""
+        connection = self._connections.setdefault(address, _Connection())
+        async with connection.lock:
+            try:
+                if not connection.is_open:
+                    await self._open(address, connection)
+                responses = []
+                for command in (DLE_EOT_PRINTER, DLE_EOT_OFFLINE, DLE_EOT_PAPER):
+                    connection.writer.write(command)
+                    await asyncio.wait_for(connection.writer.drain(), self.write_timeout)
+                    try:
+                        data = await asyncio.wait_for(connection.reader.read(1), STATUS_TIMEOUT)
+                    except asyncio.TimeoutError:
+                        data = b""
+                    if not data and command == DLE_EOT_PRINTER:
+                        if connection.reader.at_eof():
+                            raise ConnectionError("연결이 닫혔습니다")
+                        # 연결은 되지만 실시간 상태를 지원하지 않는 장치
+                        return PrinterStatus(reachable=True, online=True, message="정상 (실시간 상태 미지원)")
+                    responses.append(data[0] if data else None)
+                return parse_realtime_status(*responses)
+            except Exception as e:
+                connection.close()
+                logger.debug(f"네트워크 프린터 상태 조회 실패 ({network_device_key(*address)}): {e}")
+                return PrinterStatus(reachable=False, message="네트워크 연결 실패")
+            finally:
+                connection.last_used = time.monotonic()
+
+    # ------------------------------------------------------------------
+    # 동기 인터페이스
+    def send(self, address: str, port: int, data: bytes) -> bool:
+        """프린터 하나로 데이터를 전송하고 완료를 기다립니다."""
+        try:
+            return self._run(self.send_async((address, port), data), self.connect_timeout + 2 * self.write_timeout)
+        except Exception as e:
+            logger.error(f"네트워크 프린터 전송 오류 ({network_device_key(address, port)}): {e}")
+            return False
+
+    def send_many(self, jobs: List[Tuple[str, int, bytes]]) -> List[bool]:
+        """여러 프린터로의 전송을 동시에 실행합니다.
+
+        Args:
+            jobs: (주소, 포트, 데이터) 목록. 같은 프린터로의 작업은 순서대로 전송됩니다.
+
+        Returns:
+            List[bool]: 작업별 전송 성공 여부
+        """
+        if not jobs:
+            return []
+
+        async def gather() -> List[bool]:
+            return await asyncio.gather(*(self.send_async((address, port), data) for address, port, data in jobs))
+
+        try:
+            return list(self._run(gather(), self.connect_timeout + 2 * self.write_timeout * len(jobs)))
+        except Exception as e:
+            logger.error(f"네트워크 프린터 동시 전송 오류: {e}")
+            return [False] * len(jobs)
+
+    def query_status(self, address: str, port: int) -> PrinterStatus:
+        """프린터 실시간 상태를 조회합니다."""
+        try:
+            return self._run(self.query_status_async((address, port)), self.connect_timeout + self.write_timeout)
+        except Exception as e:
+            logger.debug(f"네트워크 프린터 상태 조회 오류 ({network_device_key(address, port)}): {e}")
+            return PrinterStatus(reachable=False, message="네트워크 연결 실패")
+
+
+# 글로벌 연결 풀 인스턴스
+_network_pool: Optional[NetworkPrinterPool] = None
+
+
+def get_network_pool() -> NetworkPrinterPool:
+    """글로벌 네트워크 프린터 연결 풀 반환 (없으면 생성)"""
+    global _network_pool
+    if _network_pool is None:
+        _network_pool = NetworkPrinterPool()
+    return _network_pool
+
+
+def shutdown_network_pool() -> None:
+    """글로벌 네트워크 프린터 연결 풀 안전 종료"""
+    global _network_pool
+    if _network_pool:
+        _network_pool.close()
+        _network_pool = None
+
+
+def probe_network_status(address: str, port: int = DEFAULT_PORT) -> PrinterStatus:
+    """네트워크 프린터의 실시간 상태(DLE EOT)를 조회합니다. (상태 모니터용)"""
+    return get_network_pool().query_status(address, port)
+
+
+def print_receipt_network(order_data: Dict[str, Any], address: str, port: int = DEFAULT_PORT,
+                          codepage: Optional[int] = None, rendered: Optional[RenderedReceipt] = None) -> bool:
+    """
+    네트워크 ESC/POS 프린터로 손님용 영수증을 출력합니다.
+
+    Args:
+        order_data: 주문 데이터
+        address: 프린터 IP 주소
+        port: 프린터 포트 (기본값: 9100)
+        codepage: 프린터 코드페이지
+        rendered: 미리 렌더링된 영수증 (없으면 렌더링)
+
+    Returns:
+        bool: 출력 성공 여부
+    """
+    if rendered is None:
+        rendered = render_customer_receipt(order_data, codepage=codepage)
+
+    logger.info(f"네트워크 프린터 출력 시작: {network_device_key(address, port)}")
+    success = get_network_pool().send(address, port, rendered.data)
+    if success:
+        logger.info(f"네트워크 프린터 출력 완료 ({len(rendered.data)} bytes)")
+    return success
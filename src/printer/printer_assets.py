@@ -0,0 +1,241 @@
+# -*- coding: utf-8 -*-
+"""프린터 NV 그래픽(로고) 자산 관리.
+
+로고 이미지는 한 번만 디더링하여 프린터의 NV 그래픽 메모리에 키 코드로 저장하고,
+영수증에서는 키 코드로 참조합니다(GS ( L fn=69, 수 바이트). 장치별로 어떤 버전의
+자산이 저장되어 있는지 파일에 기록하여, 이미지가 바뀌었거나 새 프린터일 때만 업로드합니다.
+NV 메모리는 쓰기 횟수가 제한되어 있으므로 같은 자산을 다시 쓰지 않습니다.
+"""
+import hashlib
+import json
+import logging
+import struct
+import threading
+from pathlib import Path
+from typing import Callable, Dict, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+LOGO_KEY = "LG"          # 로고 NV 그래픽 키 코드 (kc1, kc2)
+DEFAULT_LOGO_WIDTH = 384  # 58mm/80mm 용지 모두에 들어가는 폭 (dots)
+ASSET_STATE_FILE = Path("printer_assets.json")
+
+# 8x8 Bayer 행렬 (순서 디더링 임계값, 0~1)
+_BAYER_8 = (
+    (0, 32, 8, 40, 2, 34, 10, 42),
+    (48, 16, 56, 24, 50, 18, 58, 26),
+    (12, 44, 4, 36, 14, 46, 6, 38),
+    (60, 28, 52, 20, 62, 30, 54, 22),
+    (3, 35, 11, 43, 1, 33, 9, 41),
+    (51, 19, 59, 27, 49, 17, 57, 25),
+    (15, 47, 7, 39, 13, 45, 5, 37),
+    (63, 31, 55, 23, 61, 29, 53, 21),
+)
+
+
+def _key_codes(key: str) -> bytes:
+    codes = key.encode("ascii")
+    if len(codes) != 2 or not all(32 <= c <= 126 for c in codes):
+        raise ValueError(f"잘못된 NV 그래픽 키 코드: {key!r}")
+    return codes
+
+
+def nv_print_command(key: str) -> bytes:
+    """NV 그래픽 출력 명령 (GS ( L fn=69, 가로/세로 1배)"""
+    return b'\x1d\x28\x4c\x06\x00\x30\x45' + _key_codes(key) + b'\x01\x01'
+
+
+def nv_delete_command(key: str) -> bytes:
+    """지정한 키 코드의 NV 그래픽 삭제 명령 (GS ( L fn=66)"""
+    return b'\x1d\x28\x4c\x04\x00\x30\x42' + _key_codes(key)
+
+
+def nv_define_command(key: str, width: int, height: int, raster: bytes) -> bytes:
+    """래스터 NV 그래픽 정의 명령 (GS 8 L fn=67, 단색)
+
+    Args:
+        key: 2글자 키 코드
+        width: 가로 dots (8의 배수)
+        height: 세로 dots
+        raster: 행 우선, 1바이트 = 가로 8 dots (MSB가 왼쪽, 1 = 검정)
+    """
+    body = bytes((0x30, 0x43, 0x30)) + _key_codes(key) + b'\x01' + struct.pack('<HH', width, height) + b'\x31' + raster
+    return b'\x1d\x38\x4c' + struct.pack('<I', len(body)) + body
+
+
+def dither_image(path: str, width: int = DEFAULT_LOGO_WIDTH) -> Tuple[int, int, bytes]:
+    """이미지를 흑백 래스터로 변환합니다. (numpy 벡터 연산 순서 디더링)
+
+    Returns:
+        Tuple[int, int, bytes]: (가로 dots, 세로 dots, 래스터 데이터)
+    """
+    # 로고 업로드 시에만 필요한 모듈
+    import numpy as np
+    from PIL import Image
+
+    image = Image.open(path)
+    if image.mode in ("RGBA", "LA", "P"):
+        # 투명 배경은 흰색으로 합성
+        rgba = image.convert("RGBA")
+        background = Image.new("RGBA", rgba.size, (255, 255, 255, 255))
+        background.alpha_composite(rgba)
+        image = background
+    gray = image.convert("L")
+    if gray.width > width:
+        gray = gray.resize((width, max(1, round(gray.height * width / gray.width))), Image.LANCZOS)
+    return dither_gray(np.asarray(gray))
+
+
+def dither_gray(gray) -> Tuple[int, int, bytes]:
+    """8비트 흑백 픽셀 배열(numpy, 높이 x 너비)을 순서 디더링하여 1비트 래스터로 변환합니다.
+
+    Returns:
+        Tuple[int, int, bytes]: (가로 dots, 세로 dots, 래스터 데이터)
+    """
+    import numpy as np
+
+    pixels = np.asarray(gray, dtype=np.float32) / 255.0
+    height, pixel_width = pixels.shape
+    bayer = (np.array(_BAYER_8, dtype=np.float32) + 0.5) / 64.0
+    threshold = np.tile(bayer, (height // 8 + 1, pixel_width // 8 + 1))[:height, :pixel_width]
+    black = pixels < threshold
+
+    # 가로를 8 dots 단위로 채워 행별로 비트 패킹
+    packed = np.packbits(black, axis=1)
+    return packed.shape[1] * 8, height, packed.tobytes()
+
+
+class PrinterAsset:
+    """프린터에 저장할 그래픽 자산 (이미지 경로 + 출력 폭)
+
+    이미지 파일의 수정 시각/크기가 바뀌면 버전을 다시 계산하고 변환 결과를 버립니다.
+    (프로그램 실행 중 로고 파일을 교체해도 다음 출력에서 새 로고를 업로드)
+    """
+    __slots__ = ("key", "path", "width", "_stamp", "_version", "_command", "_lock")
+
+    def __init__(self, key: str, path: str, width: int = DEFAULT_LOGO_WIDTH) -> None:
+        self.key = key
+        self.path = path
+        self.width = width
+        self._stamp: Optional[Tuple[int, int]] = None  # (수정 시각 ns, 파일 크기)
+        self._version: Optional[str] = None
+        self._command: Optional[bytes] = None
+        self._lock = threading.Lock()
+
+    def _refresh(self) -> None:
+        """파일이 바뀌었으면 버전을 다시 계산하고 변환 결과를 버립니다. (잠금 안에서 호출)"""
+        stat = Path(self.path).stat()
+        stamp = (stat.st_mtime_ns, stat.st_size)
+        if stamp == self._stamp:
+            return
+        digest = hashlib.sha1(Path(self.path).read_bytes())
+        digest.update(f":{self.width}".encode("ascii"))
+        if self._stamp is not None:
+            logger.info(f"로고 이미지 변경 감지: {self.path}")
+        self._version = digest.hexdigest()[:16]
+        self._command = None
+        self._stamp = stamp
+
+    @property
+    def version(self) -> str:
+        """원본 이미지와 변환 설정으로 정해지는 자산 버전"""
+        with self._lock:
+            self._refresh()
+            return self._version
+
+    def upload_command(self) -> bytes:
+        """기존 키 삭제 + NV 그래픽 정의 명령 (디더링은 이미지가 바뀔 때만 다시 수행)"""
+        with self._lock:
+            self._refresh()
+            if self._command is None:
+                width, height, raster = dither_image(self.path, self.width)
+                self._command = nv_delete_command(self.key) + nv_define_command(self.key, width, height, raster)
+                logger.info(f"로고 래스터 변환 완료: {self.path} ({width}x{height}, {len(raster)} bytes)")
+            return self._command
+
+
+class PrinterAssetManager:
+    """장치별 NV 그래픽 자산 버전을 추적하고 필요할 때만 업로드합니다."""
+
+    def __init__(self, state_file: Path = ASSET_STATE_FILE) -> None:
+        self.state_file = state_file
+        self._assets: Dict[Tuple[str, int], PrinterAsset] = {}
+        self._lock = threading.Lock()
+        self._state: Dict[str, Dict[str, str]] = self._load_state()
+
+    def _load_state(self) -> Dict[str, Dict[str, str]]:
+        try:
+            if self.state_file.exists():
+                with open(self.state_file, "r", encoding="utf-8") as f:
+                    return json.load(f).get("devices", {})
+        except Exception as e:
+            logger.warning(f"프린터 자산 상태 파일 로드 실패: {e}")
+        return {}
+
+    def _save_state(self) -> None:
+        try:
+            with open(self.state_file, "w", encoding="utf-8") as f:
+                json.dump({"devices": self._state}, f, ensure_ascii=False, indent=2)
+        except Exception as e:
+            logger.error(f"프린터 자산 상태 파일 저장 실패: {e}")
+
+    def get_asset(self, path: str, width: int = DEFAULT_LOGO_WIDTH, key: str = LOGO_KEY) -> PrinterAsset:
+        """이미지 경로별 자산 객체를 반환합니다. (변환 결과 재사용)"""
+        with self._lock:
+            asset = self._assets.get((path, width))
+            if asset is None or asset.key != key:
+                asset = self._assets[(path, width)] = PrinterAsset(key, path, width)
+            return asset
+
+    def device_version(self, device_key: str, key: str) -> Optional[str]:
+        """장치에 저장된 것으로 기록된 자산 버전을 반환합니다."""
+        with self._lock:
+            return self._state.get(device_key, {}).get(key)
+
+    def forget_device(self, device_key: str) -> None:
+        """장치의 자산 기록을 지웁니다. (프린터 교체/초기화 시 다음 출력에서 다시 업로드)"""
+        with self._lock:
+            if self._state.pop(device_key, None) is not None:
+                self._save_state()
+
+    def ensure_asset(self, device_key: str, asset: PrinterAsset, write: Callable[[bytes], bool]) -> bool:
+        """장치에 최신 자산이 있는지 확인하고, 없으면 업로드합니다.
+
+        Args:
+            device_key: 장치 키 (예: "usb:0525:a700", "tcp:192.168.0.100:9100")
+            asset: 저장할 자산
+            write: 장치에 바이트를 전송하는 함수 (성공 여부 반환)
+
+        Returns:
+            bool: 장치가 자산을 보유하고 있어 키 코드로 참조할 수 있는지 여부
+        """
+        try:
+            version = asset.version
+            if self.device_version(device_key, asset.key) == version:
+                return True
+
+            command = asset.upload_command()
+            logger.info(f"NV 그래픽 업로드: {device_key} [{asset.key}] ({len(command)} bytes)")
+            if not write(command):
+                logger.error(f"NV 그래픽 업로드 실패: {device_key} [{asset.key}]")
+                return False
+        except Exception as e:
+            logger.error(f"NV 그래픽 자산 준비 오류 ({asset.path}): {e}")
+            return False
+
+        with self._lock:
+            self._state.setdefault(device_key, {})[asset.key] = version
+            self._save_state()
+        return True
+
+
+# 글로벌 자산 관리자 인스턴스
+_asset_manager: Optional[PrinterAssetManager] = None
+
+
+def get_asset_manager() -> PrinterAssetManager:
+    """글로벌 프린터 자산 관리자 인스턴스 반환 (없으면 생성)"""
+    global _asset_manager
+    if _asset_manager is None:
+        _asset_manager = PrinterAssetManager()
+    return _asset_manager
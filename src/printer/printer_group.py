@@ -0,0 +1,193 @@
+# -*- coding: utf-8 -*-
+"""프린터 그룹 (장애 조치 / 부하 분산).
+
+손님용 프린터 하나 대신 여러 장치를 한 그룹으로 묶어 사용합니다.
+- failover: 기본 프린터가 상태 모니터 기준으로 출력 불가이면 다음 프린터로 출력
+- load_share: 출력 가능한 프린터들이 주문을 나누어 동시에 출력 (카운터에 프린터 2대면 처리량 2배)
+어느 모드든 출력에 실패한 주문은 아직 시도하지 않은 다른 프린터로 다시 출력합니다.
+
+설정 예 (printer_config.json의 customer_printer):
+    "group": {
+        "mode": "load_share",
+        "members": [
+            {"name": "카운터2", "printer_type": "network",
+             "network_info": {"address": "192.168.0.102", "port": 9100}}
+        ]
+    }
+그룹 구성원은 기본 손님용 프린터 설정(용지 폭, 로고 등)을 상속하고 장치 정보만 바꿉니다.
+"""
+import itertools
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+from src.printer.status_monitor import get_status_monitor
+
+logger = logging.getLogger(__name__)
+
+GROUP_MODES = ("failover", "load_share")
+DEFAULT_GROUP_MODE = "failover"
+MEMBER_PRINTER_TYPES = ("escpos", "default", "network")
+MAX_GROUP_WORKERS = 4
+
+# (상태 모니터 키, 장치 설정)
+GroupMember = Tuple[str, Dict[str, Any]]
+
+
+def member_status_key(base: str, name: Optional[str] = None) -> str:
+    """그룹 구성원의 상태 모니터 키 (기본 프린터는 base, 나머지는 "base:이름")"""
+    return f"{base}:{name}" if name else base
+
+
+def _member_config_error(member: Any) -> Optional[str]:
+    """그룹 구성원 설정 하나의 오류 내용을 반환합니다. (유효하면 None)"""
+    if not isinstance(member, dict):
+        return f"잘못된 프린터 그룹 구성원 설정: {member}"
+    if not member.get("name"):
+        return f"프린터 그룹 구성원 이름 없음: {member}"
+    printer_type = member.get("printer_type")
+    if printer_type not in MEMBER_PRINTER_TYPES:
+        return f"프린터 그룹에서 지원하지 않는 프린터 타입: {printer_type}"
+    if printer_type == "escpos":
+        usb_info = member.get("usb_info", {})
+        try:
+            int(usb_info.get("vendor_id", ""), 16)
+            int(usb_info.get("product_id", ""), 16)
+        except (TypeError, ValueError):
+            return f"프린터 그룹 구성원 USB 정보 오류: {member.get('name')}"
+    if printer_type == "network" and not member.get("network_info", {}).get("address"):
+        return f"프린터 그룹 구성원 네트워크 주소 없음: {member.get('name')}"
+    if printer_type == "default" and not member.get("printer_name"):
+        return f"프린터 그룹 구성원 윈도우 프린터 이름 없음: {member.get('name')}"
+    return None
+
+
+def validate_member_config(member: Dict[str, Any]) -> bool:
+    """그룹 구성원 설정 하나의 유효성을 검증합니다."""
+    error = _member_config_error(member)
+    if error:
+        logger.warning(error)
+        return False
+    return True
+
+
+class PrinterGroup:
+    """장애 조치/부하 분산 순서로 그룹 구성원을 고릅니다."""
+
+    def __init__(self, members: Sequence[GroupMember], mode: str = DEFAULT_GROUP_MODE) -> None:
+        self.members = list(members)
+        self.mode = mode if mode in GROUP_MODES else DEFAULT_GROUP_MODE
+        self._turn = itertools.count()
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_config(cls, base: str, config: Dict[str, Any]) -> "PrinterGroup":
+        """기본 프린터 설정과 group 설정으로 그룹을 구성합니다."""
+        group = config.get("group", {})
+        primary = {key: value for key, value in config.items() if key != "group"}
+        members: List[GroupMember] = [(base, primary)]
+        for member in group.get("members", []):
+            if _member_config_error(member):
+                continue  # 잘못된 구성원은 제외 (경고는 설정 로드 시 남김)
+            if not member.get("enabled", True):
+                continue
+            members.append((member_status_key(base, member.get("name")), dict(primary, **member)))
+        return cls(members, group.get("mode", DEFAULT_GROUP_MODE))
+
+    @property
+    def is_grouped(self) -> bool:
+        return len(self.members) > 1
+
+    @staticmethod
+    def is_healthy(status_key: str) -> bool:
+        """상태 모니터 기준 출력 가능 여부 (모니터가 동작하지 않거나 아직 조회 전이면 가능으로 간주)"""
+        monitor = get_status_monitor()
+        if not monitor.is_running():
+            return True
+        status = monitor.get_status(status_key)
+        return status is None or status.is_ready
+
+    def _split_by_health(self) -> Tuple[List[GroupMember], List[GroupMember]]:
+        healthy, unhealthy = [], []
+        for member in self.members:
+            (healthy if self.is_healthy(member[0]) else unhealthy).append(member)
+        return healthy, unhealthy
+
+    def _rotate(self, members: List[GroupMember]) -> List[GroupMember]:
+        with self._lock:
+            start = next(self._turn) % len(members)
+        return members[start:] + members[:start]
+
+    def candidates(self) -> List[GroupMember]:
+        """출력을 시도할 순서 (정상 프린터 먼저, 모두 비정상이어도 마지막 수단으로 시도)"""
+        healthy, unhealthy = self._split_by_health()
+        if self.mode == "load_share" and len(healthy) > 1:
+            healthy = self._rotate(healthy)
+        return healthy + unhealthy
+
+    def partition(self, count: int) -> List[Tuple[GroupMember, List[int]]]:
+        """주문 count개를 구성원별로 나눕니다. (load_share 모드에서 정상 프린터끼리 번갈아 배정)"""
+        healthy, unhealthy = self._split_by_health()
+        if self.mode != "load_share" or len(healthy) < 2 or count < 2:
+            return [((healthy + unhealthy)[0], list(range(count)))]
+        healthy = self._rotate(healthy)[:count]
+        # 오래된 주문부터 각 프린터에 번갈아 배정하여 앞선 주문이 먼저 나오도록 함
+        return [(member, list(range(offset, count, len(healthy)))) for offset, member in enumerate(healthy)]
+
+    def run_batch(self, count: int, print_batch: Callable[[GroupMember, List[int]], List[bool]]) -> List[bool]:
+        """
+        주문 count개를 그룹으로 출력합니다. 구성원별 출력은 동시에 실행하고,
+        실패한 주문은 아직 시도하지 않은 다른 구성원으로 다시 출력합니다.
+
+        Args:
+            count: 주문 수
+            print_batch: (구성원, 주문 인덱스 목록) -> 인덱스별 성공 여부
+
+        Returns:
+            List[bool]: 주문별 성공 여부
+        """
+        results = [False] * count
+        tried: Dict[int, set] = {index: set() for index in range(count)}
+
+        def run(member: GroupMember, indexes: List[int]) -> List[bool]:
+            try:
+                return print_batch(member, indexes)
+            except Exception as e:
+                logger.error(f"프린터 그룹 출력 오류 [{member[0]}]: {e}")
+                return [False] * len(indexes)
+
+        def record(member: GroupMember, indexes: List[int], outcomes: List[bool]) -> None:
+            for index, success in zip(indexes, outcomes):
+                tried[index].add(member[0])
+                results[index] = results[index] or success
+
+        partitions = self.partition(count)
+        if len(partitions) == 1:
+            member, indexes = partitions[0]
+            record(member, indexes, run(member, indexes))
+        else:
+            executor = _get_group_executor()
+            futures = [(member, indexes, executor.submit(run, member, indexes)) for member, indexes in partitions]
+            for member, indexes, future in futures:
+                record(member, indexes, future.result())
+
+        # 실패한 주문은 시도하지 않은 구성원으로 장애 조치
+        for member in self.candidates():
+            failed = [index for index in range(count) if not results[index] and member[0] not in tried[index]]
+            if not failed:
+                continue
+            logger.warning(f"프린터 장애 조치: 주문 {len(failed)}건을 [{member[0]}](으)로 다시 출력")
+            record(member, failed, run(member, failed))
+        return results
+
+
+# 그룹 구성원 동시 출력용 공유 스레드 풀
+_group_executor: Optional[ThreadPoolExecutor] = None
+
+
+def _get_group_executor() -> ThreadPoolExecutor:
+    global _group_executor
+    if _group_executor is None:
+        _group_executor = ThreadPoolExecutor(max_workers=MAX_GROUP_WORKERS, thread_name_prefix="PrinterGroup")
+    return _group_executor
@@ -0,0 +1,357 @@
+# -*- coding: utf-8 -*-
+"""출력된 영수증 보관소 (백그라운드 기록, 압축 세그먼트 저널).
+
+출력 경로는 렌더링된 영수증을 큐에 넣기만 하고, 백그라운드 스레드가 세그먼트 파일에
+zlib 압축 레코드로 순서대로 추가 기록합니다. 세그먼트마다 주문 ID별 오프셋을 담은
+색인 파일(.idx)을 함께 기록하므로, 시작 시 세그먼트 본문을 다시 읽지 않고 색인만 불러옵니다.
+조회는 세그먼트를 메모리 맵으로 열어 색인의 오프셋에서 바로 읽습니다. (디렉터리 탐색 없음)
+세그먼트가 정해진 크기를 넘으면 새 세그먼트로 교체하고, 보관 개수를 넘는 오래된 세그먼트는 삭제합니다.
+
+레코드 형식 (.dat, 리틀 엔디언):
+    [압축 길이 u32][원본 길이 u32][주문 ID 길이 u16][종류 길이 u16][기록 시각 f64][주문 ID][종류][zlib 데이터]
+색인 형식 (.idx):
+    [레코드 오프셋 u32][레코드 길이 u32][주문 ID 길이 u16][종류 길이 u16][주문 ID][종류]
+"""
+import logging
+import mmap
+import os
+import struct
+import threading
+import time
+import zlib
+from pathlib import Path
+from queue import Empty, Queue
+from typing import Dict, List, NamedTuple, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+ARCHIVE_DIR = Path(os.getenv("RECEIPT_ARCHIVE_PATH", "receipt_archive"))
+SEGMENT_PREFIX = "receipts_"
+SEGMENT_SUFFIX = ".dat"
+INDEX_SUFFIX = ".idx"
+MAX_SEGMENT_BYTES = 8 * 1024 * 1024  # 세그먼트 교체 크기
+MAX_SEGMENTS = 50                    # 보관할 세그먼트 수 (약 400MB)
+MAX_PENDING = 1000                   # 기록 대기 큐 최대 길이
+COMPRESS_LEVEL = 6
+
+_RECORD_HEADER = struct.Struct("<IIHHd")
+_INDEX_ENTRY = struct.Struct("<IIHH")
+
+
+class ArchivedReceipt(NamedTuple):
+    """보관된 영수증 레코드"""
+    order_id: str
+    kind: str
+    archived_at: float
+    data: bytes
+
+
+class _Location(NamedTuple):
+    segment: int
+    offset: int
+    length: int
+
+
+class ReceiptArchive:
+    """세그먼트 파일 기반 영수증 보관소"""
+
+    def __init__(self, directory: Path = ARCHIVE_DIR, max_segment_bytes: int = MAX_SEGMENT_BYTES,
+                 max_segments: int = MAX_SEGMENTS) -> None:
+        self.directory = Path(directory)
+        self.max_segment_bytes = max_segment_bytes
+        self.max_segments = max_segments
+        self._index: Dict[Tuple[str, str], _Location] = {}
+        self._latest: Optional[Tuple[str, str]] = None
+        self._lock = threading.Lock()
+        self._queue: Queue = Queue(maxsize=MAX_PENDING)
+        self.shutdown_event = threading.Event()
+
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self._segments = self._list_segments()
+        for segment in self._segments:
+            self._scan_segment(segment)
+        self._segment = self._segments[-1] if self._segments else 1
+        self._file = None
+        self._index_file = None
+        self._maps: Dict[int, mmap.mmap] = {}
+
+        self.worker_thread = threading.Thread(target=self._archive_worker, name="ReceiptArchive", daemon=True)
+        self.worker_thread.start()
+
+    # ------------------------------------------------------------------
+    # 세그먼트 파일
+    def _segment_path(self, segment: int) -> Path:
+        return self.directory / f"{SEGMENT_PREFIX}{segment:06d}{SEGMENT_SUFFIX}"
+
+    def _index_path(self, segment: int) -> Path:
+        return self._segment_path(segment).with_suffix(INDEX_SUFFIX)
+
+    def _list_segments(self) -> List[int]:
+        segments = []
+        for path in self.directory.glob(f"{SEGMENT_PREFIX}*{SEGMENT_SUFFIX}"):
+            try:
+                segments.append(int(path.stem[len(SEGMENT_PREFIX):]))
+            except ValueError:
+                continue
+        return sorted(segments)
+
+    def _scan_segment(self, segment: int) -> None:
+        """시작 시 세그먼트의 색인 파일을 불러옵니다. (색인이 없거나 손상되면 본문에서 재구성)"""
+        try:
+            data_size = self._segment_path(segment).stat().st_size
+            entries = self._load_index(segment, data_size)
+            if entries is None:
+                entries = self._rebuild_index(segment)
+            for key, location in entries:
+                self._index[key] = location
+                self._latest = key
+        except Exception as e:
+            logger.error(f"영수증 보관 세그먼트 읽기 실패 ({segment:06d}): {e}")
+
+    def _load_index(self, segment: int, data_size: int) -> Optional[List[Tuple[Tuple[str, str], _Location]]]:
+        path = self._index_path(segment)
+        if not path.exists():
+            return None
+        raw = path.read_bytes()
+        entries = []
+        pos = 0
+        end = 0
+        while pos + _INDEX_ENTRY.size <= len(raw):
+            offset, length, id_len, kind_len = _INDEX_ENTRY.unpack_from(raw, pos)
+            pos += _INDEX_ENTRY.size
+            if pos + id_len + kind_len > len(raw) or offset + length > data_size:
+                break  # 기록 중 종료된 마지막 항목
+            key = (raw[pos:pos + id_len].decode("utf-8"), raw[pos + id_len:pos + id_len + kind_len].decode("utf-8"))
+            pos += id_len + kind_len
+            entries.append((key, _Location(segment, offset, length)))
+            end = offset + length
+        if end < data_size:
+            return None  # 색인에 빠진 레코드가 있으면 본문에서 재구성
+        return entries
+
+    def _rebuild_index(self, segment: int) -> List[Tuple[Tuple[str, str], _Location]]:
+        """세그먼트 본문을 순서대로 읽어 색인 파일을 다시 만듭니다."""
+        entries = []
+        path = self._segment_path(segment)
+        with open(path, "rb") as f:
+            data_size = os.fstat(f.fileno()).st_size
+            offset = 0
+            while offset + _RECORD_HEADER.size <= data_size:
+                compressed_len, _, id_len, kind_len, _ = _RECORD_HEADER.unpack(f.read(_RECORD_HEADER.size))
+                length = _RECORD_HEADER.size + id_len + kind_len + compressed_len
+                if offset + length > data_size:
+                    break  # 기록 중 종료된 마지막 레코드
+                keys = f.read(id_len + kind_len)
+                f.seek(compressed_len, os.SEEK_CUR)
+                key = (keys[:id_len].decode("utf-8"), keys[id_len:].decode("utf-8"))
+                entries.append((key, _Location(segment, offset, length)))
+                offset += length
+
+        with open(self._index_path(segment), "wb") as f:
+            for key, location in entries:
+                f.write(self._index_entry(key, location))
+        logger.info(f"영수증 보관 색인 재구성: {path.name} ({len(entries)}건)")
+        return entries
+
+    @staticmethod
+    def _index_entry(key: Tuple[str, str], location: _Location) -> bytes:
+        id_bytes = key[0].encode("utf-8")
+        kind_bytes = key[1].encode("utf-8")
+        return _INDEX_ENTRY.pack(location.offset, location.length, len(id_bytes), len(kind_bytes)) + id_bytes + kind_bytes
+
+    def _open_segment(self):
+        if self._file is None:
+            self._file = open(self._segment_path(self._segment), "ab")
+            self._index_file = open(self._index_path(self._segment), "ab")
+            if self._segment not in self._segments:
+                self._segments.append(self._segment)
+        return self._file
+
+    def _close_segment(self) -> None:
+        for f in (self._file, self._index_file):
+            if f is not None:
+                f.close()
+        self._file = None
+        self._index_file = None
+
+    def _rotate(self) -> None:
+        """새 세그먼트로 교체하고 보관 개수를 넘는 세그먼트를 삭제합니다."""
+        self._close_segment()
+        self._segment += 1
+        self._open_segment()
+
+        while len(self._segments) > self.max_segments:
+            oldest = self._segments.pop(0)
+            with self._lock:
+                for key in [k for k, loc in self._index.items() if loc.segment == oldest]:
+                    del self._index[key]
+                # 메모리 맵이 열려 있으면 (윈도우에서) 파일을 삭제할 수 없음
+                segment_map = self._maps.pop(oldest, None)
+            if segment_map is not None:
+                try:
+                    segment_map.close()
+                except BufferError:
+                    pass  # 읽는 중인 맵은 참조가 사라질 때 닫힘
+            for path in (self._segment_path(oldest), self._index_path(oldest)):
+                try:
+                    path.unlink()
+                except FileNotFoundError:
+                    pass
+                except OSError as e:
+                    logger.warning(f"오래된 영수증 세그먼트 삭제 실패: {e}")
+
+    def _append(self, order_id: str, kind: str, archived_at: float, data: bytes) -> None:
+        id_bytes = order_id.encode("utf-8")
+        kind_bytes = kind.encode("utf-8")
+        compressed = zlib.compress(data, COMPRESS_LEVEL)
+        record = (_RECORD_HEADER.pack(len(compressed), len(data), len(id_bytes), len(kind_bytes), archived_at)
+                  + id_bytes + kind_bytes + compressed)
+
+        f = self._open_segment()
+        offset = f.tell()
+        if offset and offset + len(record) > self.max_segment_bytes:
+            self._rotate()
+            f = self._file
+            offset = 0
+        f.write(record)
+        f.flush()
+
+        # 본문을 먼저 기록한 뒤 색인 항목 추가 (색인이 가리키는 레코드는 항상 완전함)
+        key = (order_id, kind)
+        location = _Location(self._segment, offset, len(record))
+        self._index_file.write(self._index_entry(key, location))
+        self._index_file.flush()
+
+        with self._lock:
+            self._index[key] = location
+            self._latest = key
+
+    # ------------------------------------------------------------------
+    # 백그라운드 기록
+    def _archive_worker(self) -> None:
+        while not (self.shutdown_event.is_set() and self._queue.empty()):
+            try:
+                order_id, kind, archived_at, data = self._queue.get(timeout=0.5)
+            except Empty:
+                continue
+            try:
+                self._append(order_id, kind, archived_at, data)
+            except Exception as e:
+                logger.error(f"영수증 보관 기록 실패 (주문 {order_id}): {e}")
+            finally:
+                self._queue.task_done()
+        self._close_segment()
+
+    def submit(self, order_id, kind: str, data: bytes) -> bool:
+        """영수증 기록을 요청합니다. (출력 경로를 막지 않음)
+
+        Returns:
+            bool: 큐에 추가되었는지 여부 (종료 중이거나 큐가 가득 차면 False)
+        """
+        if self.shutdown_event.is_set():
+            return False
+        try:
+            self._queue.put_nowait((str(order_id), kind, time.time(), data))
+            return True
+        except Exception:
+            logger.warning(f"영수증 보관 큐가 가득 차 기록을 건너뜁니다: 주문 {order_id}")
+            return False
+
+    def flush(self, timeout: float = 5.0) -> None:
+        """대기 중인 기록이 끝날 때까지 기다립니다."""
+        deadline = time.time() + timeout
+        while self._queue.unfinished_tasks and time.time() < deadline:
+            time.sleep(0.01)
+
+    def shutdown(self) -> None:
+        """대기 중인 기록을 마치고 기록 스레드를 종료합니다."""
+        self.shutdown_event.set()
+        if self.worker_thread.is_alive():
+            self.worker_thread.join(timeout=5.0)
+        with self._lock:
+            self._maps.clear()
+
+    # ------------------------------------------------------------------
+    # 조회
+    def _segment_map(self, location: _Location) -> mmap.mmap:
+        """레코드를 포함하는 세그먼트의 읽기 전용 메모리 맵 (기록 중인 세그먼트가 커지면 다시 매핑)"""
+        with self._lock:
+            segment_map = self._maps.get(location.segment)
+            if segment_map is None or len(segment_map) < location.offset + location.length:
+                # 이전 맵은 읽는 중인 스레드가 있을 수 있으므로 참조가 사라질 때 닫힘
+                with open(self._segment_path(location.segment), "rb") as f:
+                    segment_map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+                self._maps[location.segment] = segment_map
+            return segment_map
+
+    def _read(self, location: _Location) -> Optional[ArchivedReceipt]:
+        end = location.offset + location.length
+        with memoryview(self._segment_map(location)) as view, view[location.offset:end] as record:
+            compressed_len, raw_len, id_len, kind_len, archived_at = _RECORD_HEADER.unpack_from(record)
+            start = _RECORD_HEADER.size
+            order_id = str(record[start:start + id_len], "utf-8")
+            kind = str(record[start + id_len:start + id_len + kind_len], "utf-8")
+            # 메모리 맵에서 복사 없이 바로 압축 해제
+            data = zlib.decompress(record[start + id_len + kind_len:])
+        if len(data) != raw_len:
+            raise ValueError(f"압축 해제 길이 불일치 ({len(data)} != {raw_len})")
+        return ArchivedReceipt(order_id, kind, archived_at, data)
+
+    def get(self, order_id, kind: str = "customer") -> Optional[ArchivedReceipt]:
+        """주문 ID로 마지막으로 보관된 영수증을 읽습니다."""
+        with self._lock:
+            location = self._index.get((str(order_id), kind))
+        if location is None:
+            return None
+        try:
+            return self._read(location)
+        except Exception as e:
+            logger.error(f"보관된 영수증 읽기 실패 (주문 {order_id}): {e}")
+            return None
+
+    def latest(self) -> Optional[ArchivedReceipt]:
+        """가장 최근에 보관된 영수증을 읽습니다."""
+        with self._lock:
+            key = self._latest
+        return self.get(*key) if key else None
+
+    def kinds(self, order_id) -> List[str]:
+        """주문 ID로 보관된 영수증 종류 목록 (예: "customer", "kitchen:음료")"""
+        order_id = str(order_id)
+        with self._lock:
+            return sorted(kind for oid, kind in self._index if oid == order_id)
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+
+# 글로벌 영수증 보관소 인스턴스
+_receipt_archive: Optional[ReceiptArchive] = None
+_archive_guard = threading.Lock()
+
+
+def get_receipt_archive() -> ReceiptArchive:
+    """글로벌 영수증 보관소 인스턴스 반환 (없으면 생성)"""
+    global _receipt_archive
+    with _archive_guard:
+        if _receipt_archive is None:
+            _receipt_archive = ReceiptArchive()
+        return _receipt_archive
+
+
+def archive_receipt(order_id, kind: str, data: bytes) -> bool:
+    """렌더링된 영수증을 백그라운드로 보관합니다. 보관 실패가 출력에 영향을 주지 않습니다."""
+    try:
+        return get_receipt_archive().submit(order_id, kind, data)
+    except Exception as e:
+        logger.error(f"영수증 보관 요청 실패 (주문 {order_id}): {e}")
+        return False
+
+
+def shutdown_receipt_archive() -> None:
+    """글로벌 영수증 보관소 안전 종료 (대기 중인 기록 완료)"""
+    global _receipt_archive
+    with _archive_guard:
+        if _receipt_archive:
+            _receipt_archive.shutdown()
+            _receipt_archive = None
@@ -1,10 +1,27 @@
 # -*- coding: utf-8 -*-
 """Common receipt printing utilities."""
-from typing import Any, Dict
+from typing import Any, Dict, Optional
 from datetime import datetime
+from functools import partial
 
-def format_receipt_string(order: Dict[str, Any]) -> str:
-    lines = []
+from src.printer.escpos_renderer import ALIGN_CENTER, DEFAULT_COLUMNS, ReceiptDocument, render_document, render_text
+from src.printer.render_cache import RenderedReceipt, get_render_cache
+from src.printer.signature_raster import signature_raster_command
+
+
+def build_receipt_document(order: Dict[str, Any], logo_key: Optional[str] = None,
+                           order_barcode: bool = False, pickup_qr_url: Optional[str] = None,
+                           print_footer: bool = True) -> ReceiptDocument:
+    """손님용 영수증 문서를 구성합니다.
+
+    Args:
+        order: 주문 데이터
+        logo_key: 프린터에 저장된 로고의 키 코드 (있으면 헤더에 출력)
+        order_barcode: 주문번호 바코드 출력 여부
+        pickup_qr_url: 픽업 QR 코드 URL 형식 (예: "https://example.com/pickup/{order_id}")
+        print_footer: 출력시간/용지 자르기 꼬리말 포함 여부 (캐시용 본문은 False)
+    """
+    doc = ReceiptDocument()
 
     # 기본값 일관성 유지
     company_name = order.get('company_name', '')
@@ -13,17 +30,19 @@ def format_receipt_string(order: Dict[str, Any]) -> str:
     is_dine_in = order.get('is_dine_in', True)
 
     # Header
-    lines.append("*** 손님 영수증 ***")
-    lines.append(company_name)
-    lines.append("")  # 빈 줄
+    if logo_key:
+        doc.graphic(logo_key)
+    doc.text("*** 손님 영수증 ***", align=ALIGN_CENTER)
+    doc.text(company_name, align=ALIGN_CENTER)
+    doc.feed()
 
     # Order info
-    lines.append(f"주문번호: {order_id}")
-    lines.append(f"주문일시: {created_at}")
-    lines.append(f"주문유형:  {'매장 식사' if is_dine_in else '포장'}")
-    lines.append("")  # 빈 줄
+    doc.text(f"주문번호: {order_id}", align=ALIGN_CENTER, width=2, height=2)
+    doc.text(f"주문일시: {created_at}")
+    doc.text(f"주문유형:  {'매장 식사' if is_dine_in else '포장'}")
+    doc.feed()
 
-    lines.append("-" * 45)
+    doc.separator()
 
     total = 0
     for item in order.get("items", []):
@@ -37,24 +56,74 @@ def format_receipt_string(order: Dict[str, Any]) -> str:
         item_total = qty * price_per_item
         total += item_total
 
-        lines.append(f"{name}")
+        doc.text(f"{name}")
         for opt in item.get("options", []):
             opt_line = f"- {opt['name']}"
             if opt.get("price", 0) > 0:
                 opt_line += f" (+{opt['price']:,}원)"
-            lines.append(opt_line)
-        lines.append(f"수량: {qty}개 x {price_per_item:,}원 = {item_total:,}원")
-        lines.append("")  # 아이템 간 빈 줄
+            doc.text(opt_line)
+        doc.columns(f"수량: {qty}개 x {price_per_item:,}원", f"{item_total:,}원")
+        doc.feed()  # 아이템 간 빈 줄
+
+    doc.separator()
+    doc.columns("소계:", f"{total:,}원")
+    doc.columns("총 금액:", f"{total:,}원", bold=True)
+    doc.feed()
+
+    # 서명 (래스터 변환 결과는 주문별로 캐시됨)
+    signature = signature_raster_command(order.get("signature_data"))
+    if signature:
+        doc.text("서명:")
+        doc.raster(signature, text="(서명 이미지)")
+        doc.feed()
+
+    # 주문번호 바코드 / 픽업 QR (프린터 내장 심볼 생성)
+    if order_barcode and str(order_id).isascii():
+        doc.barcode(str(order_id))
+        doc.feed()
+    if pickup_qr_url:
+        doc.qrcode(pickup_qr_url.format(order_id=order_id))
+        doc.feed()
+
+    doc.text("감사합니다!", align=ALIGN_CENTER)
+    doc.feed()
 
-    lines.append("-" * 32)
-    lines.append(f"소계: {total:,}원")
-    lines.append(f"총 금액: {total:,}원")
-    lines.append("")  # 빈 줄
-    lines.append("감사합니다!")
-    lines.append("")  # 빈 줄
+    if print_footer:
+        add_print_footer(doc)
+    return doc
 
+
+def add_print_footer(doc: ReceiptDocument) -> ReceiptDocument:
+    """출력할 때마다 달라지는 꼬리말(출력시간)과 용지 자르기를 추가합니다."""
     current_time = datetime.now()
-    lines.append(f"출력시간: {current_time.strftime('%Y-%m-%d %H:%M:%S')}")
-    lines.append("")  # 마지막 빈 줄
+    doc.text(f"출력시간: {current_time.strftime('%Y-%m-%d %H:%M:%S')}")
+
+    # 용지 자르기 전 여백 확보
+    doc.feed(3)
+    doc.cut()
+    return doc
+
+
+def format_receipt_string(order: Dict[str, Any]) -> str:
+    """손님용 영수증을 일반 텍스트로 반환합니다."""
+    return render_text(build_receipt_document(order))
+
+
+def render_customer_receipt(order: Dict[str, Any], codepage: Optional[int] = None,
+                            columns: int = DEFAULT_COLUMNS, logo_key: Optional[str] = None,
+                            order_barcode: bool = False, pickup_qr_url: Optional[str] = None) -> RenderedReceipt:
+    """손님용 영수증을 렌더링합니다.
+
+    같은 주문의 재출력은 캐시된 본문을 사용하고, 출력시간 꼬리말은 출력할 때마다 새로 붙입니다.
+    """
+    variant = (logo_key, order_barcode, pickup_qr_url)
+    build = partial(build_receipt_document, logo_key=logo_key, order_barcode=order_barcode,
+                    pickup_qr_url=pickup_qr_url, print_footer=False)
+    body = get_render_cache().render("customer", order, build, columns=columns, codepage=codepage, variant=variant)
 
-    return "\n".join(lines)
+    # 꼬리말은 초기화 명령부터 다시 시작하므로 본문 마지막의 정렬/글자 모드와 무관하게 출력됨
+    footer = add_print_footer(ReceiptDocument())
+    return RenderedReceipt(
+        body.data + render_document(footer, columns=columns, codepage=codepage),
+        body.text + "\n" + render_text(footer, columns=columns),
+    )
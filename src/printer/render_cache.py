@@ -0,0 +1,113 @@
+# -*- coding: utf-8 -*-
+"""렌더링된 영수증 바이트 캐시.
+
+같은 주문을 재출력하거나 여러 출력 경로(USB, 파일 백업 등)로 보낼 때
+템플릿 구성과 인코딩을 반복하지 않도록 렌더링 결과를 LRU 방식으로 보관합니다.
+"""
+import hashlib
+import json
+import logging
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from src.printer.escpos_renderer import DEFAULT_COLUMNS, ReceiptDocument, render_document, render_text
+
+logger = logging.getLogger(__name__)
+
+# 영수증 템플릿 구성이 바뀌면 값을 올려 이전 캐시 항목을 무효화합니다.
+TEMPLATE_VERSION = 1
+
+
+class RenderedReceipt:
+    """한 번 렌더링된 영수증 (프린터 전송용 바이트 + 미리보기/디버그용 텍스트)"""
+    __slots__ = ("data", "text")
+
+    def __init__(self, data: bytes, text: str):
+        self.data = data
+        self.text = text
+
+
+def order_content_hash(order: Dict[str, Any]) -> str:
+    """주문 내용이 바뀌었는지 판단하기 위한 해시를 반환합니다."""
+    payload = json.dumps(order, sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.sha1(payload.encode("utf-8")).hexdigest()
+
+
+class RenderCache:
+    """(주문 ID, 주문 내용 해시, 템플릿 버전, 프린터 프로필) 키의 LRU 캐시"""
+
+    def __init__(self, max_entries: int = 256) -> None:
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[Tuple, RenderedReceipt]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def render(self, kind: str, order: Dict[str, Any], build: Callable[[Dict[str, Any]], ReceiptDocument],
+               columns: int = DEFAULT_COLUMNS, codepage: Optional[int] = None,
+               variant: Any = None) -> RenderedReceipt:
+        """캐시된 렌더링 결과를 반환하고, 없으면 렌더링하여 저장합니다.
+
+        Args:
+            kind: 영수증 종류 (예: "customer", "kitchen")
+            order: 주문 데이터
+            build: 주문 데이터로 영수증 문서를 구성하는 함수
+            columns: 프린터 한 줄 문자 수
+            codepage: 프린터 코드페이지
+            variant: 같은 주문이라도 출력 내용을 바꾸는 추가 옵션 (예: 로고 키 코드)
+
+        Returns:
+            RenderedReceipt: 렌더링된 영수증
+        """
+        key = (
+            kind,
+            str(order.get("order_id", "")),
+            order_content_hash(order),
+            TEMPLATE_VERSION,
+            (columns, codepage, variant),
+        )
+        with self._lock:
+            cached = self._entries.get(key)
+            if cached is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return cached
+            self.misses += 1
+
+        # 렌더링은 잠금 밖에서 수행
+        document = build(order)
+        rendered = RenderedReceipt(
+            render_document(document, columns=columns, codepage=codepage),
+            render_text(document, columns=columns),
+        )
+
+        with self._lock:
+            self._entries[key] = rendered
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        logger.debug(f"영수증 렌더링 캐시 저장: {kind} 주문 {key[1]} ({len(rendered.data)} bytes)")
+        return rendered
+
+    def invalidate(self, order_id: Any = None) -> None:
+        """특정 주문(또는 전체)의 캐시 항목을 제거합니다."""
+        with self._lock:
+            if order_id is None:
+                self._entries.clear()
+                return
+            order_id = str(order_id)
+            for key in [k for k in self._entries if k[1] == order_id]:
+                del self._entries[key]
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+# 글로벌 렌더링 캐시 인스턴스
+_render_cache = RenderCache()
+
+
+def get_render_cache() -> RenderCache:
+    """글로벌 렌더링 캐시 인스턴스 반환"""
+    return _render_cache
@@ -0,0 +1,97 @@
+# -*- coding: utf-8 -*-
+"""주문 서명 이미지를 ESC/POS 래스터(GS v 0) 명령으로 변환하는 모듈.
+
+서명 데이터(data:image/png;base64,...)를 디코딩하여 여백을 잘라내고 인쇄 폭에 맞게
+축소한 뒤 1비트 래스터로 변환합니다. 변환은 numpy 벡터 연산으로 처리하며,
+같은 서명(같은 주문)의 재출력은 캐시된 명령을 사용합니다.
+래스터는 전송 단위(USB 청크)를 넘지 않는 띠(band) 단위 명령으로 나누어 출력합니다.
+"""
+import base64
+import io
+import logging
+import struct
+from functools import lru_cache
+from typing import List, Optional
+
+from src.printer.printer_assets import dither_gray
+
+logger = logging.getLogger(__name__)
+
+SIGNATURE_WIDTH = 384       # 서명 최대 인쇄 폭 (dots, 58mm 용지 인쇄 영역)
+SIGNATURE_MAX_HEIGHT = 160  # 서명 최대 인쇄 높이 (dots)
+RASTER_BAND_BYTES = 4096    # GS v 0 명령 하나의 최대 크기 (USB 전송 단위)
+_INK_THRESHOLD = 200        # 이 값보다 어두운 픽셀을 서명 획으로 판단
+
+
+def decode_signature(signature_data: str) -> bytes:
+    """data URL 또는 base64 문자열에서 이미지 바이트를 추출합니다."""
+    if signature_data.startswith("data:"):
+        signature_data = signature_data.split(",", 1)[1]
+    return base64.b64decode(signature_data)
+
+
+def raster_commands(width: int, height: int, raster: bytes, band_bytes: int = RASTER_BAND_BYTES) -> List[bytes]:
+    """1비트 래스터를 전송 단위 이하의 GS v 0 명령 목록으로 나눕니다.
+
+    Args:
+        width: 가로 dots (8의 배수)
+        height: 세로 dots
+        raster: 행 우선 래스터 데이터
+        band_bytes: 명령 하나의 최대 바이트 수
+    """
+    row_bytes = width // 8
+    rows_per_band = max(1, (band_bytes - 8) // row_bytes)
+    commands = []
+    for top in range(0, height, rows_per_band):
+        rows = min(rows_per_band, height - top)
+        header = b'\x1d\x76\x30\x00' + struct.pack('<HH', row_bytes, rows)
+        commands.append(header + raster[top * row_bytes:(top + rows) * row_bytes])
+    return commands
+
+
+@lru_cache(maxsize=64)
+def _signature_raster(signature_data: str, max_width: int, max_height: int) -> Optional[bytes]:
+    # 서명 이미지가 있을 때만 필요한 모듈
+    import numpy as np
+    from PIL import Image
+
+    image = Image.open(io.BytesIO(decode_signature(signature_data)))
+    # 투명 배경(캔버스 서명)은 흰색으로 합성
+    rgba = image.convert("RGBA")
+    background = Image.new("RGBA", rgba.size, (255, 255, 255, 255))
+    background.alpha_composite(rgba)
+    pixels = np.asarray(background.convert("L"))
+
+    # 획이 있는 영역만 남기도록 여백 제거
+    ink = pixels < _INK_THRESHOLD
+    rows = np.flatnonzero(ink.any(axis=1))
+    cols = np.flatnonzero(ink.any(axis=0))
+    if rows.size == 0:
+        return None  # 빈 서명
+    pixels = pixels[rows[0]:rows[-1] + 1, cols[0]:cols[-1] + 1]
+
+    # 인쇄 영역에 맞게 축소 (확대는 하지 않음)
+    height, width = pixels.shape
+    scale = min(1.0, max_width / width, max_height / height)
+    if scale < 1.0:
+        size = (max(1, round(width * scale)), max(1, round(height * scale)))
+        pixels = np.asarray(Image.fromarray(pixels).resize(size, Image.LANCZOS))
+
+    raster_width, raster_height, raster = dither_gray(pixels)
+    return b"".join(raster_commands(raster_width, raster_height, raster))
+
+
+def signature_raster_command(signature_data: str, max_width: int = SIGNATURE_WIDTH,
+                             max_height: int = SIGNATURE_MAX_HEIGHT) -> Optional[bytes]:
+    """서명 데이터를 ESC/POS 래스터 명령으로 변환합니다. (결과는 캐시됨)
+
+    Returns:
+        Optional[bytes]: 래스터 명령 (서명이 비어 있거나 변환할 수 없으면 None)
+    """
+    if not signature_data:
+        return None
+    try:
+        return _signature_raster(signature_data, max_width, max_height)
+    except Exception as e:
+        logger.error(f"서명 이미지 변환 실패: {e}")
+        return None
@@ -0,0 +1,260 @@
+# -*- coding: utf-8 -*-
+"""ESC/POS 실시간 상태(DLE EOT) 기반 프린터 상태 모니터.
+
+백그라운드 스레드가 주기적으로 각 프린터의 상태를 조회하여 타임스탬프와 함께 보관합니다.
+주문 출력 전 상태 확인은 장치 조회 없이 메모리에서 읽기만 하며,
+상태가 바뀌면 등록된 리스너(UI 등)에 알립니다.
+"""
+import logging
+import threading
+import time
+from typing import Callable, Dict, List, Optional, Set
+
+logger = logging.getLogger(__name__)
+
+# DLE EOT n : 실시간 상태 전송 명령
+DLE_EOT_PRINTER = b'\x10\x04\x01'  # 프린터 상태
+DLE_EOT_OFFLINE = b'\x10\x04\x02'  # 오프라인 원인
+DLE_EOT_PAPER = b'\x10\x04\x04'    # 용지 센서 상태
+
+
+class PrinterStatus:
+    """프린터 상태 스냅샷"""
+    __slots__ = ("reachable", "online", "cover_open", "paper_out", "paper_near_end", "error", "message", "checked_at")
+
+    def __init__(self, reachable: bool = False, online: bool = False, cover_open: bool = False,
+                 paper_out: bool = False, paper_near_end: bool = False, error: bool = False,
+                 message: str = "", checked_at: Optional[float] = None):
+        self.reachable = reachable
+        self.online = online
+        self.cover_open = cover_open
+        self.paper_out = paper_out
+        self.paper_near_end = paper_near_end
+        self.error = error
+        self.message = message
+        self.checked_at = checked_at if checked_at is not None else time.time()
+
+    @property
+    def is_ready(self) -> bool:
+        """출력 가능한 상태인지 여부"""
+        return self.reachable and self.online and not (self.cover_open or self.paper_out or self.error)
+
+    def state_key(self) -> tuple:
+        """상태 변경 비교용 키 (조회 시각 제외)"""
+        return (self.reachable, self.online, self.cover_open, self.paper_out, self.paper_near_end, self.error)
+
+    def describe(self) -> str:
+        """UI 표시용 상태 설명"""
+        if self.message:
+            return self.message
+        if not self.reachable:
+            return "응답 없음"
+        if self.cover_open:
+            return "커버 열림"
+        if self.paper_out:
+            return "용지 없음"
+        if self.error:
+            return "프린터 오류"
+        if not self.online:
+            return "오프라인"
+        if self.paper_near_end:
+            return "용지 부족"
+        return "정상"
+
+    def __repr__(self) -> str:
+        return f"PrinterStatus({self.describe()}, ready={self.is_ready})"
+
+
+def _valid_status_byte(value: Optional[int]) -> bool:
+    # 실시간 상태 응답은 비트 1, 4가 항상 1이고 비트 0, 7이 항상 0
+    return value is not None and (value & 0x93) == 0x12
+
+
+def parse_realtime_status(printer: Optional[int], offline: Optional[int], paper: Optional[int]) -> PrinterStatus:
+    """DLE EOT 1/2/4 응답 바이트를 해석합니다. 응답이 없으면 None을 전달합니다."""
+    if not _valid_status_byte(printer):
+        return PrinterStatus(reachable=False)
+
+    status = PrinterStatus(reachable=True, online=not (printer & 0x08))
+    if _valid_status_byte(offline):
+        status.cover_open = bool(offline & 0x04)
+        status.paper_out = bool(offline & 0x20)
+        status.error = bool(offline & 0x40)
+    if _valid_status_byte(paper):
+        status.paper_near_end = bool(paper & 0x0C)
+        status.paper_out = status.paper_out or bool(paper & 0x60)
+    return status
+
+
+# 한 번이라도 DLE EOT에 응답한 장치 키 (이후 무응답은 전원 꺼짐/케이블 빠짐으로 판단)
+_status_capable_devices: Set[str] = set()
+_status_capable_guard = threading.Lock()
+
+
+def query_realtime_status(write: Callable[[bytes], None], read: Callable[[], Optional[int]],
+                          device_key: Optional[str] = None) -> PrinterStatus:
+    """열린 장치 세션에서 DLE EOT 1/2/4를 차례로 조회합니다.
+
+    세션은 열렸지만 첫 조회에 응답이 없으면 실시간 상태를 지원하지 않는 장치로 보고
+    출력 가능 상태로 처리합니다. 단, 이전에 응답한 적이 있는 장치(device_key 기준)가
+    응답하지 않으면 시리얼 포트처럼 장치 없이도 열리는 경우이므로 응답 없음으로 처리합니다.
+
+    Args:
+        write: 장치에 바이트를 쓰는 함수
+        read: 응답 1바이트를 읽는 함수 (응답이 없으면 None)
+        device_key: 응답 이력을 기억할 장치 키 (예: "com:COM3")
+    """
+    responses = []
+    for command in (DLE_EOT_PRINTER, DLE_EOT_OFFLINE, DLE_EOT_PAPER):
+        write(command)
+        value = read()
+        if value is None and command == DLE_EOT_PRINTER:
+            with _status_capable_guard:
+                answered_before = device_key in _status_capable_devices
+            if answered_before:
+                return PrinterStatus(reachable=False, message="응답 없음 (전원/케이블 확인)")
+            return PrinterStatus(reachable=True, online=True, message="정상 (실시간 상태 미지원)")
+        responses.append(value)
+
+    status = parse_realtime_status(*responses)
+    if status.reachable and device_key:
+        with _status_capable_guard:
+            _status_capable_devices.add(device_key)
+    return status
+
+
+# ----------------------------------------------------------------------
+# 장치 잠금: 출력 세션과 상태 조회가 같은 장치를 동시에 열지 않도록 합니다.
+_device_locks: Dict[str, threading.Lock] = {}
+_device_locks_guard = threading.Lock()
+
+
+def get_device_lock(device_key: str) -> threading.Lock:
+    """장치 키(예: "usb:0525:a700", "com:COM3")별 잠금 객체를 반환합니다."""
+    with _device_locks_guard:
+        lock = _device_locks.get(device_key)
+        if lock is None:
+            lock = _device_locks[device_key] = threading.Lock()
+        return lock
+
+
+class PrinterStatusMonitor:
+    """백그라운드에서 프린터 상태를 주기적으로 조회하고 캐시합니다."""
+
+    def __init__(self, interval: float = 5.0) -> None:
+        self.interval = interval
+        self._probes: Dict[str, Callable[[], Optional[PrinterStatus]]] = {}
+        self._statuses: Dict[str, PrinterStatus] = {}
+        self._listeners: List[Callable[[str, PrinterStatus], None]] = []
+        self._lock = threading.Lock()
+        self._wake_event = threading.Event()
+        self.shutdown_event = threading.Event()
+        self.worker_thread: Optional[threading.Thread] = None
+
+    def set_probes(self, probes: Dict[str, Callable[[], Optional[PrinterStatus]]]) -> None:
+        """프린터 이름별 상태 조회 함수를 설정합니다. (설정 변경 시 다시 호출)
+
+        조회 함수는 장치가 출력 중이어서 조회를 건너뛰면 None을 반환합니다.
+        """
+        with self._lock:
+            self._probes = dict(probes)
+            for name in list(self._statuses):
+                if name not in self._probes:
+                    del self._statuses[name]
+        self.poll_now()
+
+    def add_listener(self, callback: Callable[[str, PrinterStatus], None]) -> None:
+        """상태 변경 시 호출될 콜백을 등록합니다. 콜백은 모니터 스레드에서 호출됩니다."""
+        self._listeners.append(callback)
+
+    def remove_listener(self, callback: Callable[[str, PrinterStatus], None]) -> None:
+        if callback in self._listeners:
+            self._listeners.remove(callback)
+
+    def get_status(self, name: str) -> Optional[PrinterStatus]:
+        """마지막으로 조회된 상태를 반환합니다. (장치 조회 없음)"""
+        with self._lock:
+            return self._statuses.get(name)
+
+    def statuses(self) -> Dict[str, PrinterStatus]:
+        """마지막으로 조회된 모든 프린터 상태 (장치 조회 없음)"""
+        with self._lock:
+            return dict(self._statuses)
+
+    def is_running(self) -> bool:
+        return self.worker_thread is not None and self.worker_thread.is_alive()
+
+    def start(self) -> None:
+        """모니터 스레드를 시작합니다."""
+        if self.is_running():
+            return
+        self.shutdown_event.clear()
+        self.worker_thread = threading.Thread(target=self._monitor_worker, name="PrinterStatusMonitor", daemon=True)
+        self.worker_thread.start()
+        logger.info(f"프린터 상태 모니터 시작 (조회 주기: {self.interval}초)")
+
+    def stop(self) -> None:
+        """모니터 스레드를 안전하게 종료합니다."""
+        self.shutdown_event.set()
+        self._wake_event.set()
+        if self.worker_thread and self.worker_thread.is_alive():
+            self.worker_thread.join(timeout=2.0)
+
+    def poll_now(self) -> None:
+        """다음 주기를 기다리지 않고 즉시 조회하도록 요청합니다."""
+        self._wake_event.set()
+
+    def update_status(self, name: str, status: PrinterStatus) -> None:
+        """상태를 저장하고, 바뀐 경우 리스너에 알립니다."""
+        with self._lock:
+            previous = self._statuses.get(name)
+            self._statuses[name] = status
+        if previous is not None and previous.state_key() == status.state_key():
+            return
+
+        log = logger.info if status.is_ready else logger.warning
+        log(f"프린터 상태 변경 [{name}]: {status.describe()}")
+        for callback in list(self._listeners):
+            try:
+                callback(name, status)
+            except Exception as e:
+                logger.error(f"프린터 상태 리스너 오류: {e}")
+
+    def poll_once(self) -> None:
+        """등록된 모든 프린터의 상태를 한 번 조회합니다."""
+        with self._lock:
+            probes = list(self._probes.items())
+        for name, probe in probes:
+            try:
+                status = probe()
+            except Exception as e:
+                logger.debug(f"프린터 상태 조회 실패 [{name}]: {e}")
+                status = PrinterStatus(reachable=False, message=f"조회 실패: {e}")
+            if status is not None:
+                self.update_status(name, status)
+
+    def _monitor_worker(self) -> None:
+        while not self.shutdown_event.is_set():
+            self._wake_event.clear()
+            self.poll_once()
+            self._wake_event.wait(self.interval)
+
+
+# 글로벌 상태 모니터 인스턴스
+_status_monitor: Optional[PrinterStatusMonitor] = None
+
+
+def get_status_monitor() -> PrinterStatusMonitor:
+    """글로벌 프린터 상태 모니터 인스턴스 반환 (없으면 생성)"""
+    global _status_monitor
+    if _status_monitor is None:
+        _status_monitor = PrinterStatusMonitor()
+    return _status_monitor
+
+
+def shutdown_status_monitor() -> None:
+    """글로벌 프린터 상태 모니터 안전 종료"""
+    global _status_monitor
+    if _status_monitor:
+        _status_monitor.stop()
+        _status_monitor = None
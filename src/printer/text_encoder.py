@@ -0,0 +1,98 @@
+# -*- coding: utf-8 -*-
+"""영수증 텍스트 인코더 (문자 단위 대체 처리 + 세션 캐시).
+
+프린터 인코딩(CP949)으로 표현할 수 없는 문자가 있어도 영수증 전체를 다른 인코딩으로
+바꾸거나 출력을 실패시키지 않고, 해당 문자만 출력 가능한 대체 문자로 바꿉니다.
+메뉴/옵션 이름처럼 반복되는 문자열은 인코딩 결과를 캐시하여 다시 인코딩하지 않습니다.
+"""
+import codecs
+import logging
+import unicodedata
+from functools import lru_cache
+from typing import Dict
+
+logger = logging.getLogger(__name__)
+
+ERROR_HANDLER_NAME = "receipt_substitute"
+UNKNOWN_CHAR = "?"
+
+# 프린터 인코딩에 없는 문자의 대체 문자
+SUBSTITUTES = {
+    "\u2022": "·",    # 글머리 기호
+    "\u2013": "-",    # en dash
+    "\u2014": "―",    # em dash
+    "\u00a0": " ",    # 줄바꿈 없는 공백
+    "₩": "￦",         # 원화 기호 -> 전각 원화 기호
+    "¥": "￥",
+    "£": "￡",
+    "¢": "￠",
+    "©": "(C)",
+    "«": "《",
+    "»": "》",
+    "✓": "√",
+    "✔": "√",
+    "❤": "♥",
+}
+
+
+@lru_cache(maxsize=1024)
+def _substitute_char(char: str, encoding: str) -> str:
+    """인코딩할 수 없는 문자 하나의 대체 문자열을 결정합니다."""
+    candidates = []
+    if char in SUBSTITUTES:
+        candidates.append(SUBSTITUTES[char])
+    # 호환 분해 후 결합 문자 제거 (예: é -> e, ① 등 호환 문자 -> 기본 문자)
+    decomposed = "".join(
+        c for c in unicodedata.normalize("NFKD", char) if not unicodedata.combining(c)
+    )
+    if decomposed and decomposed != char:
+        candidates.append(decomposed)
+
+    for candidate in candidates:
+        try:
+            candidate.encode(encoding)
+            return candidate
+        except UnicodeEncodeError:
+            continue
+
+    logger.debug(f"대체 문자 없음: U+{ord(char):04X} -> '{UNKNOWN_CHAR}'")
+    return UNKNOWN_CHAR
+
+
+def _substitute_errors(error: UnicodeEncodeError):
+    """codecs 오류 핸들러: 실패한 문자만 대체 문자로 바꿉니다."""
+    if not isinstance(error, UnicodeEncodeError):
+        raise error
+    bad = error.object[error.start:error.end]
+    replacement = "".join(_substitute_char(char, error.encoding) for char in bad)
+    return replacement, error.end
+
+
+codecs.register_error(ERROR_HANDLER_NAME, _substitute_errors)
+
+
+class ReceiptEncoder:
+    """인코딩 결과를 세션 동안 캐시하는 영수증 텍스트 인코더"""
+
+    def __init__(self, encoding: str = "cp949", max_entries: int = 8192) -> None:
+        self.encoding = encoding
+        # 같은 문자열(메뉴명, 옵션명, 고정 문구)은 한 번만 인코딩
+        self.encode = lru_cache(maxsize=max_entries)(self._encode)
+
+    def _encode(self, text: str) -> bytes:
+        return text.encode(self.encoding, errors=ERROR_HANDLER_NAME)
+
+    def cache_info(self):
+        """인코딩 캐시 통계를 반환합니다."""
+        return self.encode.cache_info()
+
+
+_encoders: Dict[str, ReceiptEncoder] = {}
+
+
+def get_encoder(encoding: str = "cp949") -> ReceiptEncoder:
+    """인코딩별 공유 인코더 인스턴스를 반환합니다."""
+    encoder = _encoders.get(encoding)
+    if encoder is None:
+        encoder = _encoders.setdefault(encoding, ReceiptEncoder(encoding))
+    return encoder
@@ -0,0 +1,150 @@
+# -*- coding: utf-8 -*-
+"""영수증 텍스트 레이아웃 유틸리티 (한글 2칸 폭 고려).
+
+프린터는 CP949 2바이트 문자(한글, 한자, 전각 기호)를 2칸 폭으로 출력하므로
+`len()` 대신 미리 계산된 표시 폭 테이블로 정렬과 줄바꿈을 처리합니다.
+"""
+from functools import lru_cache
+from typing import List
+
+# 용지 폭별 한 줄 문자 수 (Font A, 기본 글자 크기 기준)
+PAPER_COLUMNS = {
+    "58mm": 32,
+    "80mm": 42,
+}
+DEFAULT_PAPER_WIDTH = "80mm"
+
+# East Asian Wide/Fullwidth 범위 (BMP)
+_WIDE_RANGES = (
+    (0x1100, 0x115F),  # 한글 자모 (초성)
+    (0x2E80, 0x303E),  # CJK 부수, 기호/구두점
+    (0x3041, 0x33FF),  # 히라가나, 가타카나, 한글 호환 자모, CJK 호환
+    (0x3400, 0x4DBF),  # CJK 확장 A
+    (0x4E00, 0x9FFF),  # CJK 통합 한자
+    (0xA000, 0xA4CF),  # 이 문자
+    (0xAC00, 0xD7A3),  # 한글 음절
+    (0xF900, 0xFAFF),  # CJK 호환 한자
+    (0xFE30, 0xFE4F),  # CJK 호환 형태
+    (0xFF00, 0xFF60),  # 전각 문자
+    (0xFFE0, 0xFFE6),  # 전각 기호
+)
+
+# 폭이 없는 결합 문자 범위
+_ZERO_RANGES = (
+    (0x0300, 0x036F),  # 결합 발음 구별 기호
+    (0x1160, 0x11FF),  # 한글 자모 (중성/종성)
+    (0x200B, 0x200F),  # 폭 없는 공백, 방향 표시
+    (0xFE00, 0xFE0F),  # 변형 선택자
+)
+
+
+def _build_width_table() -> bytes:
+    """BMP 전체에 대한 표시 폭 테이블을 생성합니다. (모듈 로드 시 1회)"""
+    table = bytearray(b"\x01") * 0x10000
+    for start, end in _WIDE_RANGES:
+        table[start:end + 1] = b"\x02" * (end - start + 1)
+    # KS X 1001 기호 영역(0xA1A1~0xAFFE)은 East Asian Ambiguous라도 프린터에서 2칸으로 출력됨
+    for lead in range(0xA1, 0xB0):
+        for trail in range(0xA1, 0xFF):
+            try:
+                char = bytes((lead, trail)).decode("cp949")
+            except UnicodeDecodeError:
+                continue
+            table[ord(char)] = 2
+    for start, end in _ZERO_RANGES:
+        table[start:end + 1] = b"\x00" * (end - start + 1)
+    # 제어 문자는 폭 없음
+    table[0x00:0x20] = b"\x00" * 0x20
+    table[0x7F] = 0
+    return bytes(table)
+
+
+_WIDTH_TABLE = _build_width_table()
+
+
+def char_width(char: str) -> int:
+    """문자 하나의 표시 폭을 반환합니다."""
+    code = ord(char)
+    if code < 0x10000:
+        return _WIDTH_TABLE[code]
+    return 2  # BMP 밖 문자(이모지, CJK 확장)는 2칸으로 처리
+
+
+@lru_cache(maxsize=4096)
+def _wide_text_width(text: str) -> int:
+    # 메뉴/옵션 이름처럼 반복되는 문자열은 캐시된 폭을 사용
+    try:
+        return sum(map(_WIDTH_TABLE.__getitem__, map(ord, text)))
+    except IndexError:
+        return sum(map(char_width, text))
+
+
+def display_width(text: str) -> int:
+    """문자열의 프린터 표시 폭을 반환합니다."""
+    if text.isascii():
+        return len(text)
+    return _wide_text_width(text)
+
+
+def get_paper_columns(paper_width: str) -> int:
+    """용지 폭 프로필("58mm"/"80mm")의 한 줄 문자 수를 반환합니다."""
+    return PAPER_COLUMNS.get(paper_width, PAPER_COLUMNS[DEFAULT_PAPER_WIDTH])
+
+
+def wrap_text(text: str, columns: int) -> List[str]:
+    """표시 폭 기준으로 문자열을 여러 줄로 나눕니다. 가능하면 공백에서 줄을 바꿉니다."""
+    if display_width(text) <= columns:
+        return [text]
+
+    lines = []
+    line_start = 0
+    width = 0
+    last_space = -1
+    i = 0
+    while i < len(text):
+        char = text[i]
+        w = char_width(char)
+        if width + w > columns and i > line_start:
+            # 줄의 뒷부분에 공백이 있으면 그 위치에서 줄바꿈
+            if last_space > line_start:
+                lines.append(text[line_start:last_space].rstrip())
+                line_start = last_space + 1
+            else:
+                lines.append(text[line_start:i])
+                line_start = i
+            width = display_width(text[line_start:i])
+            last_space = -1
+            continue
+        if char == " ":
+            last_space = i
+        width += w
+        i += 1
+    if line_start < len(text):
+        lines.append(text[line_start:])
+    return lines
+
+
+def pad_right(text: str, width: int) -> str:
+    """표시 폭 기준으로 오른쪽을 공백으로 채웁니다."""
+    return text + " " * max(0, width - display_width(text))
+
+
+def align_right(text: str, width: int) -> str:
+    """표시 폭 기준으로 오른쪽 정렬합니다."""
+    return " " * max(0, width - display_width(text)) + text
+
+
+def layout_columns(left: str, right: str, columns: int) -> List[str]:
+    """왼쪽 텍스트와 오른쪽 정렬 텍스트(가격 등)를 한 줄 또는 여러 줄로 배치합니다.
+
+    왼쪽 텍스트가 길면 줄바꿈하고, 마지막 줄에 오른쪽 텍스트가 들어갈 공간이
+    없으면 다음 줄에 오른쪽 정렬로 출력합니다.
+    """
+    right_width = display_width(right)
+    lines = wrap_text(left, columns)
+    last = lines[-1]
+    if display_width(last) + 1 + right_width <= columns:
+        lines[-1] = pad_right(last, columns - right_width) + right
+    else:
+        lines.append(align_right(right, columns))
+    return lines